@@ -11,6 +11,88 @@ try:
 except ImportError:
     from moviepy import VideoFileClip, ImageClip, CompositeVideoClip
 
+try:
+    from numba import njit, prange
+    NUMBA_AVAILABLE = True
+except ImportError:
+    NUMBA_AVAILABLE = False
+
+if NUMBA_AVAILABLE:
+    @njit(parallel=True, fastmath=True, cache=True)
+    def _chroma_kernel(frame, kr, kg, kb, alpha_lut, spill, out):
+        """Fused single-pass chroma key kernel: distance, alpha ramp and
+        spill suppression in one cache-resident loop over the frame.
+
+        Works in the integer domain: squared color distance fits in int32
+        (so LLVM can vectorize with wide integer lanes instead of float32),
+        and the soft alpha ramp comes from a precomputed uint8 LUT indexed
+        by squared distance.
+        """
+        height, width = frame.shape[0], frame.shape[1]
+
+        for y in prange(height):
+            for x in range(width):
+                r = np.int32(frame[y, x, 0])
+                g = np.int32(frame[y, x, 1])
+                b = np.int32(frame[y, x, 2])
+
+                # Squared color distance to the key color (max 3 * 255^2)
+                dr = r - kr
+                dg = g - kg
+                db = b - kb
+                d2 = dr * dr + dg * dg + db * db
+                alpha = alpha_lut[d2]
+
+                # Suppress key-color spill in semi-transparent edge pixels
+                if spill > 0.0 and alpha < 255:
+                    fade = spill * (1.0 - alpha * (1.0 / 255.0))
+                    if kg >= kr and kg >= kb:
+                        limit = r if r > b else b
+                        if g > limit:
+                            g = np.int32(g - (g - limit) * fade)
+                    elif kb >= kr:
+                        limit = r if r > g else g
+                        if b > limit:
+                            b = np.int32(b - (b - limit) * fade)
+                    else:
+                        limit = g if g > b else b
+                        if r > limit:
+                            r = np.int32(r - (r - limit) * fade)
+
+                out[y, x, 0] = np.uint8(r)
+                out[y, x, 1] = np.uint8(g)
+                out[y, x, 2] = np.uint8(b)
+                out[y, x, 3] = alpha
+
+    @njit(parallel=True, fastmath=True, cache=True)
+    def _rgb_to_rgba_kernel(src, alpha, out):
+        """Interleave an alpha plane into RGB in one parallel pass"""
+        height, width = src.shape[0], src.shape[1]
+        for y in prange(height):
+            for x in range(width):
+                out[y, x, 0] = src[y, x, 0]
+                out[y, x, 1] = src[y, x, 1]
+                out[y, x, 2] = src[y, x, 2]
+                out[y, x, 3] = alpha[y, x]
+
+def rgb_to_rgba(src: np.ndarray, alpha: np.ndarray,
+                out: Optional[np.ndarray] = None) -> np.ndarray:
+    """Expand an RGB frame plus alpha plane into RGBA in a single pass.
+
+    Writes into a preallocated destination instead of np.dstack, which
+    allocates a fresh HxWx4 array and copies through temporaries.
+    """
+    height, width = src.shape[:2]
+    if out is None or out.shape != (height, width, 4):
+        out = np.empty((height, width, 4), dtype=np.uint8)
+
+    if NUMBA_AVAILABLE:
+        _rgb_to_rgba_kernel(src, alpha, out)
+    else:
+        out[:, :, :3] = src
+        out[:, :, 3] = alpha
+    return out
+
 class ChromaKeyProcessor:
     """Class for chroma key (green screen) processing"""
     
@@ -19,7 +101,11 @@ class ChromaKeyProcessor:
         self.tolerance = 40           # Color tolerance for keying
         self.edge_softness = 5        # Edge softening radius
         self.spill_suppression = 0.5  # Spill suppression strength
-        
+        self._kernel_out = None       # Preallocated RGBA buffer reused by the numba kernel
+        self._rgba_out = None         # Preallocated RGBA buffer for the transparent composite
+        self._alpha_lut = None        # uint8 alpha ramp indexed by squared color distance
+        self._lut_params = None       # (tolerance, edge_softness) the LUT was built for
+
     def set_key_color(self, color: Tuple[int, int, int]):
         """Set the chroma key color (RGB)"""
         self.key_color = color
@@ -118,8 +204,45 @@ class ChromaKeyProcessor:
         result = (foreground * mask + background * (1.0 - mask)).astype(np.uint8)
         return result
     
+    def _get_alpha_lut(self) -> np.ndarray:
+        """Alpha ramp LUT over squared color distance, rebuilt on parameter change.
+
+        Precomputing the sqrt/ramp here keeps the per-pixel kernel in pure
+        integer arithmetic: one int32 squared distance plus a table lookup.
+        """
+        params = (self.tolerance, self.edge_softness)
+        if self._alpha_lut is None or self._lut_params != params:
+            # Scale edge softness (a blur radius in pixels) into color-distance units
+            softness = max(1.0, float(self.edge_softness) * 4.0)
+            inner = max(0.0, float(self.tolerance) - softness)
+
+            distance = np.sqrt(np.arange(3 * 255 * 255 + 1, dtype=np.float32))
+            alpha = np.clip((distance - inner) / softness, 0.0, 1.0)
+            self._alpha_lut = (alpha * 255.0).astype(np.uint8)
+            self._lut_params = params
+        return self._alpha_lut
+
+    def process_frame_fast(self, foreground_frame: np.ndarray) -> np.ndarray:
+        """Process a frame through the fused numba kernel (transparent background)"""
+        height, width = foreground_frame.shape[:2]
+        if self._kernel_out is None or self._kernel_out.shape[:2] != (height, width):
+            self._kernel_out = np.empty((height, width, 4), dtype=np.uint8)
+
+        _chroma_kernel(
+            foreground_frame,
+            np.int32(self.key_color[0]), np.int32(self.key_color[1]), np.int32(self.key_color[2]),
+            self._get_alpha_lut(), float(self.spill_suppression),
+            self._kernel_out
+        )
+        return self._kernel_out
+
     def process_frame(self, foreground_frame: np.ndarray, background_frame: np.ndarray = None) -> np.ndarray:
         """Process a single frame with chroma key"""
+        # Fast path: fused single-pass kernel avoids the HSV conversion and
+        # the intermediate HxWx3 temporaries of the NumPy pipeline
+        if NUMBA_AVAILABLE and background_frame is None:
+            return self.process_frame_fast(foreground_frame)
+
         # Create alpha mask
         mask = self.create_mask(foreground_frame)
         
@@ -135,7 +258,8 @@ class ChromaKeyProcessor:
                 alpha_channel = (mask * 255).astype(np.uint8)
             else:
                 alpha_channel = (mask[:, :, 0] * 255).astype(np.uint8)
-            result = np.dstack([processed_foreground, alpha_channel])
+            result = rgb_to_rgba(processed_foreground, alpha_channel, out=self._rgba_out)
+            self._rgba_out = result
         
         return result
     
@@ -207,13 +331,23 @@ class ChromaKeyManager:
         
         return self.processor.apply_to_clip(clip, background)
     
-    def preview_mask(self, clip: VideoFileClip, time: float = 0.0) -> np.ndarray:
-        """Preview the chroma key mask at a specific time"""
+    def preview_mask(self, clip: VideoFileClip, time: float = 0.0,
+                     out: Optional[np.ndarray] = None) -> np.ndarray:
+        """Preview the chroma key mask at a specific time.
+
+        Pass a preallocated uint8 `out` buffer to avoid reallocating the
+        full-frame mask on every call (e.g. while dragging a slider).
+        """
         frame = clip.get_frame(time)
         mask = self.processor.create_mask(frame)
-        
-        # Convert mask to viewable format (0-255)
-        return (mask[:, :, 0] * 255).astype(np.uint8)
+        if mask.ndim == 3:
+            mask = mask[:, :, 0]
+
+        # Convert mask to viewable format (0-255), writing in place
+        if out is None or out.shape != mask.shape:
+            out = np.empty(mask.shape, dtype=np.uint8)
+        np.multiply(mask, 255, out=out, casting='unsafe')
+        return out
     
     def get_available_presets(self) -> dict:
         """Get available chroma key presets"""
@@ -16,6 +16,20 @@ from plugins.transitions import TransitionsManager
 from .chroma_key import ChromaKeyManager
 from .text_system import TitleSystem
 
+def _export_io_kwargs() -> dict:
+    """Shared write_videofile tuning for both export paths
+
+    Points MoviePy's audio temp file at tmpfs when the platform has one,
+    so the audio render/re-read round-trip stays in RAM instead of
+    hitting the disk twice, and sizes the encoder thread count to the
+    machine instead of a hardcoded constant.
+    """
+    kwargs = {'threads': os.cpu_count() or 4}
+    if os.path.isdir('/dev/shm'):
+        kwargs['temp_audiofile'] = os.path.join(
+            '/dev/shm', f'pyed_temp_audio_{os.getpid()}.m4a')
+    return kwargs
+
 class VideoProcessor:
     def __init__(self):
         self.clips: List[VideoFileClip] = []
@@ -133,9 +147,9 @@ class VideoProcessor:
                     '-level', preset.level,
                     '-pix_fmt', preset.pixel_format
                 ],
-                threads=4,
                 verbose=True,
-                logger='bar'
+                logger='bar',
+                **_export_io_kwargs()
             )
             
             print(f"Video exported to: {output_path} with preset: {preset.name}")
@@ -316,7 +330,7 @@ class VideoProcessor:
             
         return self.export_presets_manager.estimate_file_size(preset, total_duration)
     
-    def export_video(self, output_path: str, codec: str = 'libx264', audio_bitrate: str = '256k', video_bitrate: str = '4000k') -> bool:
+    def export_video(self, output_path: str, codec: str = 'libx264', audio_bitrate: str = '256k', video_bitrate: str = '4000k', preset: str = 'veryfast') -> bool:
         """Export the final video (legacy method for backward compatibility)"""
         if not self.timeline_clips:
             print("No clips in timeline to export")
@@ -337,8 +351,10 @@ class VideoProcessor:
                 audio_codec='aac',
                 audio_bitrate=audio_bitrate,
                 bitrate=video_bitrate,
+                preset=preset,
                 verbose=True,
-                logger='bar'
+                logger='bar',
+                **_export_io_kwargs()
             )
             
             print(f"Video exported to: {output_path}")
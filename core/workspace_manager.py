@@ -72,11 +72,60 @@ class TrackData:
     height: int = 60
     volume: float = 1.0
 
+class ProjectMetaCache:
+    """Sidecar cache of parsed project-list metadata.
+
+    get_project_list opens and parses every workspace.json, but the
+    handful of fields it needs only change when the file does. They are
+    kept in one JSON file keyed by project id and validated against the
+    workspace file's mtime and size, so listing unchanged projects
+    costs a stat per project instead of a full JSON parse.
+    """
+
+    def __init__(self, cache_path: str = None):
+        self.cache_path = cache_path or os.path.join(
+            os.path.expanduser("~"), ".pyvideo_cache", "project_meta.json")
+        self._entries: Dict[str, Dict] = {}
+        self._dirty = False
+        try:
+            with open(self.cache_path, 'r', encoding='utf-8') as f:
+                self._entries = json.load(f)
+        except Exception:
+            self._entries = {}
+
+    def get(self, project_id: str, mtime_ns: int, size: int) -> Optional[Dict]:
+        """Return cached info for an unchanged workspace file, else None"""
+        entry = self._entries.get(project_id)
+        if (entry and entry.get("mtime_ns") == mtime_ns
+                and entry.get("size") == size):
+            return entry["info"]
+        return None
+
+    def put(self, project_id: str, mtime_ns: int, size: int, info: Dict):
+        """Record freshly parsed info for a workspace file"""
+        self._entries[project_id] = {
+            "mtime_ns": mtime_ns, "size": size, "info": info
+        }
+        self._dirty = True
+
+    def save(self):
+        """Write the cache back if anything changed"""
+        if not self._dirty:
+            return
+        try:
+            os.makedirs(os.path.dirname(self.cache_path), exist_ok=True)
+            with open(self.cache_path, 'w', encoding='utf-8') as f:
+                json.dump(self._entries, f)
+            self._dirty = False
+        except Exception as e:
+            print(f"Error saving project metadata cache: {e}")
+
 class WorkspaceManager:
     """Manages project workspaces - saving, loading, and organization"""
-    
+
     def __init__(self, projects_dir: str = None):
         self.projects_dir = projects_dir or os.path.join(os.path.expanduser("~"), "PyVideoEditor", "Projects")
+        self.meta_cache = ProjectMetaCache()
         self.ensure_projects_directory()
         
     def ensure_projects_directory(self):
@@ -184,37 +233,54 @@ class WorkspaceManager:
     def get_project_list(self) -> List[Dict]:
         """Get list of all projects with basic info"""
         projects = []
-        
+
         try:
-            for item in os.listdir(self.projects_dir):
-                project_dir = os.path.join(self.projects_dir, item)
-                if os.path.isdir(project_dir):
-                    workspace_file = os.path.join(project_dir, "workspace.json")
-                    if os.path.exists(workspace_file):
-                        try:
-                            with open(workspace_file, 'r', encoding='utf-8') as f:
-                                data = json.load(f)
-                                
-                            settings = data.get("settings", {})
-                            metadata = data.get("metadata", {})
-                            
-                            project_info = {
-                                "project_id": item,
-                                "name": settings.get("name", "Unnamed Project"),
-                                "description": settings.get("description", ""),
-                                "created_date": settings.get("created_date", ""),
-                                "modified_date": settings.get("modified_date", ""),
-                                "last_opened": metadata.get("last_opened", ""),
-                                "duration": settings.get("duration", 0.0),
-                                "clip_count": len(data.get("timeline_clips", [])),
-                                "asset_count": len(data.get("media_assets", {}))
-                            }
-                            
-                            projects.append(project_info)
-                            
-                        except Exception as e:
-                            print(f"Error reading project {item}: {e}")
-                            
+            for entry in os.scandir(self.projects_dir):
+                if not entry.is_dir():
+                    continue
+                item = entry.name
+                workspace_file = os.path.join(entry.path, "workspace.json")
+                try:
+                    stat = os.stat(workspace_file)
+                except OSError:
+                    continue
+
+                # Serve unchanged projects from the metadata cache; only
+                # a new or modified workspace file pays for a JSON parse
+                project_info = self.meta_cache.get(
+                    item, stat.st_mtime_ns, stat.st_size)
+                if project_info is not None:
+                    projects.append(project_info)
+                    continue
+
+                try:
+                    with open(workspace_file, 'r', encoding='utf-8') as f:
+                        data = json.load(f)
+
+                    settings = data.get("settings", {})
+                    metadata = data.get("metadata", {})
+
+                    project_info = {
+                        "project_id": item,
+                        "name": settings.get("name", "Unnamed Project"),
+                        "description": settings.get("description", ""),
+                        "created_date": settings.get("created_date", ""),
+                        "modified_date": settings.get("modified_date", ""),
+                        "last_opened": metadata.get("last_opened", ""),
+                        "duration": settings.get("duration", 0.0),
+                        "clip_count": len(data.get("timeline_clips", [])),
+                        "asset_count": len(data.get("media_assets", {}))
+                    }
+
+                    self.meta_cache.put(
+                        item, stat.st_mtime_ns, stat.st_size, project_info)
+                    projects.append(project_info)
+
+                except Exception as e:
+                    print(f"Error reading project {item}: {e}")
+
+            self.meta_cache.save()
+
         except Exception as e:
             print(f"Error listing projects: {e}")
             
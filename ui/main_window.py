@@ -1,5 +1,9 @@
 import sys
 import os
+import functools
+import logging
+import threading
+import numpy as np
 from PyQt6.QtWidgets import (
     QApplication, QMainWindow, QVBoxLayout, QHBoxLayout, QPushButton, 
     QSlider, QLabel, QWidget, QGroupBox, QFileDialog, QTabWidget,
@@ -8,9 +12,9 @@ from PyQt6.QtWidgets import (
     QCheckBox, QProgressBar, QStatusBar, QMenuBar, QMenu, QToolBar,
     QDockWidget
 )
-from PyQt6.QtCore import Qt, QTimer, pyqtSignal
+from PyQt6.QtCore import Qt, QTimer, pyqtSignal, QRunnable, QThreadPool
 from ui.timeline_widget import TimelineWidget
-from ui.preview_widget import PreviewWidget
+from ui.preview_widget import PreviewWidget, PreviewPipe
 from ui.media_browser import MediaBrowserWidget
 from PyQt6.QtGui import QAction, QPixmap, QPainter, QColor, QFont
 from core.video_processor import VideoProcessor
@@ -20,9 +24,70 @@ from core.audio_editing import AudioProcessor, WaveformWidget, AudioEffectsManag
 from core.keyframing import AnimationManager
 from core.timeline import Timeline
 from core.chroma_key import ChromaKeyManager
+from core.pyav_backend import PyAVBackend, PYAV_AVAILABLE
 from core.text_system import TitleSystem, TextStyle, TextAnimationConfig
 
+# Hot-path errors go through logging (disabled by default) instead of
+# print, which would serialize the GUI thread on stdio during drags
+logger = logging.getLogger("pyeditor.ui")
+
+@functools.lru_cache(maxsize=1024)
+def _basename(file_path: str) -> str:
+    """Cached os.path.basename for status messages on repeated paths"""
+    return os.path.basename(file_path)
+
+class EffectJob(QRunnable):
+    """Runs a clip-processing function off the GUI thread with cancellation"""
+
+    def __init__(self, effect_func, done_signal, message="", failed_signal=None):
+        super().__init__()
+        self.effect_func = effect_func
+        self.done_signal = done_signal
+        self.failed_signal = failed_signal
+        self.message = message
+        self.cancelled = threading.Event()
+
+    def cancel(self):
+        self.cancelled.set()
+
+    def run(self):
+        try:
+            result = self.effect_func()
+            # A stale job (superseded by a newer slider tick) drops its result
+            if not self.cancelled.is_set():
+                self.done_signal.emit(result, self.message)
+        except Exception as e:
+            logger.debug("Error running effect job", exc_info=True)
+            if self.failed_signal is not None and not self.cancelled.is_set():
+                self.failed_signal.emit(str(e))
+
+class CompositionRunnable(QRunnable):
+    """Builds a timeline composite video clip off the GUI thread"""
+
+    def __init__(self, clips, done_signal):
+        super().__init__()
+        self.clips = clips  # Already-positioned moviepy clips
+        self.done_signal = done_signal
+
+    def run(self):
+        try:
+            from moviepy import CompositeVideoClip
+
+            if self.clips:
+                if len(self.clips) == 1:
+                    composite_clip = self.clips[0]
+                else:
+                    composite_clip = CompositeVideoClip(self.clips)
+                self.done_signal.emit(composite_clip)
+
+        except Exception:
+            logger.debug("Error composing timeline in background", exc_info=True)
+
 class VideoEditor(QMainWindow):
+    composition_ready = pyqtSignal(object)
+    effect_done = pyqtSignal(object, str)
+    effect_failed = pyqtSignal(str)
+
     def __init__(self):
         super().__init__()
         
@@ -43,7 +108,43 @@ class VideoEditor(QMainWindow):
         self.title_system = TitleSystem()
         self.current_clip_id = None
         self.current_project_id = None
+        self._mask_buf = None  # Reused chroma mask preview buffer
+        self._text_raster_cache = {}  # (template_name, text) -> baked (frame, mask)
+        self._last_applied_tolerance = None
+
+        # Debounce timer coalescing tolerance-slider drags into one re-key
+        self._chroma_timer = QTimer(self)
+        self._chroma_timer.setSingleShot(True)
+        self._chroma_timer.timeout.connect(self.apply_chroma_key)
+
+        # Currently running background effect job, if any
+        self._effect_job = None
+        # Tolerance of the in-flight chroma job; committed to
+        # _last_applied_tolerance only once the job succeeds
+        self._pending_tolerance = None
+        self.effect_done.connect(self._on_effect_done)
+        self.effect_failed.connect(self._on_effect_failed)
         self.timeline_clips = {}  # Dictionary to store clip_id -> file_path mapping
+
+        # Incremental composition caches: source clips are opened once per
+        # file, positioned clips are rebuilt only when their timing changes
+        self._pyav_backend = PyAVBackend() if PYAV_AVAILABLE else None
+        self._source_clips = {}    # file_path -> source clip (PyAV-backed or VideoFileClip)
+        self._composed_clips = {}  # clip_id -> positioned clip
+        self._composed_specs = {}  # clip_id -> (file_path, start_time, duration)
+
+        # Per-clip end times in a flat array, so total duration is one
+        # vectorized max instead of a Python generator over every clip
+        self._end_times = np.zeros(256, dtype=np.float32)
+        self._end_slots = {}  # clip_id -> index into _end_times
+        self._end_free_slots = []  # reclaimed indexes from removed clips
+
+        # Debounce timer that coalesces rapid clip drags into one composition rebuild
+        self._compose_timer = QTimer(self)
+        self._compose_timer.setSingleShot(True)
+        self._compose_timer.timeout.connect(self._do_compose)
+        self.composition_ready.connect(self.on_composition_ready)
+
         self.setup_ui()
 
     def setup_ui(self):
@@ -85,6 +186,8 @@ class VideoEditor(QMainWindow):
         try:
             self.preview_widget.time_changed.connect(self.on_preview_time_changed)
             self.preview_widget.frame_changed.connect(self.on_preview_frame_changed)
+            # Pause/stop in the preview must also kill a running ffmpeg pipe
+            self.preview_widget.playback_stopped.connect(self._stop_preview_pipe)
         except Exception as e:
             print(f"Error connecting preview signals: {e}")
         
@@ -95,6 +198,12 @@ class VideoEditor(QMainWindow):
         except Exception as e:
             print(f"Error connecting media browser signals: {e}")
         
+        # Bind per-frame callback targets once; scrub/tick handlers then
+        # do a None check instead of hasattr every update
+        self._seek_fn = getattr(self.preview_widget, 'seek_to_time', None)
+        self._playhead_fn = getattr(self.timeline_widget, 'set_playhead_time', None)
+        self._refresh_preview_fn = getattr(self.preview_widget, 'refresh_preview', None)
+
         # Show startup project manager
         QTimer.singleShot(500, self.show_startup_project_manager)
         
@@ -1098,7 +1207,7 @@ class VideoEditor(QMainWindow):
     
     def on_media_selected(self, file_path: str):
         """Handle media selection in browser"""
-        self.status_bar.showMessage(f"Selected: {os.path.basename(file_path)}")
+        self.status_bar.showMessage(f"Selected: {_basename(file_path)}")
         
     def on_media_double_clicked(self, file_path: str):
         """Handle media double-click (load into timeline/preview)"""
@@ -1143,7 +1252,7 @@ class VideoEditor(QMainWindow):
                 self.original_clip = self.video_processor.current_clip
                 
                 # Add clip to timeline widget
-                clip_name = os.path.basename(file_path)
+                clip_name = _basename(file_path)
                 duration = self.video_processor.current_clip.duration
                 
                 # Only add to timeline if we have valid duration
@@ -1187,7 +1296,7 @@ class VideoEditor(QMainWindow):
             self.original_clip = image_clip
             
             # Add to timeline
-            clip_name = os.path.basename(file_path)
+            clip_name = _basename(file_path)
             self.current_clip_id = self.timeline_widget.add_clip_to_track(0, clip_name, 0.0, 5.0)
             
             # Set in preview
@@ -1316,15 +1425,17 @@ class VideoEditor(QMainWindow):
         load_bg_button.clicked.connect(self.load_background_image)
         layout.addWidget(load_bg_button)
         
-        # Tolerance slider
+        # Tolerance slider (debounced: re-keying the clip is far too
+        # expensive to run on every valueChanged tick of a drag)
         tolerance_layout = QHBoxLayout()
         tolerance_layout.addWidget(QLabel("Tolerance:"))
         self.tolerance_slider = QSlider(Qt.Orientation.Horizontal)
         self.tolerance_slider.setRange(0, 100)
         self.tolerance_slider.setValue(40)
+        self.tolerance_slider.valueChanged.connect(lambda _: self._chroma_timer.start(100))
         tolerance_layout.addWidget(self.tolerance_slider)
         layout.addLayout(tolerance_layout)
-        
+
         return group
     
     def create_text_controls(self):
@@ -1630,22 +1741,14 @@ class VideoEditor(QMainWindow):
         if not selected_template:
             selected_template = 'main_title'
         
-        # Create text overlay with sample text
-        text_overlay = self.title_system.create_text_overlay(
-            text="Sample Text Overlay",
-            template_name=selected_template,
-            duration=5.0,
-            position=('center', 'center')
-        )
-        
         try:
             # Composite text with current video
             from moviepy import CompositeVideoClip
-            
-            # Resize text clip to match video dimensions if needed
-            text_clip = text_overlay['clip']
-            if hasattr(self.video_processor.current_clip, 'size'):
-                video_size = self.video_processor.current_clip.size
+
+            # Bake the static text raster once; re-rendering it per frame
+            # through the text system is pure waste for a non-animated title
+            text_clip = self._bake_text_clip("Sample Text Overlay", selected_template, 5.0)
+            if hasattr(self.video_processor.current_clip, 'duration'):
                 text_clip = text_clip.with_duration(min(text_clip.duration, self.video_processor.current_clip.duration))
             
             # Create composite
@@ -1659,7 +1762,32 @@ class VideoEditor(QMainWindow):
             
         except Exception as e:
             self.status_bar.showMessage(f"Error adding text overlay: {str(e)}")
-    
+
+    def _bake_text_clip(self, text: str, template_name: str, duration: float):
+        """Build a text overlay clip from a once-rendered, cached raster"""
+        from moviepy import ImageClip
+
+        cache_key = (template_name, text)
+        baked = self._text_raster_cache.get(cache_key)
+        if baked is None:
+            text_overlay = self.title_system.create_text_overlay(
+                text=text,
+                template_name=template_name,
+                duration=duration,
+                position=('center', 'center')
+            )
+            source_clip = text_overlay['clip']
+            frame = source_clip.get_frame(0)
+            mask = source_clip.mask.get_frame(0) if source_clip.mask else None
+            baked = (frame, mask)
+            self._text_raster_cache[cache_key] = baked
+
+        frame, mask = baked
+        text_clip = ImageClip(frame)
+        if mask is not None:
+            text_clip = text_clip.with_mask(ImageClip(mask, is_mask=True))
+        return text_clip.with_duration(duration).with_position(('center', 'center'))
+
     def preview_with_animation(self):
         """Preview video with keyframe animations applied"""
         if not self.current_clip_id:
@@ -1671,23 +1799,38 @@ class VideoEditor(QMainWindow):
         try:
             # Render frame with animations (not currently supported here)
             # animated_frame = self.timeline_widget.render_frame_at_time(current_time)
-            
+
             # Fallback to regular preview
-            self.video_processor.current_clip.preview()
+            self.play_video()
             self.status_bar.showMessage("Previewing")
-            
+
         except Exception as e:
             self.status_bar.showMessage(f"Error previewing animation: {str(e)}")
-    
+
     def play_video(self):
         """Simple play action"""
         if self.video_processor.current_clip:
             try:
-                # Check if we have keyframes and should preview with animation
-                # Preview currently does not support keyframe animations
-                self.video_processor.current_clip.preview()
+                source_path = getattr(self.video_processor.current_clip, 'filename', None)
+                if source_path:
+                    # Stream through the hardware-accelerated ffmpeg pipe
+                    # instead of moviepy's Python/pygame preview loop
+                    self._stop_preview_pipe()
+                    width, height = self.video_processor.current_clip.size
+                    self._preview_pipe = PreviewPipe(source_path, width, height, self)
+                    self._preview_pipe.frame_ready.connect(self.preview_widget.show_frame)
+                    self._preview_pipe.start()
+                else:
+                    # Rendered/composite clips have no source file to pipe
+                    self.video_processor.current_clip.preview()
             except Exception as e:
                 self.status_bar.showMessage(f"Error playing video: {str(e)}")
+
+    def _stop_preview_pipe(self):
+        """Stop any running ffmpeg preview pipe"""
+        if getattr(self, '_preview_pipe', None) is not None:
+            self._preview_pipe.stop()
+            self._preview_pipe = None
     
     def load_background_image(self):
         """Load background image for chroma key"""
@@ -1712,20 +1855,27 @@ class VideoEditor(QMainWindow):
         try:
             # Get tolerance value from slider
             tolerance = self.tolerance_slider.value()
-            
-            # Apply chroma key with default green screen settings
-            processed_clip = self.chroma_key_manager.apply_chroma_key(
-                self.video_processor.current_clip,
-                key_color=(0, 255, 0),  # Green screen
-                tolerance=tolerance,
-                edge_softness=5,
-                spill_suppression=0.5
-            )
-            
-            # Update current clip
-            self.video_processor.current_clip = processed_clip
-            self.status_bar.showMessage("Chroma key applied successfully")
-            
+
+            # Nothing to do if this tolerance was already applied
+            if tolerance == self._last_applied_tolerance:
+                return
+
+            # Apply chroma key with default green screen settings on a
+            # worker thread; a newer slider tick cancels the stale run
+            source_clip = self.video_processor.current_clip
+
+            def build_chroma_clip():
+                return self.chroma_key_manager.apply_chroma_key(
+                    source_clip,
+                    key_color=(0, 255, 0),  # Green screen
+                    tolerance=tolerance,
+                    edge_softness=5,
+                    spill_suppression=0.5
+                )
+
+            self._start_effect_job(build_chroma_clip, "Chroma key applied successfully")
+            self._pending_tolerance = tolerance
+
         except Exception as e:
             self.status_bar.showMessage(f"Error applying chroma key: {str(e)}")
     
@@ -1736,9 +1886,13 @@ class VideoEditor(QMainWindow):
             return
             
         try:
-            # Get mask preview at time 0
-            mask = self.chroma_key_manager.preview_mask(self.video_processor.current_clip, 0.0)
-            
+            # Get mask preview at time 0, reusing one uint8 buffer across
+            # calls so rapid slider drags don't malloc/free a full frame each
+            mask = self.chroma_key_manager.preview_mask(
+                self.video_processor.current_clip, 0.0, out=self._mask_buf
+            )
+            self._mask_buf = mask
+
             # Display mask (this would be shown in a preview window in full implementation)
             self.status_bar.showMessage("Mask preview generated")
             
@@ -1782,7 +1936,7 @@ class VideoEditor(QMainWindow):
         try:
             # Delegate to timeline widget for adding to timeline
             self.timeline_widget.add_media_file(file_path)
-            self.status_bar.showMessage(f"Added {os.path.basename(file_path)} to timeline")
+            self.status_bar.showMessage(f"Added {_basename(file_path)} to timeline")
         except Exception as e:
             self.status_bar.showMessage(f"Error adding to timeline: {str(e)}")
     
@@ -1794,9 +1948,9 @@ class VideoEditor(QMainWindow):
             # Update preview with the loaded video clip
             self.preview_widget.set_video_clip(self.video_processor.current_clip)
                 
-            self.status_bar.showMessage(f"Loaded: {os.path.basename(file_path)}")
+            self.status_bar.showMessage(f"Loaded: {_basename(file_path)}")
         else:
-            self.status_bar.showMessage(f"Failed to load: {os.path.basename(file_path)}")
+            self.status_bar.showMessage(f"Failed to load: {_basename(file_path)}")
     
     def on_timeline_time_changed(self, time: float):
         """Handle timeline time change"""
@@ -1807,8 +1961,8 @@ class VideoEditor(QMainWindow):
         self._syncing_time = True
         try:
             # Update preview to show frame at this time
-            if hasattr(self.preview_widget, 'seek_to_time'):
-                self.preview_widget.seek_to_time(time)
+            if self._seek_fn is not None:
+                self._seek_fn(time)
         finally:
             self._syncing_time = False
     
@@ -1825,9 +1979,112 @@ class VideoEditor(QMainWindow):
     
     def on_clip_moved(self, clip_id: str, new_time: float, track_id: int):
         """Handle clip movement on timeline"""
-        # Update the timeline composition when clips are moved
-        self.update_timeline_composition()
+        # Rebuild the composition off the GUI thread, debounced so a drag
+        # burst pays the composition cost once instead of per move event
+        self.schedule_timeline_composition()
         self.status_bar.showMessage(f"Moved clip {clip_id} to {new_time:.2f}s")
+
+    def schedule_timeline_composition(self):
+        """Schedule a debounced background rebuild of the timeline composition"""
+        self._compose_timer.start(50)
+
+    def _do_compose(self):
+        """Refresh changed clips and rebuild the composite on a worker thread"""
+        if not self.timeline_clips:
+            return
+
+        try:
+            clips = self._refresh_composed_clips()
+            if clips:
+                runnable = CompositionRunnable(clips, self.composition_ready)
+                QThreadPool.globalInstance().start(runnable)
+
+        except Exception:
+            logger.debug("Error scheduling timeline composition", exc_info=True)
+
+    def _make_timeline_clip(self, file_path: str, start_time: float, duration: float):
+        """Build a positioned clip from the cached source VideoFileClip"""
+        from moviepy import VideoFileClip
+
+        source = self._source_clips.get(file_path)
+        if source is None:
+            if self._pyav_backend is not None:
+                # PyAV decodes in libav threads without GIL serialization,
+                # so multiple tracks can pull preview frames concurrently
+                source = self._pyav_backend.make_clip(file_path)
+            else:
+                source = VideoFileClip(file_path)
+            self._source_clips[file_path] = source
+
+        video_clip = source.with_start(start_time)
+        if duration < source.duration:
+            video_clip = video_clip.with_duration(duration)
+        return video_clip
+
+    def _refresh_composed_clips(self):
+        """Sync the clip_id -> positioned-clip cache with the timeline.
+
+        Only clips whose timing actually changed are rebuilt, so a drag
+        costs O(1) moviepy object construction instead of O(N).
+        """
+        seen = set()
+        for track in self.timeline_widget.tracks:
+            for clip in track.clips:
+                if clip.clip_id not in self.timeline_clips:
+                    continue
+                file_path = self.timeline_clips[clip.clip_id]
+                spec = (file_path, clip.start_time, clip.duration)
+                seen.add(clip.clip_id)
+                if self._composed_specs.get(clip.clip_id) != spec:
+                    self._composed_clips[clip.clip_id] = self._make_timeline_clip(*spec)
+                    self._composed_specs[clip.clip_id] = spec
+                    self._set_clip_end_time(clip.clip_id, clip.end_time())
+
+        # Drop entries for clips removed from the timeline
+        for clip_id in list(self._composed_clips):
+            if clip_id not in seen:
+                del self._composed_clips[clip_id]
+                del self._composed_specs[clip_id]
+                slot = self._end_slots.pop(clip_id)
+                self._end_times[slot] = 0.0
+                self._end_free_slots.append(slot)
+
+        return list(self._composed_clips.values())
+
+    def _set_clip_end_time(self, clip_id: str, end_time: float):
+        """Record a clip's end time in its slot of the flat array"""
+        slot = self._end_slots.get(clip_id)
+        if slot is None:
+            if self._end_free_slots:
+                slot = self._end_free_slots.pop()
+            else:
+                # Live slots plus freed slots = high-water mark
+                slot = len(self._end_slots) + len(self._end_free_slots)
+                if slot >= len(self._end_times):
+                    self._end_times = np.resize(self._end_times, len(self._end_times) * 2)
+            self._end_slots[clip_id] = slot
+        self._end_times[slot] = end_time
+
+    def _timeline_duration(self) -> float:
+        """Total timeline duration as a single vectorized max"""
+        if not self._end_slots:
+            return 0.0
+        used = len(self._end_slots) + len(self._end_free_slots)
+        return float(self._end_times[:used].max())
+
+    def on_composition_ready(self, composite_clip):
+        """Receive the finished composite on the GUI thread and update the preview"""
+        try:
+            self.preview_widget.set_video_clip(composite_clip)
+
+            # Update timeline duration
+            self.timeline_widget.duration = self._timeline_duration()
+            self.timeline_widget.update_timeline_size()
+
+            self.status_bar.showMessage("Timeline composition updated")
+
+        except Exception:
+            logger.debug("Error applying timeline composition", exc_info=True)
     
     def on_media_added_to_timeline(self, clip_id: str, file_path: str):
         """Handle media added to timeline via drag and drop"""
@@ -1843,7 +2100,7 @@ class VideoEditor(QMainWindow):
         # Reconnect track signals in case new tracks were created
         self.connect_track_signals()
         
-        self.status_bar.showMessage(f"Added {os.path.basename(file_path)} to timeline with waveform")
+        self.status_bar.showMessage(f"Added {_basename(file_path)} to timeline with waveform")
     
     def generate_waveform_for_clip(self, clip_id: str, file_path: str):
         """Generate waveform data for a clip"""
@@ -1864,8 +2121,8 @@ class VideoEditor(QMainWindow):
                 # Update the timeline display
                 self.timeline_widget.update_tracks()
                 
-        except Exception as e:
-            print(f"Error generating waveform for clip {clip_id}: {e}")
+        except Exception:
+            logger.debug("Error generating waveform for clip %s", clip_id, exc_info=True)
     
     def on_preview_time_changed(self, time: float):
         """Handle preview time change"""
@@ -1876,8 +2133,8 @@ class VideoEditor(QMainWindow):
         self._syncing_time = True
         try:
             # Update timeline playhead
-            if hasattr(self.timeline_widget, 'set_playhead_time'):
-                self.timeline_widget.set_playhead_time(time)
+            if self._playhead_fn is not None:
+                self._playhead_fn(time)
         finally:
             self._syncing_time = False
     
@@ -1892,29 +2149,25 @@ class VideoEditor(QMainWindow):
             return
             
         try:
-            from moviepy import VideoFileClip, CompositeVideoClip
-            
-            # Get all clips from timeline
-            all_clips = []
-            for track in self.timeline_widget.tracks:
-                for clip in track.clips:
-                    if clip.clip_id in self.timeline_clips:
-                        file_path = self.timeline_clips[clip.clip_id]
-                        
-                        # Load the video clip
-                        video_clip = VideoFileClip(file_path)
-                        
-                        # Set start time and duration
-                        video_clip = video_clip.with_start(clip.start_time)
-                        if clip.duration < video_clip.duration:
-                            video_clip = video_clip.with_duration(clip.duration)
-                            
-                        all_clips.append(video_clip)
-            
+            from moviepy import CompositeVideoClip
+
+            # Refresh only clips whose timing changed
+            all_clips = self._refresh_composed_clips()
+
             if all_clips:
                 # Create composite
                 if len(all_clips) == 1:
-                    composite_clip = all_clips[0]
+                    # Single-clip timelines are the common case: an
+                    # untrimmed clip at t=0 can feed the preview its
+                    # cached source directly, skipping the positioned
+                    # wrapper
+                    (clip_id, spec), = self._composed_specs.items()
+                    source = self._source_clips.get(spec[0])
+                    if (source is not None and spec[1] == 0
+                            and spec[2] >= source.duration):
+                        composite_clip = source
+                    else:
+                        composite_clip = all_clips[0]
                 else:
                     composite_clip = CompositeVideoClip(all_clips)
                 
@@ -1922,14 +2175,13 @@ class VideoEditor(QMainWindow):
                 self.preview_widget.set_video_clip(composite_clip)
                 
                 # Update timeline duration
-                total_duration = max(clip.end_time() for track in self.timeline_widget.tracks for clip in track.clips)
-                self.timeline_widget.duration = total_duration
+                self.timeline_widget.duration = self._timeline_duration()
                 self.timeline_widget.update_timeline_size()
                 
                 self.status_bar.showMessage("Timeline composition updated")
             
         except Exception as e:
-            print(f"Error updating timeline composition: {e}")
+            logger.debug("Error updating timeline composition", exc_info=True)
             self.status_bar.showMessage(f"Error updating timeline: {str(e)}")
     
     def apply_selected_effect(self):
@@ -1944,26 +2196,52 @@ class VideoEditor(QMainWindow):
             return
             
         effect_name = selected_items[0].text().lower()
-        
+
         try:
-            # Apply effect to current clip
-            processed_clip = self.video_processor.apply_effect_to_clip(
-                self.video_processor.current_clip, 
-                effect_name
+            # Apply effect to current clip on a worker thread
+            source_clip = self.video_processor.current_clip
+
+            def build_effect_clip():
+                return self.video_processor.apply_effect_to_clip(source_clip, effect_name)
+
+            self._start_effect_job(
+                build_effect_clip,
+                f"Applied {effect_name.capitalize()} effect"
             )
-            
-            # Update current clip
-            self.video_processor.current_clip = processed_clip
-            
-            # Update preview if available
-            if hasattr(self.preview_widget, 'refresh_preview'):
-                self.preview_widget.refresh_preview()
-                
-            self.status_bar.showMessage(f"Applied {effect_name.capitalize()} effect")
-            
+
         except Exception as e:
             self.status_bar.showMessage(f"Error applying effect: {str(e)}")
-    
+
+    def _start_effect_job(self, effect_func, message: str):
+        """Run an effect build on the thread pool, cancelling any stale job"""
+        if self._effect_job is not None:
+            self._effect_job.cancel()
+        self._pending_tolerance = None
+        self._effect_job = EffectJob(
+            effect_func, self.effect_done, message, self.effect_failed)
+        self.status_bar.showMessage("Applying effect...")
+        QThreadPool.globalInstance().start(self._effect_job)
+
+    def _on_effect_done(self, processed_clip, message: str):
+        """Install the finished effect result on the GUI thread"""
+        self._effect_job = None
+        if self._pending_tolerance is not None:
+            self._last_applied_tolerance = self._pending_tolerance
+            self._pending_tolerance = None
+        self.video_processor.current_clip = processed_clip
+
+        # Update preview if available
+        if self._refresh_preview_fn is not None:
+            self._refresh_preview_fn()
+
+        self.status_bar.showMessage(message)
+
+    def _on_effect_failed(self, error: str):
+        """Surface a worker-thread effect failure in the status bar"""
+        self._effect_job = None
+        self._pending_tolerance = None
+        self.status_bar.showMessage(f"Error applying effect: {error}")
+
     def apply_selected_transition(self):
         """Apply the selected transition between clips"""
         selected_items = self.transitions_list.selectedItems()
@@ -1982,9 +2260,14 @@ class VideoEditor(QMainWindow):
         try:
             # Create a simple transition demonstration
             # This is a placeholder - real implementation would handle timeline clips
-            clip1 = self.video_processor.current_clip.subclip(0, 5)
-            clip2 = self.video_processor.current_clip.subclip(5, 10)
-            
+            # Hoist the base clip once; subclipped() is a lazy time slice that
+            # shares the underlying reader instead of opening a second pipe
+            base_clip = self.video_processor.current_clip
+            demo_window = min(10.0, base_clip.duration or 10.0)
+            half = demo_window / 2
+            clip1 = base_clip.subclipped(0, half)
+            clip2 = base_clip.subclipped(half, demo_window)
+
             transitioned_clip = self.video_processor.apply_transition_between_clips(
                 clip1, clip2, transition_name, 1.0
             )
@@ -1993,9 +2276,9 @@ class VideoEditor(QMainWindow):
             self.video_processor.current_clip = transitioned_clip
             
             # Update preview if available
-            if hasattr(self.preview_widget, 'refresh_preview'):
-                self.preview_widget.refresh_preview()
-                
+            if self._refresh_preview_fn is not None:
+                self._refresh_preview_fn()
+
             self.status_bar.showMessage(f"Applied {transition_name.replace('_', ' ').capitalize()} transition")
             
         except Exception as e:
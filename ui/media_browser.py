@@ -5,7 +5,10 @@ Includes thumbnails, metadata display, search functionality, and organization
 
 import sys
 import os
+import functools
 import threading
+from collections import deque
+from concurrent.futures import ThreadPoolExecutor, as_completed
 from typing import Dict, List, Optional, Tuple
 from PyQt6.QtWidgets import (
     QWidget, QVBoxLayout, QHBoxLayout, QTreeWidget, QTreeWidgetItem,
@@ -61,13 +64,36 @@ class DraggableTreeWidget(QTreeWidget):
         drag.exec(supportedActions)
 import cv2
 import numpy as np
+import sqlite3
+from pathlib import Path
 from datetime import datetime, timedelta
 import json
 
+try:
+    import av
+    PYAV_AVAILABLE = True
+except ImportError:
+    PYAV_AVAILABLE = False
+
+_SIZE_NAMES = ("B", "KB", "MB", "GB")
+
+@functools.lru_cache(maxsize=1024)
+def _format_file_size(size_bytes: int) -> str:
+    """Human-readable file size; unit picked in O(1) via bit length"""
+    if size_bytes <= 0:
+        return "0 B"
+    i = min(3, (size_bytes.bit_length() - 1) // 10)
+    return f"{size_bytes / (1 << (10 * i)):.1f} {_SIZE_NAMES[i]}"
+
+# Extension tuples for str.endswith: no splitext allocation per check
+VIDEO_EXTS = ('.mp4', '.avi', '.mov', '.mkv', '.wmv', '.flv', '.webm')
+SUPPORTED_EXTS = VIDEO_EXTS + ('.mp3', '.wav', '.aac', '.flac',
+                               '.jpg', '.jpeg', '.png', '.bmp', '.tiff')
+
 class MediaItem:
     """Represents a media item with metadata and thumbnail"""
     
-    def __init__(self, file_path: str):
+    def __init__(self, file_path: str, stat_result: Optional[os.stat_result] = None):
         self.file_path = file_path
         self.file_name = os.path.basename(file_path)
         self.file_size = 0
@@ -78,16 +104,19 @@ class MediaItem:
         self.codec = ""
         self.bitrate = 0
         self.thumbnail = None
+        self.thumbnail_png = None  # Encoded bytes, as stored in the cache
         self.date_created = None
         self.date_modified = None
         self.tags = []
         self.rating = 0
         self.is_favorite = False
         self.metadata_loaded = False
+        self._modified_str = None  # Lazily cached strftime of date_modified
         
-        # Basic file info
+        # Basic file info (reuse the scanner's cached stat when available
+        # -- on network shares each extra stat is a round trip)
         try:
-            stat = os.stat(file_path)
+            stat = stat_result if stat_result is not None else os.stat(file_path)
             self.file_size = stat.st_size
             self.date_created = datetime.fromtimestamp(stat.st_ctime)
             self.date_modified = datetime.fromtimestamp(stat.st_mtime)
@@ -95,50 +124,384 @@ class MediaItem:
         except:
             pass
 
+    def modified_display(self) -> str:
+        """Modification date formatted once; strftime is slow in bulk"""
+        if self._modified_str is None:
+            self._modified_str = (self.date_modified.strftime("%m/%d/%Y %H:%M")
+                                  if self.date_modified else "")
+        return self._modified_str
+
+def fast_probe(file_path: str) -> Optional[Dict]:
+    """Read duration/fps/resolution/codec from container headers.
+
+    Parsing headers takes microseconds versus tens of milliseconds for a
+    decode, so the details columns can fill in synchronously at import.
+    Returns None when PyAV is unavailable or the file cannot be opened.
+    """
+    if not PYAV_AVAILABLE:
+        return None
+
+    try:
+        with av.open(file_path, metadata_errors='ignore') as container:
+            metadata = {}
+            if container.duration is not None:
+                metadata['duration'] = container.duration / av.time_base
+
+            if container.streams.video:
+                stream = container.streams.video[0]
+                metadata['fps'] = float(stream.average_rate) if stream.average_rate else 0.0
+                metadata['resolution'] = (stream.codec_context.width,
+                                          stream.codec_context.height)
+                metadata['codec'] = stream.codec_context.name
+            elif container.streams.audio:
+                metadata['codec'] = container.streams.audio[0].codec_context.name
+            return metadata
+    except Exception:
+        return None
+
+def ndarray_to_qimage(frame_rgb: np.ndarray):
+    """Copy an RGB ndarray into a QImage that owns its pixel buffer.
+
+    QImage(arr.data, ...) merely aliases the array; once the local array
+    is garbage-collected the image points at freed memory. One explicit
+    row-aligned memcpy into an owned buffer avoids both the dangling view
+    and the extra defensive copies Qt makes for foreign buffers.
+    """
+    from PyQt6.QtGui import QImage
+
+    height, width, channels = frame_rgb.shape
+    qimg = QImage(width, height, QImage.Format.Format_RGB888)
+
+    row_bytes = width * channels
+    ptr = qimg.bits()
+    ptr.setsize(qimg.sizeInBytes())
+    dst = np.frombuffer(ptr, dtype=np.uint8).reshape(height, qimg.bytesPerLine())
+    dst[:, :row_bytes] = np.ascontiguousarray(frame_rgb).reshape(height, row_bytes)
+    return qimg
+
+class ThumbnailCache:
+    """Persistent thumbnail/metadata cache keyed by (path, mtime, size).
+
+    A warm folder re-scan becomes a stat plus an SQLite lookup instead of
+    re-probing and re-decoding every file.
+    """
+
+    def __init__(self, db_path: Optional[str] = None):
+        if db_path is None:
+            cache_dir = Path.home() / ".pyvideo_cache"
+            cache_dir.mkdir(parents=True, exist_ok=True)
+            db_path = str(cache_dir / "thumbnails.db")
+
+        # One connection shared between the GUI and generator threads
+        self.conn = sqlite3.connect(db_path, check_same_thread=False)
+        self.conn.execute("PRAGMA journal_mode=WAL")
+        self.conn.execute("""
+            CREATE TABLE IF NOT EXISTS thumbnails (
+                path TEXT PRIMARY KEY,
+                mtime INTEGER,
+                size INTEGER,
+                duration REAL,
+                fps REAL,
+                width INTEGER,
+                height INTEGER,
+                thumb BLOB
+            )
+        """)
+        self.conn.commit()
+        self._lock = threading.Lock()
+
+    def get(self, file_path: str) -> Optional[Tuple[Optional[bytes], Dict]]:
+        """Return (png_bytes, metadata) if the cached entry is still valid"""
+        try:
+            stat = os.stat(file_path)
+        except OSError:
+            return None
+
+        with self._lock:
+            row = self.conn.execute(
+                "SELECT mtime, size, duration, fps, width, height, thumb "
+                "FROM thumbnails WHERE path = ?",
+                (os.path.abspath(file_path),)
+            ).fetchone()
+
+        if row is None or row[0] != stat.st_mtime_ns or row[1] != stat.st_size:
+            return None
+
+        metadata = {
+            'duration': row[2],
+            'fps': row[3],
+            'resolution': (row[4], row[5]),
+            'frame_count': int(row[2] * row[3]) if row[2] and row[3] else 0
+        }
+        return (row[6] or None), metadata
+
+    def put(self, file_path: str, png_bytes: Optional[bytes], metadata: Dict):
+        """Store an already-encoded PNG thumbnail and its metadata"""
+        try:
+            stat = os.stat(file_path)
+        except OSError:
+            return
+
+        thumb_bytes = png_bytes or b''
+        width, height = metadata.get('resolution', (0, 0))
+        with self._lock:
+            self.conn.execute(
+                "INSERT OR REPLACE INTO thumbnails VALUES (?, ?, ?, ?, ?, ?, ?, ?)",
+                (os.path.abspath(file_path), stat.st_mtime_ns, stat.st_size,
+                 metadata.get('duration', 0.0), metadata.get('fps', 0.0),
+                 width, height, thumb_bytes)
+            )
+            self.conn.commit()
+
+class FolderScanner(QThread):
+    """Background thread that walks a folder and emits media paths in batches.
+
+    Keeps directory traversal (slow on network shares and huge folders)
+    out of the Qt event loop; batching keeps per-signal overhead low.
+    """
+
+    BATCH_SIZE = 64
+
+    paths_found = pyqtSignal(list)  # batch of (file_path, stat_result) tuples
+    scan_finished = pyqtSignal(str, int)  # folder_path, total files found
+
+    def __init__(self, folder_path: str):
+        super().__init__()
+        self.folder_path = folder_path
+        self.should_stop = False
+
+    def run(self):
+        """Walk the tree with scandir and emit batches of media paths"""
+        batch = []
+        total = 0
+        stack = [self.folder_path]
+
+        while stack and not self.should_stop:
+            folder = stack.pop()
+            try:
+                with os.scandir(folder) as entries:
+                    for entry in entries:
+                        if self.should_stop:
+                            break
+                        if entry.is_dir(follow_symlinks=False):
+                            stack.append(entry.path)
+                        elif entry.name.lower().endswith(SUPPORTED_EXTS):
+                            # DirEntry.stat() reuses the scandir metadata,
+                            # sparing MediaItem a second stat syscall
+                            batch.append((entry.path, entry.stat(follow_symlinks=False)))
+                            total += 1
+                            if len(batch) >= self.BATCH_SIZE:
+                                self.paths_found.emit(batch)
+                                batch = []
+            except OSError as e:
+                print(f"Error scanning {folder}: {e}")
+
+        if batch:
+            self.paths_found.emit(batch)
+        self.scan_finished.emit(self.folder_path, total)
+
+    def stop(self):
+        """Stop the folder scan"""
+        self.should_stop = True
+        self.wait()
+
 class ThumbnailGenerator(QThread):
     """Background thread for generating video thumbnails"""
-    
-    thumbnail_ready = pyqtSignal(str, QPixmap, dict)  # file_path, thumbnail, metadata
+
+    # Workers hand over PNG bytes; the GUI thread only does loadFromData
+    thumbnail_ready = pyqtSignal(str, bytes, dict)  # file_path, png_bytes, metadata
     progress_updated = pyqtSignal(int, int)  # current, total
-    
-    def __init__(self):
+
+    def __init__(self, cache: Optional[ThumbnailCache] = None):
         super().__init__()
-        self.file_queue = []
+        self.file_queue = deque()
+        self._queued = set()  # O(1) dedup alongside the FIFO queue
         self.should_stop = False
-        
+        self.cache = cache
+        self._tls = threading.local()  # Per-worker reused RGB buffers
+
     def add_file(self, file_path: str):
         """Add file to thumbnail generation queue"""
-        if file_path not in self.file_queue:
-            self.file_queue.append(file_path)
-            
+        if file_path in self._queued:
+            return
+        self._queued.add(file_path)
+        self.file_queue.append(file_path)
+
     def run(self):
-        """Generate thumbnails for queued files"""
-        total_files = len(self.file_queue)
+        """Generate thumbnails for queued files on a worker pool.
+
+        Decoding releases the GIL inside libav/OpenCV, so files thumbnail
+        in parallel across cores instead of serially on this thread.
+        """
+        max_workers = max(1, (os.cpu_count() or 2) // 2)
+        done_count = 0
+
+        with ThreadPoolExecutor(max_workers=max_workers) as pool:
+            # Drain in passes until the queue is empty: _enqueue_visible
+            # keeps add_file'ing while a run is in flight, and those late
+            # arrivals must not be dropped
+            while self.file_queue and not self.should_stop:
+                batch = []
+                while self.file_queue:
+                    batch.append(self.file_queue.popleft())
+                total_files = done_count + len(batch)
+
+                futures = {
+                    pool.submit(self.generate_thumbnail_and_metadata, file_path): file_path
+                    for file_path in batch
+                }
+
+                for future in as_completed(futures):
+                    file_path = futures[future]
+                    if self.should_stop:
+                        for pending in futures:
+                            pending.cancel()
+                        break
+
+                    done_count += 1
+                    self.progress_updated.emit(done_count, total_files)
+                    # Allow a later add_file for this path once it is done
+                    self._queued.discard(file_path)
+
+                    try:
+                        png_bytes, metadata = future.result()
+                        if png_bytes:
+                            if self.cache is not None:
+                                self.cache.put(file_path, png_bytes, metadata)
+                            self.thumbnail_ready.emit(file_path, png_bytes, metadata)
+                    except Exception as e:
+                        print(f"Error generating thumbnail for {file_path}: {e}")
+
+        self.file_queue.clear()
+        self._queued.clear()
         
-        for i, file_path in enumerate(self.file_queue):
-            if self.should_stop:
-                break
-                
-            self.progress_updated.emit(i + 1, total_files)
-            
+    def generate_thumbnail_and_metadata(self, file_path: str) -> Tuple[Optional[bytes], Dict]:
+        """Generate a PNG-encoded thumbnail and extract metadata.
+
+        Returns PNG bytes rather than a QPixmap so the encode happens on
+        the worker and the GUI thread only pays for loadFromData.
+        """
+        # Prefer PyAV: a keyframe-only seek plus one decode is much faster
+        # than OpenCV stepping frame-by-frame from the nearest keyframe
+        if PYAV_AVAILABLE:
             try:
-                thumbnail, metadata = self.generate_thumbnail_and_metadata(file_path)
-                if thumbnail:
-                    self.thumbnail_ready.emit(file_path, thumbnail, metadata)
+                return self._generate_with_pyav(file_path)
             except Exception as e:
-                print(f"Error generating thumbnail for {file_path}: {e}")
-                
-        self.file_queue.clear()
-        
-    def generate_thumbnail_and_metadata(self, file_path: str) -> Tuple[Optional[QPixmap], Dict]:
-        """Generate thumbnail and extract metadata from video file"""
+                print(f"PyAV thumbnail failed for {file_path}, falling back to OpenCV: {e}")
+
+        return self._generate_with_opencv(file_path)
+
+    def _generate_with_pyav(self, file_path: str) -> Tuple[Optional[bytes], Dict]:
+        """Extract one keyframe near 10% of the duration via PyAV"""
+        thumbnail = None
+        with av.open(file_path) as container:
+            stream = container.streams.video[0]
+            stream.codec_context.thread_type = 'AUTO'
+
+            # Stream metadata comes from the headers -- no decoding needed
+            fps = float(stream.average_rate) if stream.average_rate else 0.0
+            width = stream.codec_context.width
+            height = stream.codec_context.height
+            if stream.duration is not None:
+                duration = float(stream.duration * stream.time_base)
+            elif container.duration is not None:
+                duration = container.duration / av.time_base
+            else:
+                duration = 0.0
+            frame_count = stream.frames or int(duration * fps)
+
+            metadata = {
+                'duration': duration,
+                'fps': fps,
+                'resolution': (width, height),
+                'frame_count': frame_count
+            }
+
+            # Keyframe-only seek to ~10% of the duration, then decode one frame
+            if stream.duration is not None:
+                container.seek(int(stream.duration * 0.1), backward=True, stream=stream)
+            frame = next(container.decode(stream), None)
+
+            if frame is not None:
+                # libswscale downscales and converts to RGB in one SIMD
+                # pass, so the full-size decoded frame never leaves libav
+                thumb_height = 60
+                thumb_width = int((width / height) * thumb_height) if height else thumb_height
+                frame_rgb = frame.reformat(width=thumb_width, height=thumb_height,
+                                           format='rgb24',
+                                           interpolation='BILINEAR').to_ndarray()
+                ok, buf = cv2.imencode('.png', cv2.cvtColor(frame_rgb, cv2.COLOR_RGB2BGR))
+                if ok:
+                    thumbnail = buf.tobytes()
+
+        return thumbnail, metadata
+
+    def _bgr_to_rgb(self, frame_bgr: np.ndarray) -> np.ndarray:
+        """Convert BGR to RGB into a reused per-worker buffer.
+
+        The PyAV path gets RGB straight from libswscale; this is only for
+        the OpenCV fallback, where a preallocated dst avoids a fresh
+        allocation per thumbnail. Thread-local because thumbnails convert
+        concurrently on the worker pool.
+        """
+        buf = getattr(self._tls, 'rgb_buf', None)
+        if buf is None or buf.shape != frame_bgr.shape:
+            buf = np.empty_like(frame_bgr)
+            self._tls.rgb_buf = buf
+        cv2.cvtColor(frame_bgr, cv2.COLOR_BGR2RGB, dst=buf)
+        return buf
+
+    def generate_thumbnail_strip(self, file_path: str, n: int = 5) -> List[QPixmap]:
+        """Extract n evenly spaced thumbnails for a strip/grid preview.
+
+        Walks the file with sequential grab() (advance without decoding)
+        and retrieve()s only at the sample points. Sequential grab is an
+        order of magnitude cheaper than n CAP_PROP_POS_FRAMES seeks, each
+        of which re-enters from the previous keyframe.
+        """
+        thumbnails = []
+        cap = cv2.VideoCapture(file_path)
+        cap.set(cv2.CAP_PROP_BUFFERSIZE, 1)
+
+        try:
+            if not cap.isOpened():
+                return thumbnails
+
+            frame_count = int(cap.get(cv2.CAP_PROP_FRAME_COUNT))
+            width = int(cap.get(cv2.CAP_PROP_FRAME_WIDTH))
+            height = int(cap.get(cv2.CAP_PROP_FRAME_HEIGHT))
+            step = max(1, frame_count // (n + 1))
+
+            thumb_height = 60
+            thumb_width = int((width / height) * thumb_height) if height else thumb_height
+
+            for _ in range(n):
+                for _ in range(step):
+                    if not cap.grab():
+                        return thumbnails
+                ret, frame = cap.retrieve()
+                if not ret:
+                    break
+                frame_resized = cv2.resize(frame, (thumb_width, thumb_height),
+                                           interpolation=cv2.INTER_AREA)
+                frame_rgb = self._bgr_to_rgb(frame_resized)
+                thumbnails.append(QPixmap.fromImage(ndarray_to_qimage(frame_rgb)))
+        finally:
+            cap.release()
+
+        return thumbnails
+
+    def _generate_with_opencv(self, file_path: str) -> Tuple[Optional[bytes], Dict]:
+        """OpenCV fallback thumbnail/metadata extraction"""
         thumbnail = None
         metadata = {}
-        
+
         try:
             # Use OpenCV to extract frame and metadata
             cap = cv2.VideoCapture(file_path)
-            
+            # Keep only one decoded frame in flight -- no 4K frame queue
+            cap.set(cv2.CAP_PROP_BUFFERSIZE, 1)
+
             if cap.isOpened():
                 # Get video properties
                 fps = cap.get(cv2.CAP_PROP_FPS)
@@ -154,26 +517,26 @@ class ThumbnailGenerator(QThread):
                     'frame_count': frame_count
                 }
                 
-                # Seek to 10% of duration for thumbnail
-                seek_frame = int(frame_count * 0.1)
-                cap.set(cv2.CAP_PROP_POS_FRAMES, seek_frame)
-                
-                ret, frame = cap.read()
+                # Timestamp seek lands on a keyframe near 10% instead of
+                # decoding forward to the exact frame number; any frame in
+                # that neighbourhood is fine for a thumbnail
+                cap.set(cv2.CAP_PROP_POS_MSEC, duration * 1000 * 0.1)
+
+                # grab() advances without decoding; retrieve() decodes once
+                ret = cap.grab()
+                if ret:
+                    ret, frame = cap.retrieve()
                 if ret:
                     # Resize frame for thumbnail
                     thumb_height = 60
                     thumb_width = int((width / height) * thumb_height)
-                    frame_resized = cv2.resize(frame, (thumb_width, thumb_height))
-                    
-                    # Convert BGR to RGB
-                    frame_rgb = cv2.cvtColor(frame_resized, cv2.COLOR_BGR2RGB)
+                    frame_resized = cv2.resize(frame, (thumb_width, thumb_height),
+                                               interpolation=cv2.INTER_AREA)
                     
-                    # Convert to QPixmap
-                    h, w, ch = frame_rgb.shape
-                    bytes_per_line = ch * w
-                    from PyQt6.QtGui import QImage
-                    q_image = QImage(frame_rgb.data, w, h, bytes_per_line, QImage.Format.Format_RGB888)
-                    thumbnail = QPixmap.fromImage(q_image)
+                    # PNG-encode directly from BGR; cv2.imencode expects it
+                    ok, buf = cv2.imencode('.png', frame_resized)
+                    if ok:
+                        thumbnail = buf.tobytes()
                     
             cap.release()
             
@@ -193,18 +556,39 @@ class MediaBrowserWidget(QWidget):
     # Signals
     media_selected = pyqtSignal(str)  # file_path
     media_double_clicked = pyqtSignal(str)  # file_path
+
+    # Shared decorative icons, materialized once per process
+    _DIR_ICON = None
     
     def __init__(self):
         super().__init__()
         self.media_items: Dict[str, MediaItem] = {}
         self.current_folder = None
-        self.thumbnail_generator = ThumbnailGenerator()
+        self.thumbnail_cache = ThumbnailCache()
+        self.thumbnail_generator = ThumbnailGenerator(self.thumbnail_cache)
+        self.folder_scanner = None
+
+        # Lowercase names aligned with tree rows, for vectorized filtering
+        self._lower_names: List[str] = []
+        self._last_mask = None
+
+        # Direct row lookup for thumbnail-ready updates (no linear scan)
+        self._items_by_path: Dict[str, QTreeWidgetItem] = {}
         self.thumbnail_generator.thumbnail_ready.connect(self.on_thumbnail_ready)
         self.thumbnail_generator.progress_updated.connect(self.on_progress_updated)
-        self.thumbnail_generator.start()
+        # Started on demand by _enqueue_visible once there is queued work
         
         self.setup_ui()
-        
+
+        # Thumbnails are generated lazily for rows near the viewport;
+        # scrolling (debounced) re-evaluates what is visible
+        self._visible_timer = QTimer(self)
+        self._visible_timer.setSingleShot(True)
+        self._visible_timer.setInterval(100)
+        self._visible_timer.timeout.connect(self._enqueue_visible)
+        self.media_view.verticalScrollBar().valueChanged.connect(
+            lambda _: self._visible_timer.start())
+
     def setup_ui(self):
         """Setup the media browser UI"""
         layout = QVBoxLayout(self)
@@ -258,7 +642,14 @@ class MediaBrowserWidget(QWidget):
         
         self.search_box = QLineEdit()
         self.search_box.setPlaceholderText("Search media...")
-        self.search_box.textChanged.connect(self.filter_media)
+
+        # Debounce typing bursts: only the text as it stands 150 ms after
+        # the last keystroke actually runs the filter
+        self._filter_timer = QTimer(self)
+        self._filter_timer.setSingleShot(True)
+        self._filter_timer.setInterval(150)
+        self._filter_timer.timeout.connect(lambda: self.filter_media(self.search_box.text()))
+        self.search_box.textChanged.connect(lambda _: self._filter_timer.start())
         self.search_box.setStyleSheet("""
             QLineEdit {
                 background-color: #5a5a5a;
@@ -384,20 +775,15 @@ class MediaBrowserWidget(QWidget):
         
     def add_common_folders(self):
         """Add common media folders to the tree"""
-        # Recent imports
-        recent_item = QTreeWidgetItem(["Recent"])
-        recent_item.setIcon(0, self.style().standardIcon(self.style().StandardPixmap.SP_DirIcon))
-        self.folder_tree.addTopLevelItem(recent_item)
-        
-        # Favorites
-        favorites_item = QTreeWidgetItem(["Favorites"])
-        favorites_item.setIcon(0, self.style().standardIcon(self.style().StandardPixmap.SP_DirIcon))
-        self.folder_tree.addTopLevelItem(favorites_item)
-        
-        # Project media
-        project_item = QTreeWidgetItem(["Project Media"])
-        project_item.setIcon(0, self.style().standardIcon(self.style().StandardPixmap.SP_DirIcon))
-        self.folder_tree.addTopLevelItem(project_item)
+        # One shared QIcon for every folder row in every browser instance
+        if MediaBrowserWidget._DIR_ICON is None:
+            MediaBrowserWidget._DIR_ICON = self.style().standardIcon(
+                self.style().StandardPixmap.SP_DirIcon)
+
+        for folder_name in ("Recent", "Favorites", "Project Media"):
+            item = QTreeWidgetItem([folder_name])
+            item.setIcon(0, MediaBrowserWidget._DIR_ICON)
+            self.folder_tree.addTopLevelItem(item)
         
     def get_button_style(self):
         """Get standard button style"""
@@ -432,21 +818,56 @@ class MediaBrowserWidget(QWidget):
                 self.add_media_file(file_path)
                 
     def scan_folder(self, folder_path: str):
-        """Scan folder for media files"""
-        supported_extensions = {'.mp4', '.avi', '.mov', '.mkv', '.wmv', '.flv', '.webm', 
-                               '.mp3', '.wav', '.aac', '.flac', '.jpg', '.jpeg', '.png', '.bmp', '.tiff'}
-        
-        media_files = []
-        for root, dirs, files in os.walk(folder_path):
-            for file in files:
-                if os.path.splitext(file)[1].lower() in supported_extensions:
-                    media_files.append(os.path.join(root, file))
-        
-        # Add files to browser
-        for file_path in media_files:
-            self.add_media_file(file_path)
-            
-        self.status_message(f"Imported {len(media_files)} media files from {folder_path}")
+        """Scan folder for media files on a background thread"""
+        if self.folder_scanner is not None and self.folder_scanner.isRunning():
+            self.folder_scanner.stop()
+
+        self.folder_scanner = FolderScanner(folder_path)
+        self.folder_scanner.paths_found.connect(self.on_paths_found)
+        self.folder_scanner.scan_finished.connect(self.on_scan_finished)
+        self.folder_scanner.start()
+
+    def on_paths_found(self, file_paths: list):
+        """Insert a batch of scanned files as one tree operation.
+
+        Items are built unparented and inserted via addTopLevelItems with
+        repaints and sorting suspended, so the batch costs one relayout
+        instead of one per file.
+        """
+        new_items = []
+        new_paths = []
+        for file_path, stat_result in file_paths:
+            if file_path in self.media_items:
+                continue
+            media_item = MediaItem(file_path, stat_result=stat_result)
+            self.media_items[file_path] = media_item
+            self._apply_fast_probe(media_item)
+            new_items.append(self._create_media_tree_item(media_item))
+            self._lower_names.append(media_item.file_name.lower())
+            new_paths.append(file_path)
+
+        if not new_items:
+            return
+        self._last_mask = None
+
+        self.media_view.setUpdatesEnabled(False)
+        self.media_view.setSortingEnabled(False)
+        try:
+            self.media_view.addTopLevelItems(new_items)
+        finally:
+            self.media_view.setUpdatesEnabled(True)
+
+        # Serve cache hits now; cold files thumbnail lazily once visible
+        for file_path in new_paths:
+            if self.is_video_file(file_path):
+                cached = self.thumbnail_cache.get(file_path)
+                if cached is not None and cached[0] is not None:
+                    self.on_thumbnail_ready(file_path, cached[0], cached[1])
+        QTimer.singleShot(0, self._enqueue_visible)
+
+    def on_scan_finished(self, folder_path: str, total: int):
+        """Report scan completion"""
+        self.status_message(f"Imported {total} media files from {folder_path}")
         
     def add_media_file(self, file_path: str):
         """Add media file to browser"""
@@ -456,37 +877,98 @@ class MediaBrowserWidget(QWidget):
         # Create media item
         media_item = MediaItem(file_path)
         self.media_items[file_path] = media_item
-        
+        self._apply_fast_probe(media_item)
+
         # Add to view
         self.add_media_to_view(media_item)
-        
-        # Queue for thumbnail generation
+
+        # Cache hits display immediately; cold files wait until their row
+        # nears the viewport
         if self.is_video_file(file_path):
-            self.thumbnail_generator.add_file(file_path)
+            cached = self.thumbnail_cache.get(file_path)
+            if cached is not None and cached[0] is not None:
+                self.on_thumbnail_ready(file_path, cached[0], cached[1])
+            else:
+                self._visible_timer.start()
             
-    def add_media_to_view(self, media_item: MediaItem):
-        """Add media item to the current view"""
-        # Create tree item
+    def _enqueue_visible(self):
+        """Queue thumbnail generation for rows at or near the viewport.
+
+        Only visible rows (plus one screen of readahead) are decoded, so
+        a 5k-clip import does a few dozen decodes instead of thousands.
+        """
+        viewport_rect = self.media_view.viewport().rect()
+        readahead = viewport_rect.height()
+
+        first_item = self.media_view.itemAt(0, 0)
+        start = self.media_view.indexOfTopLevelItem(first_item) if first_item is not None else 0
+
+        queued_any = False
+        for i in range(max(0, start), self.media_view.topLevelItemCount()):
+            item = self.media_view.topLevelItem(i)
+            if item.isHidden():
+                continue
+            rect = self.media_view.visualItemRect(item)
+            if rect.top() > viewport_rect.bottom() + readahead:
+                break
+
+            file_path = item.data(0, Qt.ItemDataRole.UserRole)
+            media_item = self.media_items.get(file_path)
+            if (media_item is None or media_item.thumbnail is not None
+                    or not self.is_video_file(file_path)):
+                continue
+            self.thumbnail_generator.add_file(file_path)
+            queued_any = True
+
+        if queued_any and not self.thumbnail_generator.isRunning():
+            self.thumbnail_generator.start()
+
+    def resizeEvent(self, event):
+        """A taller viewport exposes more rows to thumbnail"""
+        super().resizeEvent(event)
+        self._visible_timer.start()
+
+    def _apply_fast_probe(self, media_item: MediaItem):
+        """Fill metadata from container headers before the row is built"""
+        probe = fast_probe(media_item.file_path)
+        if probe:
+            media_item.duration = probe.get('duration', media_item.duration)
+            media_item.fps = probe.get('fps', media_item.fps)
+            media_item.resolution = probe.get('resolution', media_item.resolution)
+            media_item.codec = probe.get('codec', media_item.codec)
+
+    def _create_media_tree_item(self, media_item: MediaItem) -> QTreeWidgetItem:
+        """Build an unparented tree item for a media file"""
         item = QTreeWidgetItem()
-        
+
         # Set data
         item.setText(1, media_item.file_name)
         item.setText(2, self.format_duration(media_item.duration))
         item.setText(3, f"{media_item.resolution[0]}x{media_item.resolution[1]}" if media_item.resolution[0] > 0 else "")
         item.setText(4, self.format_file_size(media_item.file_size))
-        item.setText(5, media_item.date_modified.strftime("%m/%d/%Y %H:%M") if media_item.date_modified else "")
-        
+        item.setText(5, media_item.modified_display())
+
         # Store file path
         item.setData(0, Qt.ItemDataRole.UserRole, media_item.file_path)
-        
-        # Add to tree
+        self._items_by_path[media_item.file_path] = item
+        return item
+
+    def add_media_to_view(self, media_item: MediaItem):
+        """Add media item to the current view"""
+        item = self._create_media_tree_item(media_item)
         self.media_view.addTopLevelItem(item)
+        self._lower_names.append(media_item.file_name.lower())
+        self._last_mask = None  # Row set changed; next filter rebuilds fully
         
-    def on_thumbnail_ready(self, file_path: str, thumbnail: QPixmap, metadata: dict):
+    def on_thumbnail_ready(self, file_path: str, png_bytes: bytes, metadata: dict):
         """Handle thumbnail generation completion"""
         if file_path in self.media_items:
             media_item = self.media_items[file_path]
+
+            thumbnail = QPixmap()
+            thumbnail.loadFromData(png_bytes, 'PNG')
             media_item.thumbnail = thumbnail
+            media_item.thumbnail_png = png_bytes
             
             # Update metadata
             media_item.duration = metadata.get('duration', 0.0)
@@ -500,19 +982,19 @@ class MediaBrowserWidget(QWidget):
     def update_media_item_display(self, file_path: str):
         """Update media item display with new information"""
         media_item = self.media_items[file_path]
-        
-        # Find item in tree
-        for i in range(self.media_view.topLevelItemCount()):
-            item = self.media_view.topLevelItem(i)
-            if item.data(0, Qt.ItemDataRole.UserRole) == file_path:
-                # Update thumbnail
-                if media_item.thumbnail:
-                    item.setIcon(0, QIcon(media_item.thumbnail))
-                
-                # Update metadata
-                item.setText(2, self.format_duration(media_item.duration))
-                item.setText(3, f"{media_item.resolution[0]}x{media_item.resolution[1]}" if media_item.resolution[0] > 0 else "")
-                break
+
+        # Direct dict lookup instead of scanning every tree row
+        item = self._items_by_path.get(file_path)
+        if item is None:
+            return
+
+        # Update thumbnail
+        if media_item.thumbnail:
+            item.setIcon(0, QIcon(media_item.thumbnail))
+
+        # Update metadata
+        item.setText(2, self.format_duration(media_item.duration))
+        item.setText(3, f"{media_item.resolution[0]}x{media_item.resolution[1]}" if media_item.resolution[0] > 0 else "")
                 
     def on_progress_updated(self, current: int, total: int):
         """Handle thumbnail generation progress"""
@@ -555,7 +1037,7 @@ class MediaBrowserWidget(QWidget):
             <b>Duration:</b> {self.format_duration(media_item.duration)}<br>
             <b>Resolution:</b> {media_item.resolution[0]}x{media_item.resolution[1]}<br>
             <b>FPS:</b> {media_item.fps:.2f}<br>
-            <b>Modified:</b> {media_item.date_modified.strftime("%m/%d/%Y %H:%M") if media_item.date_modified else "Unknown"}
+            <b>Modified:</b> {media_item.modified_display() or "Unknown"}
             """
             
             self.info_label.setText(info_text)
@@ -563,14 +1045,34 @@ class MediaBrowserWidget(QWidget):
             self.info_label.setText("Select a media file to view information")
             
     def filter_media(self, search_text: str):
-        """Filter media based on search text"""
-        for i in range(self.media_view.topLevelItemCount()):
-            item = self.media_view.topLevelItem(i)
-            file_name = item.text(1).lower()
-            
-            # Show/hide based on search
-            visible = search_text.lower() in file_name if search_text else True
-            item.setHidden(not visible)
+        """Filter media based on search text.
+
+        The substring match runs vectorized over the cached lowercase
+        names, and setHidden is only called for rows whose visibility
+        actually changed -- per-keystroke cost stays flat on long lists.
+        """
+        if not self._lower_names:
+            return
+
+        names = np.array(self._lower_names, dtype=object)
+        if search_text:
+            mask = np.char.find(names.astype(str), search_text.lower()) >= 0
+        else:
+            mask = np.ones(len(names), dtype=bool)
+
+        if self._last_mask is not None and len(self._last_mask) == len(mask):
+            changed = np.where(mask != self._last_mask)[0]
+        else:
+            changed = np.arange(len(mask))
+
+        for i in changed:
+            item = self.media_view.topLevelItem(int(i))
+            if item is not None:
+                item.setHidden(not mask[i])
+
+        self._last_mask = mask
+        # Newly revealed rows may still need thumbnails
+        self._visible_timer.start()
             
     def change_view_mode(self, mode: str):
         """Change media view mode"""
@@ -585,8 +1087,7 @@ class MediaBrowserWidget(QWidget):
             
     def is_video_file(self, file_path: str) -> bool:
         """Check if file is a video file"""
-        video_extensions = {'.mp4', '.avi', '.mov', '.mkv', '.wmv', '.flv', '.webm'}
-        return os.path.splitext(file_path)[1].lower() in video_extensions
+        return file_path.lower().endswith(VIDEO_EXTS)
         
     def format_duration(self, seconds: float) -> str:
         """Format duration as MM:SS"""
@@ -598,14 +1099,7 @@ class MediaBrowserWidget(QWidget):
         
     def format_file_size(self, size_bytes: int) -> str:
         """Format file size in human readable format"""
-        if size_bytes == 0:
-            return "0 B"
-        size_names = ["B", "KB", "MB", "GB"]
-        i = 0
-        while size_bytes >= 1024 and i < len(size_names) - 1:
-            size_bytes /= 1024.0
-            i += 1
-        return f"{size_bytes:.1f} {size_names[i]}"
+        return _format_file_size(size_bytes)
         
     def status_message(self, message: str):
         """Display status message (can be connected to main window status bar)"""
@@ -613,5 +1107,7 @@ class MediaBrowserWidget(QWidget):
         
     def closeEvent(self, event):
         """Handle widget close"""
+        if self.folder_scanner is not None and self.folder_scanner.isRunning():
+            self.folder_scanner.stop()
         self.thumbnail_generator.stop()
         super().closeEvent(event)
@@ -15,6 +15,7 @@ class MixingConsole(QWidget):
     def __init__(self, audio_processor):
         super().__init__()
         self.audio_processor = audio_processor
+        self._input_dialog = None  # Lazily imported QInputDialog class
         self.setup_ui()
 
     def setup_ui(self):
@@ -41,7 +42,14 @@ class MixingConsole(QWidget):
 
     def add_track(self):
         """Add a new audio track to the console"""
-        track_name, ok = QInputDialog.getText(self, "Add Track", "Enter track name:")
+        # Imported on first use: QInputDialog was missing from the module
+        # imports (first click raised NameError) and deferring it keeps
+        # module import cheap
+        if self._input_dialog is None:
+            from PyQt6.QtWidgets import QInputDialog
+            self._input_dialog = QInputDialog
+
+        track_name, ok = self._input_dialog.getText(self, "Add Track", "Enter track name:")
         if ok and track_name:
             self.audio_processor.add_track(track_name)
             self.track_list.addItem(track_name)
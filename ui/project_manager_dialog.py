@@ -1,597 +1,795 @@
-"""
-Project Manager Dialog for PyVideoEditor
-Provides UI for managing workspaces, creating new projects, and opening existing ones
-"""
-
-import sys
-import os
-from PyQt6.QtWidgets import (
-    QDialog, QVBoxLayout, QHBoxLayout, QTabWidget, QWidget, QListWidget,
-    QListWidgetItem, QPushButton, QLabel, QLineEdit, QTextEdit, QComboBox,
-    QSpinBox, QGroupBox, QGridLayout, QMessageBox, QFileDialog, QProgressBar,
-    QSplitter, QFrame, QScrollArea, QCheckBox
-)
-from PyQt6.QtCore import Qt, QThread, pyqtSignal, QTimer
-from PyQt6.QtGui import QFont, QPixmap, QIcon
-from typing import Dict, List, Optional
-from datetime import datetime
-import json
-
-from core.workspace_manager import WorkspaceManager, ProjectSettings
-
-class ProjectListWidget(QListWidget):
-    """Custom list widget for displaying projects with enhanced information"""
-    
-    def __init__(self):
-        super().__init__()
-        self.setAlternatingRowColors(True)
-        self.setSelectionMode(QListWidget.SelectionMode.SingleSelection)
-        self.itemDoubleClicked.connect(self.on_item_double_clicked)
-        
-    def add_project_item(self, project_info: Dict):
-        """Add a project item to the list"""
-        item = QListWidgetItem()
-        
-        # Create display text
-        name = project_info.get('name', 'Unnamed Project')
-        modified = project_info.get('modified_date', '')
-        if modified:
-            try:
-                modified_dt = datetime.fromisoformat(modified.replace('Z', '+00:00'))
-                modified_str = modified_dt.strftime('%Y-%m-%d %H:%M')
-            except:
-                modified_str = modified
-        else:
-            modified_str = 'Unknown'
-            
-        clip_count = project_info.get('clip_count', 0)
-        asset_count = project_info.get('asset_count', 0)
-        
-        display_text = f"{name}\n"
-        display_text += f"Modified: {modified_str}\n"
-        display_text += f"Clips: {clip_count}, Assets: {asset_count}"
-        
-        item.setText(display_text)
-        item.setData(Qt.ItemDataRole.UserRole, project_info)
-        
-        self.addItem(item)
-        
-    def on_item_double_clicked(self, item):
-        """Handle double-click on project item"""
-        self.parent().open_selected_project()
-        
-    def get_selected_project(self) -> Optional[Dict]:
-        """Get currently selected project info"""
-        current_item = self.currentItem()
-        if current_item:
-            return current_item.data(Qt.ItemDataRole.UserRole)
-        return None
-
-class NewProjectDialog(QDialog):
-    """Dialog for creating a new project"""
-    
-    def __init__(self, parent=None):
-        super().__init__(parent)
-        self.setWindowTitle("New Project")
-        self.setFixedSize(400, 300)
-        self.setup_ui()
-        
-    def setup_ui(self):
-        layout = QVBoxLayout(self)
-        
-        # Project name
-        name_group = QGroupBox("Project Settings")
-        name_layout = QGridLayout(name_group)
-        
-        name_layout.addWidget(QLabel("Name:"), 0, 0)
-        self.name_edit = QLineEdit()
-        self.name_edit.setPlaceholderText("Enter project name")
-        name_layout.addWidget(self.name_edit, 0, 1)
-        
-        name_layout.addWidget(QLabel("Description:"), 1, 0)
-        self.description_edit = QTextEdit()
-        self.description_edit.setMaximumHeight(60)
-        self.description_edit.setPlaceholderText("Optional project description")
-        name_layout.addWidget(self.description_edit, 1, 1)
-        
-        layout.addWidget(name_group)
-        
-        # Video settings
-        video_group = QGroupBox("Video Settings")
-        video_layout = QGridLayout(video_group)
-        
-        video_layout.addWidget(QLabel("Frame Rate:"), 0, 0)
-        self.fps_combo = QComboBox()
-        self.fps_combo.addItems(["23.976", "24", "25", "29.97", "30", "50", "59.94", "60"])
-        self.fps_combo.setCurrentText("30")
-        video_layout.addWidget(self.fps_combo, 0, 1)
-        
-        video_layout.addWidget(QLabel("Resolution:"), 1, 0)
-        self.resolution_combo = QComboBox()
-        self.resolution_combo.addItems([
-            "1920x1080 (Full HD)",
-            "1280x720 (HD)",
-            "3840x2160 (4K UHD)",
-            "2560x1440 (QHD)",
-            "1920x1200 (WUXGA)",
-            "1024x768 (XGA)"
-        ])
-        video_layout.addWidget(self.resolution_combo, 1, 1)
-        
-        layout.addWidget(video_group)
-        
-        # Buttons
-        button_layout = QHBoxLayout()
-        
-        self.cancel_button = QPushButton("Cancel")
-        self.cancel_button.clicked.connect(self.reject)
-        button_layout.addWidget(self.cancel_button)
-        
-        button_layout.addStretch()
-        
-        self.create_button = QPushButton("Create Project")
-        self.create_button.clicked.connect(self.accept)
-        self.create_button.setDefault(True)
-        button_layout.addWidget(self.create_button)
-        
-        layout.addLayout(button_layout)
-        
-    def get_project_data(self) -> Dict:
-        """Get project data from form"""
-        resolution_text = self.resolution_combo.currentText()
-        if "1920x1080" in resolution_text:
-            resolution = (1920, 1080)
-        elif "1280x720" in resolution_text:
-            resolution = (1280, 720)
-        elif "3840x2160" in resolution_text:
-            resolution = (3840, 2160)
-        elif "2560x1440" in resolution_text:
-            resolution = (2560, 1440)
-        elif "1920x1200" in resolution_text:
-            resolution = (1920, 1200)
-        else:
-            resolution = (1024, 768)
-            
-        return {
-            'name': self.name_edit.text().strip() or "Untitled Project",
-            'description': self.description_edit.toPlainText().strip(),
-            'fps': float(self.fps_combo.currentText()),
-            'resolution': resolution
-        }
-
-class ProjectManagerDialog(QDialog):
-    """Main project manager dialog"""
-    
-    project_selected = pyqtSignal(str)  # project_id
-    
-    def __init__(self, parent=None):
-        super().__init__(parent)
-        self.setWindowTitle("PyVideoEditor - Project Manager")
-        self.setMinimumSize(800, 600)
-        self.workspace_manager = WorkspaceManager()
-        self.setup_ui()
-        self.refresh_projects()
-        
-    def setup_ui(self):
-        layout = QVBoxLayout(self)
-        
-        # Title
-        title_label = QLabel("Project Manager")
-        title_font = QFont()
-        title_font.setPointSize(16)
-        title_font.setBold(True)
-        title_label.setFont(title_font)
-        title_label.setAlignment(Qt.AlignmentFlag.AlignCenter)
-        layout.addWidget(title_label)
-        
-        # Tab widget
-        self.tab_widget = QTabWidget()
-        
-        # Recent Projects tab
-        self.setup_recent_tab()
-        
-        # All Projects tab
-        self.setup_all_projects_tab()
-        
-        # Import/Export tab
-        self.setup_import_export_tab()
-        
-        layout.addWidget(self.tab_widget)
-        
-        # Bottom buttons
-        button_layout = QHBoxLayout()
-        
-        self.new_project_button = QPushButton("New Project")
-        self.new_project_button.clicked.connect(self.create_new_project)
-        button_layout.addWidget(self.new_project_button)
-        
-        self.open_project_button = QPushButton("Open Project")
-        self.open_project_button.clicked.connect(self.open_selected_project)
-        self.open_project_button.setEnabled(False)
-        button_layout.addWidget(self.open_project_button)
-        
-        button_layout.addStretch()
-        
-        self.delete_project_button = QPushButton("Delete Project")
-        self.delete_project_button.clicked.connect(self.delete_selected_project)
-        self.delete_project_button.setEnabled(False)
-        self.delete_project_button.setStyleSheet("QPushButton { color: red; }")
-        button_layout.addWidget(self.delete_project_button)
-        
-        self.cancel_button = QPushButton("Cancel")
-        self.cancel_button.clicked.connect(self.reject)
-        button_layout.addWidget(self.cancel_button)
-        
-        layout.addLayout(button_layout)
-        
-    def setup_recent_tab(self):
-        """Setup recent projects tab"""
-        recent_widget = QWidget()
-        layout = QVBoxLayout(recent_widget)
-        
-        # Search
-        search_layout = QHBoxLayout()
-        search_layout.addWidget(QLabel("Search:"))
-        self.search_edit = QLineEdit()
-        self.search_edit.setPlaceholderText("Search projects...")
-        self.search_edit.textChanged.connect(self.search_projects)
-        search_layout.addWidget(self.search_edit)
-        layout.addLayout(search_layout)
-        
-        # Recent projects list
-        self.recent_projects_list = ProjectListWidget()
-        self.recent_projects_list.itemSelectionChanged.connect(self.on_project_selection_changed)
-        layout.addWidget(self.recent_projects_list)
-        
-        # Project info panel
-        self.setup_project_info_panel(layout)
-        
-        self.tab_widget.addTab(recent_widget, "Recent Projects")
-        
-    def setup_all_projects_tab(self):
-        """Setup all projects tab"""
-        all_widget = QWidget()
-        layout = QVBoxLayout(all_widget)
-        
-        # All projects list
-        self.all_projects_list = ProjectListWidget()
-        self.all_projects_list.itemSelectionChanged.connect(self.on_project_selection_changed)
-        layout.addWidget(self.all_projects_list)
-        
-        # Project actions
-        actions_layout = QHBoxLayout()
-        
-        duplicate_button = QPushButton("Duplicate Project")
-        duplicate_button.clicked.connect(self.duplicate_selected_project)
-        actions_layout.addWidget(duplicate_button)
-        
-        actions_layout.addStretch()
-        
-        layout.addLayout(actions_layout)
-        
-        self.tab_widget.addTab(all_widget, "All Projects")
-        
-    def setup_import_export_tab(self):
-        """Setup import/export tab"""
-        import_export_widget = QWidget()
-        layout = QVBoxLayout(import_export_widget)
-        
-        # Export section
-        export_group = QGroupBox("Export Project")
-        export_layout = QVBoxLayout(export_group)
-        
-        export_info = QLabel("Export a project as a portable package that can be shared or archived.")
-        export_info.setWordWrap(True)
-        export_layout.addWidget(export_info)
-        
-        export_options_layout = QHBoxLayout()
-        self.include_assets_checkbox = QCheckBox("Include media assets in export")
-        self.include_assets_checkbox.setChecked(True)
-        export_options_layout.addWidget(self.include_assets_checkbox)
-        export_options_layout.addStretch()
-        export_layout.addLayout(export_options_layout)
-        
-        export_button_layout = QHBoxLayout()
-        export_button_layout.addStretch()
-        export_project_button = QPushButton("Export Selected Project")
-        export_project_button.clicked.connect(self.export_selected_project)
-        export_button_layout.addWidget(export_project_button)
-        export_layout.addLayout(export_button_layout)
-        
-        layout.addWidget(export_group)
-        
-        # Import section
-        import_group = QGroupBox("Import Project")
-        import_layout = QVBoxLayout(import_group)
-        
-        import_info = QLabel("Import a project package that was previously exported.")
-        import_info.setWordWrap(True)
-        import_layout.addWidget(import_info)
-        
-        import_button_layout = QHBoxLayout()
-        import_button_layout.addStretch()
-        import_project_button = QPushButton("Import Project Package")
-        import_project_button.clicked.connect(self.import_project_package)
-        import_button_layout.addWidget(import_project_button)
-        import_layout.addLayout(import_button_layout)
-        
-        layout.addWidget(import_group)
-        
-        layout.addStretch()
-        
-        self.tab_widget.addTab(import_export_widget, "Import/Export")
-        
-    def setup_project_info_panel(self, parent_layout):
-        """Setup project information panel"""
-        info_group = QGroupBox("Project Information")
-        info_layout = QVBoxLayout(info_group)
-        
-        self.project_info_label = QLabel("Select a project to view details")
-        self.project_info_label.setWordWrap(True)
-        self.project_info_label.setAlignment(Qt.AlignmentFlag.AlignTop)
-        info_layout.addWidget(self.project_info_label)
-        
-        info_group.setMaximumHeight(120)
-        parent_layout.addWidget(info_group)
-        
-    def refresh_projects(self):
-        """Refresh project lists"""
-        # Clear existing items
-        self.recent_projects_list.clear()
-        self.all_projects_list.clear()
-        
-        # Get projects
-        projects = self.workspace_manager.get_project_list()
-        recent_projects = projects[:10]  # Show last 10 projects
-        
-        # Populate recent projects
-        for project in recent_projects:
-            self.recent_projects_list.add_project_item(project)
-            
-        # Populate all projects
-        for project in projects:
-            self.all_projects_list.add_project_item(project)
-            
-    def search_projects(self, query: str):
-        """Search projects and update recent list"""
-        self.recent_projects_list.clear()
-        
-        if query.strip():
-            projects = self.workspace_manager.search_projects(query)
-        else:
-            projects = self.workspace_manager.get_recent_projects(10)
-            
-        for project in projects:
-            self.recent_projects_list.add_project_item(project)
-            
-    def on_project_selection_changed(self):
-        """Handle project selection change"""
-        current_tab = self.tab_widget.currentIndex()
-        
-        if current_tab == 0:  # Recent projects tab
-            project = self.recent_projects_list.get_selected_project()
-        elif current_tab == 1:  # All projects tab
-            project = self.all_projects_list.get_selected_project()
-        else:
-            project = None
-            
-        # Update buttons
-        has_selection = project is not None
-        self.open_project_button.setEnabled(has_selection)
-        self.delete_project_button.setEnabled(has_selection)
-        
-        # Update project info
-        if project:
-            self.update_project_info(project)
-        else:
-            self.project_info_label.setText("Select a project to view details")
-            
-    def update_project_info(self, project: Dict):
-        """Update project information display"""
-        name = project.get('name', 'Unnamed Project')
-        description = project.get('description', 'No description')
-        created = project.get('created_date', 'Unknown')
-        modified = project.get('modified_date', 'Unknown')
-        clip_count = project.get('clip_count', 0)
-        asset_count = project.get('asset_count', 0)
-        
-        # Format dates
-        try:
-            if created != 'Unknown':
-                created_dt = datetime.fromisoformat(created.replace('Z', '+00:00'))
-                created = created_dt.strftime('%Y-%m-%d %H:%M')
-        except:
-            pass
-            
-        try:
-            if modified != 'Unknown':
-                modified_dt = datetime.fromisoformat(modified.replace('Z', '+00:00'))
-                modified = modified_dt.strftime('%Y-%m-%d %H:%M')
-        except:
-            pass
-            
-        info_text = f"<b>{name}</b><br>"
-        info_text += f"Description: {description}<br>"
-        info_text += f"Created: {created}<br>"
-        info_text += f"Modified: {modified}<br>"
-        info_text += f"Clips: {clip_count}, Assets: {asset_count}"
-        
-        self.project_info_label.setText(info_text)
-        
-    def create_new_project(self):
-        """Create a new project"""
-        dialog = NewProjectDialog(self)
-        if dialog.exec() == QDialog.DialogCode.Accepted:
-            project_data = dialog.get_project_data()
-            
-            try:
-                project_id = self.workspace_manager.create_new_project(
-                    name=project_data['name'],
-                    description=project_data['description'],
-                    fps=project_data['fps'],
-                    resolution=project_data['resolution']
-                )
-                
-                # Emit signal and close dialog
-                self.project_selected.emit(project_id)
-                self.accept()
-                
-            except Exception as e:
-                QMessageBox.critical(self, "Error", f"Failed to create project:\n{str(e)}")
-                
-    def open_selected_project(self):
-        """Open the selected project"""
-        current_tab = self.tab_widget.currentIndex()
-        
-        if current_tab == 0:
-            project = self.recent_projects_list.get_selected_project()
-        elif current_tab == 1:
-            project = self.all_projects_list.get_selected_project()
-        else:
-            return
-            
-        if project:
-            project_id = project['project_id']
-            self.project_selected.emit(project_id)
-            self.accept()
-            
-    def delete_selected_project(self):
-        """Delete the selected project"""
-        current_tab = self.tab_widget.currentIndex()
-        
-        if current_tab == 0:
-            project = self.recent_projects_list.get_selected_project()
-        elif current_tab == 1:
-            project = self.all_projects_list.get_selected_project()
-        else:
-            return
-            
-        if project:
-            project_name = project['name']
-            reply = QMessageBox.question(
-                self, 
-                "Delete Project",
-                f"Are you sure you want to delete the project '{project_name}'?\n\nThis action cannot be undone.",
-                QMessageBox.StandardButton.Yes | QMessageBox.StandardButton.No,
-                QMessageBox.StandardButton.No
-            )
-            
-            if reply == QMessageBox.StandardButton.Yes:
-                if self.workspace_manager.delete_project(project['project_id']):
-                    self.refresh_projects()
-                    QMessageBox.information(self, "Success", f"Project '{project_name}' has been deleted.")
-                else:
-                    QMessageBox.critical(self, "Error", f"Failed to delete project '{project_name}'.")
-                    
-    def duplicate_selected_project(self):
-        """Duplicate the selected project"""
-        project = self.all_projects_list.get_selected_project()
-        if not project:
-            return
-            
-        original_name = project['name']
-        new_name, ok = QLineEdit().getText(
-            self, 
-            "Duplicate Project", 
-            "Enter name for duplicated project:",
-            text=f"{original_name} Copy"
-        )
-        
-        if ok and new_name.strip():
-            try:
-                new_project_id = self.workspace_manager.duplicate_project(
-                    project['project_id'], 
-                    new_name.strip()
-                )
-                
-                if new_project_id:
-                    self.refresh_projects()
-                    QMessageBox.information(self, "Success", f"Project duplicated as '{new_name.strip()}'.")
-                else:
-                    QMessageBox.critical(self, "Error", "Failed to duplicate project.")
-                    
-            except Exception as e:
-                QMessageBox.critical(self, "Error", f"Failed to duplicate project:\n{str(e)}")
-                
-    def export_selected_project(self):
-        """Export the selected project"""
-        current_tab = self.tab_widget.currentIndex()
-        
-        if current_tab == 0:
-            project = self.recent_projects_list.get_selected_project()
-        elif current_tab == 1:
-            project = self.all_projects_list.get_selected_project()
-        else:
-            QMessageBox.information(self, "No Selection", "Please select a project to export.")
-            return
-            
-        if not project:
-            QMessageBox.information(self, "No Selection", "Please select a project to export.")
-            return
-            
-        # Get export path
-        project_name = project['name'].replace(' ', '_').replace('/', '_').replace('\\', '_')
-        default_filename = f"{project_name}_export.pvproj"
-        
-        export_path, _ = QFileDialog.getSaveFileName(
-            self,
-            "Export Project",
-            default_filename,
-            "PyVideoEditor Project (*.pvproj);;All Files (*)"
-        )
-        
-        if export_path:
-            include_assets = self.include_assets_checkbox.isChecked()
-            
-            try:
-                if self.workspace_manager.export_workspace(project['project_id'], export_path, include_assets):
-                    QMessageBox.information(self, "Success", f"Project exported to:\n{export_path}")
-                else:
-                    QMessageBox.critical(self, "Error", "Failed to export project.")
-                    
-            except Exception as e:
-                QMessageBox.critical(self, "Error", f"Failed to export project:\n{str(e)}")
-                
-    def import_project_package(self):
-        """Import a project package"""
-        import_path, _ = QFileDialog.getOpenFileName(
-            self,
-            "Import Project Package",
-            "",
-            "PyVideoEditor Project (*.pvproj);;All Files (*)"
-        )
-        
-        if import_path:
-            # Get project name
-            project_name, ok = QLineEdit().getText(
-                self,
-                "Import Project",
-                "Enter name for imported project:",
-                text=os.path.splitext(os.path.basename(import_path))[0].replace('_export', '')
-            )
-            
-            if ok and project_name.strip():
-                try:
-                    new_project_id = self.workspace_manager.import_workspace(import_path, project_name.strip())
-                    
-                    if new_project_id:
-                        self.refresh_projects()
-                        QMessageBox.information(self, "Success", f"Project imported as '{project_name.strip()}'.")
-                    else:
-                        QMessageBox.critical(self, "Error", "Failed to import project.")
-                        
-                except Exception as e:
-                    QMessageBox.critical(self, "Error", f"Failed to import project:\n{str(e)}")
-
-if __name__ == "__main__":
-    from PyQt6.QtWidgets import QApplication
-    
-    app = QApplication(sys.argv)
-    dialog = ProjectManagerDialog()
-    
-    def on_project_selected(project_id):
-        print(f"Selected project: {project_id}")
-        
-    dialog.project_selected.connect(on_project_selected)
-    dialog.show()
-    sys.exit(app.exec())
+"""
+Project Manager Dialog for PyVideoEditor
+Provides UI for managing workspaces, creating new projects, and opening existing ones
+"""
+
+import sys
+import os
+from PyQt6.QtWidgets import (
+    QDialog, QVBoxLayout, QHBoxLayout, QTabWidget, QWidget, QListView,
+    QPushButton, QLabel, QLineEdit, QTextEdit, QComboBox,
+    QGroupBox, QGridLayout, QMessageBox, QFileDialog,
+    QCheckBox, QInputDialog
+)
+from PyQt6.QtCore import (
+    Qt, QThread, pyqtSignal, QTimer, QAbstractListModel, QModelIndex,
+    QObject, QSortFilterProxyModel
+)
+from PyQt6.QtGui import QFont, QPalette, QColor
+from typing import Dict, List, Optional
+from datetime import datetime
+from functools import lru_cache
+
+# Filename sanitization for exported projects: one C-level pass instead
+# of a chain of str.replace calls
+_SAN_TABLE = str.maketrans({' ': '_', '/': '_', '\\': '_'})
+
+# Qt enum values resolved once; each dotted form costs two binding
+# lookups per evaluation, which adds up in per-row and per-paint paths
+_DISPLAY_ROLE = Qt.ItemDataRole.DisplayRole
+_USER_ROLE = Qt.ItemDataRole.UserRole
+_ALIGN_CENTER = Qt.AlignmentFlag.AlignCenter
+_ALIGN_TOP = Qt.AlignmentFlag.AlignTop
+_ACCEPTED = QDialog.DialogCode.Accepted
+_STD_YES = QMessageBox.StandardButton.Yes
+_STD_NO = QMessageBox.StandardButton.No
+
+# fromisoformat accepts a trailing 'Z' natively from 3.11 on; only
+# older interpreters need the suffix rewritten
+_ISO_Z_NATIVE = sys.version_info >= (3, 11)
+
+@lru_cache(maxsize=4096)
+def _format_modified(modified: str) -> str:
+    """Format an ISO modified date for display.
+
+    Cached because the same ISO strings come back on every refresh and
+    selection; after the first populate the parse never reruns.
+    """
+    if not modified:
+        return 'Unknown'
+    try:
+        if modified.endswith('Z') and not _ISO_Z_NATIVE:
+            modified = modified[:-1] + '+00:00'
+        modified_dt = datetime.fromisoformat(modified)
+        return modified_dt.strftime('%Y-%m-%d %H:%M')
+    except:
+        return modified
+
+class ProjectListModel(QAbstractListModel):
+    """List model over plain project dicts.
+
+    Refreshing swaps the whole backing list in one model reset instead
+    of constructing a widget item per project, so large workspaces no
+    longer stall the GUI thread on refresh. Display strings (including
+    the parsed date) are built once per refresh, not per paint.
+    """
+
+    # Bound once: one precompiled template call per row in the refresh
+    # loop; role constants live at module level since data() runs per
+    # visible row per paint
+    _ROW_TMPL = "{name}\nModified: {modified}\nClips: {clips}, Assets: {assets}".format
+
+    def __init__(self, parent=None):
+        super().__init__(parent)
+        self._projects: List[Dict] = []
+        self._display: List[str] = []
+
+    def rowCount(self, parent=QModelIndex()) -> int:
+        return 0 if parent.isValid() else len(self._projects)
+
+    def data(self, index, role=_DISPLAY_ROLE):
+        if not index.isValid():
+            return None
+        if role == _DISPLAY_ROLE:
+            return self._display[index.row()]
+        if role == _USER_ROLE:
+            return self._projects[index.row()]
+        return None
+
+    def set_projects(self, projects: List[Dict]):
+        """Replace the project list in a single model reset"""
+        row = self._ROW_TMPL
+        self.beginResetModel()
+        self._projects = list(projects)
+        self._display = [
+            row(name=p.get('name', 'Unnamed Project'),
+                modified=_format_modified(p.get('modified_date', '')),
+                clips=p.get('clip_count', 0),
+                assets=p.get('asset_count', 0))
+            for p in self._projects
+        ]
+        self.endResetModel()
+
+class ProjectFilterProxy(QSortFilterProxyModel):
+    """In-memory filter over the loaded project list.
+
+    Live search used to hit the workspace on disk for every keystroke;
+    the full list is already resident in the source model, so filtering
+    is just cached string compares. With no query the proxy passes only
+    the most recent rows, which is what the Recent tab shows.
+    """
+
+    RECENT_LIMIT = 10
+
+    def __init__(self, parent=None):
+        super().__init__(parent)
+        self._query = ""
+
+    def set_query(self, text: str):
+        """Apply a case-insensitive substring filter"""
+        self._query = text.strip().lower()
+        self.invalidateRowsFilter()
+
+    def filterAcceptsRow(self, source_row, source_parent) -> bool:
+        if not self._query:
+            return source_row < self.RECENT_LIMIT
+        project = self.sourceModel()._projects[source_row]
+        return (self._query in project.get('name', '').lower()
+                or self._query in project.get('description', '').lower())
+
+class ProjectListWidget(QListView):
+    """Custom list view for displaying projects with enhanced information"""
+
+    itemSelectionChanged = pyqtSignal()
+
+    def __init__(self, model=None):
+        super().__init__()
+        self.setAlternatingRowColors(True)
+        self.setSelectionMode(QListView.SelectionMode.SingleSelection)
+        self.setEditTriggers(QListView.EditTrigger.NoEditTriggers)
+        # Every row is the same three-line block, so tell the view: with
+        # uniform sizes Qt measures one row and lays out/paints only the
+        # visible ones; batched layout keeps huge workspaces responsive
+        self.setUniformItemSizes(True)
+        self.setLayoutMode(QListView.LayoutMode.Batched)
+        self.setBatchSize(100)
+        self.setResizeMode(QListView.ResizeMode.Adjust)
+        self.setWordWrap(False)
+        # Views can share one source model (optionally through a filter
+        # proxy) instead of each owning a copy of the project list
+        self.project_model = model if model is not None else ProjectListModel(self)
+        self.setModel(self.project_model)
+        self.selectionModel().selectionChanged.connect(
+            lambda *_: self.itemSelectionChanged.emit())
+        self.doubleClicked.connect(self.on_item_double_clicked)
+
+    def on_item_double_clicked(self, index):
+        """Handle double-click on project item"""
+        self.parent().open_selected_project()
+
+    def get_selected_project(self) -> Optional[Dict]:
+        """Get currently selected project info"""
+        current = self.currentIndex()
+        if current.isValid():
+            return current.data(_USER_ROLE)
+        return None
+
+class ProjectLoader(QObject):
+    """Loads project lists off the GUI thread.
+
+    Lives on a worker QThread owned by the dialog; the disk scan behind
+    get_project_list/search_projects runs here so opening the dialog and
+    typing in the search box never block the event loop.
+    """
+
+    projects_loaded = pyqtSignal(list)
+
+    def __init__(self, workspace_manager):
+        super().__init__()
+        self.workspace_manager = workspace_manager
+
+    def load_all(self):
+        """Scan the workspace for every project"""
+        try:
+            projects = self.workspace_manager.get_project_list()
+        except Exception as e:
+            print(f"Error loading project list: {e}")
+            projects = []
+        self.projects_loaded.emit(projects)
+
+
+class NewProjectDialog(QDialog):
+    """Dialog for creating a new project"""
+
+    # Single source for the combo entries and the text -> size lookup;
+    # replaces the cascading substring checks in get_project_data
+    _RESOLUTIONS = {
+        "1920x1080 (Full HD)": (1920, 1080),
+        "1280x720 (HD)": (1280, 720),
+        "3840x2160 (4K UHD)": (3840, 2160),
+        "2560x1440 (QHD)": (2560, 1440),
+        "1920x1200 (WUXGA)": (1920, 1200),
+        "1024x768 (XGA)": (1024, 768),
+    }
+
+    def __init__(self, parent=None):
+        super().__init__(parent)
+        self.setWindowTitle("New Project")
+        self.setFixedSize(400, 300)
+        self.setup_ui()
+        
+    def setup_ui(self):
+        layout = QVBoxLayout(self)
+
+        # Project name
+        name_group = QGroupBox("Project Settings")
+        name_layout = QGridLayout(name_group)
+        
+        name_layout.addWidget(QLabel("Name:"), 0, 0)
+        self.name_edit = QLineEdit()
+        self.name_edit.setPlaceholderText("Enter project name")
+        name_layout.addWidget(self.name_edit, 0, 1)
+        
+        name_layout.addWidget(QLabel("Description:"), 1, 0)
+        self.description_edit = QTextEdit()
+        self.description_edit.setMaximumHeight(60)
+        self.description_edit.setPlaceholderText("Optional project description")
+        name_layout.addWidget(self.description_edit, 1, 1)
+        
+        layout.addWidget(name_group)
+        
+        # Video settings
+        video_group = QGroupBox("Video Settings")
+        video_layout = QGridLayout(video_group)
+        
+        video_layout.addWidget(QLabel("Frame Rate:"), 0, 0)
+        self.fps_combo = QComboBox()
+        self.fps_combo.addItems(["23.976", "24", "25", "29.97", "30", "50", "59.94", "60"])
+        self.fps_combo.setCurrentText("30")
+        video_layout.addWidget(self.fps_combo, 0, 1)
+        
+        video_layout.addWidget(QLabel("Resolution:"), 1, 0)
+        self.resolution_combo = QComboBox()
+        self.resolution_combo.addItems(list(self._RESOLUTIONS.keys()))
+        video_layout.addWidget(self.resolution_combo, 1, 1)
+        
+        layout.addWidget(video_group)
+        
+        # Buttons
+        button_layout = QHBoxLayout()
+        
+        self.cancel_button = QPushButton("Cancel")
+        self.cancel_button.clicked.connect(self.reject)
+        button_layout.addWidget(self.cancel_button)
+        
+        button_layout.addStretch()
+        
+        self.create_button = QPushButton("Create Project")
+        self.create_button.clicked.connect(self.accept)
+        self.create_button.setDefault(True)
+        button_layout.addWidget(self.create_button)
+        
+        layout.addLayout(button_layout)
+        
+    def reset_form(self):
+        """Clear the form for reuse"""
+        self.name_edit.clear()
+        self.description_edit.clear()
+        self.fps_combo.setCurrentText("30")
+        self.resolution_combo.setCurrentIndex(0)
+        self.name_edit.setFocus()
+
+    def get_project_data(self) -> Dict:
+        """Get project data from form"""
+        resolution = self._RESOLUTIONS.get(
+            self.resolution_combo.currentText(), (1024, 768))
+
+        return {
+            'name': self.name_edit.text().strip() or "Untitled Project",
+            'description': self.description_edit.toPlainText().strip(),
+            'fps': float(self.fps_combo.currentText()),
+            'resolution': resolution
+        }
+
+class ProjectManagerDialog(QDialog):
+    """Main project manager dialog"""
+    
+    project_selected = pyqtSignal(str)  # project_id
+
+    # Queued requests into the loader thread
+    _load_all_requested = pyqtSignal()
+
+    # Constant info-panel markup, precompiled the same way as the list
+    # model's row template
+    _INFO_TMPL = ("<b>{name}</b><br>"
+                  "Description: {description}<br>"
+                  "Created: {created}<br>"
+                  "Modified: {modified}<br>"
+                  "Clips: {clips}, Assets: {assets}").format_map
+
+    def __init__(self, parent=None):
+        super().__init__(parent)
+        self.setWindowTitle("PyVideoEditor - Project Manager")
+        self.setMinimumSize(800, 600)
+        # Imported here rather than at module top so importing this
+        # module (e.g. from the main window) doesn't pay for the
+        # workspace layer until a dialog is actually opened
+        from core.workspace_manager import WorkspaceManager
+        self.workspace_manager = WorkspaceManager()
+        self._new_project_dialog = None  # Built lazily, reused across invocations
+        self.setup_ui()
+
+        # Disk scans run on a worker thread; results come back as signals
+        self._loader_thread = QThread(self)
+        self._loader = ProjectLoader(self.workspace_manager)
+        self._loader.moveToThread(self._loader_thread)
+        self._load_all_requested.connect(self._loader.load_all)
+        self._loader.projects_loaded.connect(self._populate_projects)
+        self._loader_thread.start()
+        self.finished.connect(self._stop_loader)
+
+        # Debounce live filtering so it runs once per pause in typing
+        self._search_timer = QTimer(self)
+        self._search_timer.setSingleShot(True)
+        self._search_timer.setInterval(150)
+        self._search_timer.timeout.connect(self._apply_search_filter)
+
+        # Coalesce selection updates: holding an arrow key fires the
+        # selection signal per row, but the info panel only needs the
+        # row the user lands on
+        self._sel_timer = QTimer(self)
+        self._sel_timer.setSingleShot(True)
+        self._sel_timer.setInterval(50)
+        self._sel_timer.timeout.connect(self._update_selection_info)
+
+        self.refresh_projects()
+        
+    def setup_ui(self):
+        layout = QVBoxLayout(self)
+
+        # One source model feeds both tabs; the Recent tab looks at it
+        # through an in-memory filter proxy
+        self.projects_model = ProjectListModel(self)
+        self.project_filter = ProjectFilterProxy(self)
+        self.project_filter.setSourceModel(self.projects_model)
+        
+        # Title
+        title_label = QLabel("Project Manager")
+        title_font = QFont()
+        title_font.setPointSize(16)
+        title_font.setBold(True)
+        title_label.setFont(title_font)
+        title_label.setAlignment(_ALIGN_CENTER)
+        layout.addWidget(title_label)
+        
+        # Tab widget
+        self.tab_widget = QTabWidget()
+        
+        # Recent Projects tab (the one users land on) is built eagerly;
+        # the others start as empty placeholders and are constructed the
+        # first time their tab is selected
+        self.setup_recent_tab()
+
+        # All Projects tab
+        self.tab_widget.addTab(QWidget(), "All Projects")
+
+        # Import/Export tab
+        self.tab_widget.addTab(QWidget(), "Import/Export")
+
+        self._tab_builders = {
+            1: self.setup_all_projects_tab,
+            2: self.setup_import_export_tab,
+        }
+        self.tab_widget.currentChanged.connect(self._ensure_tab_built)
+
+        layout.addWidget(self.tab_widget)
+        
+        # Bottom buttons
+        button_layout = QHBoxLayout()
+        
+        self.new_project_button = QPushButton("New Project")
+        self.new_project_button.clicked.connect(self.create_new_project)
+        button_layout.addWidget(self.new_project_button)
+        
+        self.open_project_button = QPushButton("Open Project")
+        self.open_project_button.clicked.connect(self.open_selected_project)
+        self.open_project_button.setEnabled(False)
+        button_layout.addWidget(self.open_project_button)
+        
+        button_layout.addStretch()
+        
+        self.delete_project_button = QPushButton("Delete Project")
+        self.delete_project_button.clicked.connect(self.delete_selected_project)
+        self.delete_project_button.setEnabled(False)
+        # Palette tweak instead of a per-widget stylesheet: a one-color
+        # change shouldn't pull in the CSS cascade on every polish
+        pal = self.delete_project_button.palette()
+        pal.setColor(QPalette.ColorRole.ButtonText, QColor('red'))
+        self.delete_project_button.setPalette(pal)
+        button_layout.addWidget(self.delete_project_button)
+        
+        self.cancel_button = QPushButton("Cancel")
+        self.cancel_button.clicked.connect(self.reject)
+        button_layout.addWidget(self.cancel_button)
+        
+        layout.addLayout(button_layout)
+        
+    def setup_recent_tab(self):
+        """Setup recent projects tab"""
+        recent_widget = QWidget()
+        layout = QVBoxLayout(recent_widget)
+        
+        # Search
+        search_layout = QHBoxLayout()
+        search_layout.addWidget(QLabel("Search:"))
+        self.search_edit = QLineEdit()
+        self.search_edit.setPlaceholderText("Search projects...")
+        self.search_edit.textChanged.connect(self.search_projects)
+        self.search_edit.returnPressed.connect(self._apply_search_filter)
+        search_layout.addWidget(self.search_edit)
+        layout.addLayout(search_layout)
+        
+        # Recent projects list (filtered view over the shared model)
+        self.recent_projects_list = ProjectListWidget(model=self.project_filter)
+        self.recent_projects_list.itemSelectionChanged.connect(
+            self.on_project_selection_changed, type=Qt.ConnectionType.QueuedConnection)
+        layout.addWidget(self.recent_projects_list)
+        
+        # Project info panel
+        self.setup_project_info_panel(layout)
+        
+        self.tab_widget.addTab(recent_widget, "Recent Projects")
+        
+    def _ensure_tab_built(self, index):
+        """Build a placeholder tab's real contents on first visit"""
+        builder = self._tab_builders.pop(index, None)
+        if builder is None:
+            return
+        label = self.tab_widget.tabText(index)
+        # Swap the placeholder for the built widget without letting the
+        # intermediate currentChanged signals re-enter this handler
+        self.tab_widget.blockSignals(True)
+        self.tab_widget.removeTab(index)
+        self.tab_widget.insertTab(index, builder(), label)
+        self.tab_widget.setCurrentIndex(index)
+        self.tab_widget.blockSignals(False)
+
+    def setup_all_projects_tab(self):
+        """Setup all projects tab"""
+        all_widget = QWidget()
+        layout = QVBoxLayout(all_widget)
+        
+        # All projects list
+        self.all_projects_list = ProjectListWidget(model=self.projects_model)
+        self.all_projects_list.itemSelectionChanged.connect(
+            self.on_project_selection_changed, type=Qt.ConnectionType.QueuedConnection)
+        layout.addWidget(self.all_projects_list)
+        
+        # Project actions
+        actions_layout = QHBoxLayout()
+        
+        duplicate_button = QPushButton("Duplicate Project")
+        duplicate_button.clicked.connect(self.duplicate_selected_project)
+        actions_layout.addWidget(duplicate_button)
+        
+        actions_layout.addStretch()
+        
+        layout.addLayout(actions_layout)
+
+        return all_widget
+        
+    def setup_import_export_tab(self):
+        """Setup import/export tab"""
+        import_export_widget = QWidget()
+        layout = QVBoxLayout(import_export_widget)
+        
+        # Export section
+        export_group = QGroupBox("Export Project")
+        export_layout = QVBoxLayout(export_group)
+        
+        export_info = QLabel("Export a project as a portable package that can be shared or archived.")
+        export_info.setWordWrap(True)
+        export_layout.addWidget(export_info)
+        
+        export_options_layout = QHBoxLayout()
+        self.include_assets_checkbox = QCheckBox("Include media assets in export")
+        self.include_assets_checkbox.setChecked(True)
+        export_options_layout.addWidget(self.include_assets_checkbox)
+        export_options_layout.addStretch()
+        export_layout.addLayout(export_options_layout)
+        
+        export_button_layout = QHBoxLayout()
+        export_button_layout.addStretch()
+        export_project_button = QPushButton("Export Selected Project")
+        export_project_button.clicked.connect(self.export_selected_project)
+        export_button_layout.addWidget(export_project_button)
+        export_layout.addLayout(export_button_layout)
+        
+        layout.addWidget(export_group)
+        
+        # Import section
+        import_group = QGroupBox("Import Project")
+        import_layout = QVBoxLayout(import_group)
+        
+        import_info = QLabel("Import a project package that was previously exported.")
+        import_info.setWordWrap(True)
+        import_layout.addWidget(import_info)
+        
+        import_button_layout = QHBoxLayout()
+        import_button_layout.addStretch()
+        import_project_button = QPushButton("Import Project Package")
+        import_project_button.clicked.connect(self.import_project_package)
+        import_button_layout.addWidget(import_project_button)
+        import_layout.addLayout(import_button_layout)
+        
+        layout.addWidget(import_group)
+        
+        layout.addStretch()
+
+        return import_export_widget
+        
+    def setup_project_info_panel(self, parent_layout):
+        """Setup project information panel"""
+        info_group = QGroupBox("Project Information")
+        info_layout = QVBoxLayout(info_group)
+        
+        self.project_info_label = QLabel("Select a project to view details")
+        self.project_info_label.setWordWrap(True)
+        self.project_info_label.setAlignment(_ALIGN_TOP)
+        info_layout.addWidget(self.project_info_label)
+        
+        info_group.setMaximumHeight(120)
+        parent_layout.addWidget(info_group)
+        
+    def refresh_projects(self):
+        """Refresh project lists (asynchronously, on the loader thread)"""
+        self._load_all_requested.emit()
+
+    def _populate_projects(self, projects: List[Dict]):
+        """Fill both lists from a completed workspace scan"""
+        # One model reset updates both tabs; the Recent tab's proxy
+        # limits or filters what it shows. Repaints are held off until
+        # the reset is done so the views redraw once, not per change
+        views = [self.recent_projects_list]
+        if hasattr(self, 'all_projects_list'):
+            views.append(self.all_projects_list)
+        for view in views:
+            view.setUpdatesEnabled(False)
+        try:
+            self.projects_model.set_projects(projects)
+        finally:
+            for view in views:
+                view.setUpdatesEnabled(True)
+
+    def search_projects(self, query: str):
+        """Schedule a debounced in-memory filter pass"""
+        self._search_timer.start()
+
+    def _apply_search_filter(self):
+        """Filter the loaded projects; no disk access involved"""
+        self.project_filter.set_query(self.search_edit.text())
+
+    def _stop_loader(self):
+        """Shut the loader thread down with the dialog"""
+        self._loader_thread.quit()
+        self._loader_thread.wait()
+            
+    def on_project_selection_changed(self):
+        """Handle project selection change (deferred to coalesce bursts)"""
+        # Restarting the timer means a held arrow key produces one info
+        # update per pause, not one per row skimmed past
+        self._sel_timer.start()
+
+    def _update_selection_info(self):
+        """Refresh buttons and the info panel for the landed-on row"""
+        current_tab = self.tab_widget.currentIndex()
+        
+        if current_tab == 0:  # Recent projects tab
+            project = self.recent_projects_list.get_selected_project()
+        elif current_tab == 1:  # All projects tab
+            project = self.all_projects_list.get_selected_project()
+        else:
+            project = None
+            
+        # Update buttons
+        has_selection = project is not None
+        self.open_project_button.setEnabled(has_selection)
+        self.delete_project_button.setEnabled(has_selection)
+        
+        # Update project info
+        if project:
+            self.update_project_info(project)
+        else:
+            self.project_info_label.setText("Select a project to view details")
+            
+    def update_project_info(self, project: Dict):
+        """Update project information display"""
+        created = project.get('created_date', 'Unknown')
+        modified = project.get('modified_date', 'Unknown')
+
+        # Format dates (cached; refreshes reuse the same ISO strings)
+        if created != 'Unknown':
+            created = _format_modified(created)
+        if modified != 'Unknown':
+            modified = _format_modified(modified)
+
+        self.project_info_label.setText(self._INFO_TMPL({
+            'name': project.get('name', 'Unnamed Project'),
+            'description': project.get('description', 'No description'),
+            'created': created,
+            'modified': modified,
+            'clips': project.get('clip_count', 0),
+            'assets': project.get('asset_count', 0),
+        }))
+        
+    def create_new_project(self):
+        """Create a new project"""
+        # Built once and reused; setup_ui creates ~15 widgets per instance
+        if self._new_project_dialog is None:
+            self._new_project_dialog = NewProjectDialog(self)
+        dialog = self._new_project_dialog
+        dialog.reset_form()
+        if dialog.exec() == _ACCEPTED:
+            project_data = dialog.get_project_data()
+            
+            try:
+                project_id = self.workspace_manager.create_new_project(
+                    name=project_data['name'],
+                    description=project_data['description'],
+                    fps=project_data['fps'],
+                    resolution=project_data['resolution']
+                )
+                
+                # Emit signal and close dialog
+                self.project_selected.emit(project_id)
+                self.accept()
+                
+            except Exception as e:
+                QMessageBox.critical(self, "Error", f"Failed to create project:\n{str(e)}")
+                
+    def open_selected_project(self):
+        """Open the selected project"""
+        current_tab = self.tab_widget.currentIndex()
+        
+        if current_tab == 0:
+            project = self.recent_projects_list.get_selected_project()
+        elif current_tab == 1:
+            project = self.all_projects_list.get_selected_project()
+        else:
+            return
+            
+        if project:
+            project_id = project['project_id']
+            self.project_selected.emit(project_id)
+            self.accept()
+            
+    def delete_selected_project(self):
+        """Delete the selected project"""
+        current_tab = self.tab_widget.currentIndex()
+        
+        if current_tab == 0:
+            project = self.recent_projects_list.get_selected_project()
+        elif current_tab == 1:
+            project = self.all_projects_list.get_selected_project()
+        else:
+            return
+            
+        if project:
+            project_name = project['name']
+            reply = QMessageBox.question(
+                self, 
+                "Delete Project",
+                f"Are you sure you want to delete the project '{project_name}'?\n\nThis action cannot be undone.",
+                _STD_YES | _STD_NO,
+                _STD_NO
+            )
+            
+            if reply == _STD_YES:
+                if self.workspace_manager.delete_project(project['project_id']):
+                    self.refresh_projects()
+                    QMessageBox.information(self, "Success", f"Project '{project_name}' has been deleted.")
+                else:
+                    QMessageBox.critical(self, "Error", f"Failed to delete project '{project_name}'.")
+                    
+    def duplicate_selected_project(self):
+        """Duplicate the selected project"""
+        project = self.all_projects_list.get_selected_project()
+        if not project:
+            return
+            
+        original_name = project['name']
+        new_name, ok = QInputDialog.getText(
+            self, 
+            "Duplicate Project", 
+            "Enter name for duplicated project:",
+            text=f"{original_name} Copy"
+        )
+        
+        if ok and new_name.strip():
+            try:
+                new_project_id = self.workspace_manager.duplicate_project(
+                    project['project_id'], 
+                    new_name.strip()
+                )
+                
+                if new_project_id:
+                    self.refresh_projects()
+                    QMessageBox.information(self, "Success", f"Project duplicated as '{new_name.strip()}'.")
+                else:
+                    QMessageBox.critical(self, "Error", "Failed to duplicate project.")
+                    
+            except Exception as e:
+                QMessageBox.critical(self, "Error", f"Failed to duplicate project:\n{str(e)}")
+                
+    def export_selected_project(self):
+        """Export the selected project"""
+        current_tab = self.tab_widget.currentIndex()
+        
+        if current_tab == 0:
+            project = self.recent_projects_list.get_selected_project()
+        elif current_tab == 1:
+            project = self.all_projects_list.get_selected_project()
+        else:
+            QMessageBox.information(self, "No Selection", "Please select a project to export.")
+            return
+            
+        if not project:
+            QMessageBox.information(self, "No Selection", "Please select a project to export.")
+            return
+            
+        # Get export path
+        project_name = project['name'].translate(_SAN_TABLE)
+        default_filename = f"{project_name}_export.pvproj"
+        
+        export_path, _ = QFileDialog.getSaveFileName(
+            self,
+            "Export Project",
+            default_filename,
+            "PyVideoEditor Project (*.pvproj);;All Files (*)"
+        )
+        
+        if export_path:
+            include_assets = self.include_assets_checkbox.isChecked()
+            
+            try:
+                if self.workspace_manager.export_workspace(project['project_id'], export_path, include_assets):
+                    QMessageBox.information(self, "Success", f"Project exported to:\n{export_path}")
+                else:
+                    QMessageBox.critical(self, "Error", "Failed to export project.")
+                    
+            except Exception as e:
+                QMessageBox.critical(self, "Error", f"Failed to export project:\n{str(e)}")
+                
+    def import_project_package(self):
+        """Import a project package"""
+        import_path, _ = QFileDialog.getOpenFileName(
+            self,
+            "Import Project Package",
+            "",
+            "PyVideoEditor Project (*.pvproj);;All Files (*)"
+        )
+        
+        if import_path:
+            # Get project name
+            project_name, ok = QInputDialog.getText(
+                self,
+                "Import Project",
+                "Enter name for imported project:",
+                text=os.path.splitext(os.path.basename(import_path))[0].replace('_export', '')
+            )
+            
+            if ok and project_name.strip():
+                try:
+                    new_project_id = self.workspace_manager.import_workspace(import_path, project_name.strip())
+                    
+                    if new_project_id:
+                        self.refresh_projects()
+                        QMessageBox.information(self, "Success", f"Project imported as '{project_name.strip()}'.")
+                    else:
+                        QMessageBox.critical(self, "Error", "Failed to import project.")
+                        
+                except Exception as e:
+                    QMessageBox.critical(self, "Error", f"Failed to import project:\n{str(e)}")
+
+if __name__ == "__main__":
+    from PyQt6.QtWidgets import QApplication
+    
+    app = QApplication(sys.argv)
+    dialog = ProjectManagerDialog()
+    
+    def on_project_selected(project_id):
+        print(f"Selected project: {project_id}")
+        
+    dialog.project_selected.connect(on_project_selected)
+    dialog.show()
+    sys.exit(app.exec())
@@ -1,1225 +1,1943 @@
-"""
-Professional Timeline Widget for PyVideoEditor
-Adobe Premiere-style timeline with multi-track support, drag-and-drop, and scrubbing
-"""
-
-import sys
-import os
-from PyQt6.QtWidgets import (
-    QWidget, QVBoxLayout, QHBoxLayout, QLabel, QPushButton, QSlider,
-    QScrollArea, QFrame, QSizePolicy, QSpinBox, QComboBox, QToolBar,
-    QButtonGroup
-)
-from PyQt6.QtCore import Qt, QRect, QPoint, QTimer, pyqtSignal, QMimeData
-from PyQt6.QtGui import (
-    QPainter, QColor, QPen, QBrush, QFont, QPixmap, QPalette,
-    QMouseEvent, QDragEnterEvent, QDropEvent, QDrag, QShortcut
-)
-from typing import List, Dict, Optional, Tuple
-import math
-from enum import Enum
-import copy
-
-class TimelineTool(Enum):
-    """Timeline editing tools"""
-    SELECT = "select"
-    RAZOR = "razor"
-    ZOOM = "zoom"
-    HAND = "hand"          # Pan tool
-    SLIP = "slip"          # Slip edit
-    SLIDE = "slide"        # Slide edit
-    RIPPLE = "ripple"      # Ripple edit
-    ROLLING = "rolling"    # Rolling edit
-
-class TimelineClip:
-    """Represents a clip on the timeline"""
-    def __init__(self, clip_id: str, name: str, start_time: float, duration: float, track: int, clip_type: str = "video"):
-        self.clip_id = clip_id
-        self.name = name
-        self.start_time = start_time
-        self.duration = duration
-        self.track = track
-        self.clip_type = clip_type  # "video", "audio", or "both"
-        self.color = QColor(70, 130, 180) if clip_type == "video" else QColor(50, 150, 50)
-        self.selected = False
-        self.thumbnail = None
-        self.waveform_data = None  # Audio waveform data
-        self.has_audio = False
-        self.has_video = True if clip_type != "audio" else False
-        
-    def end_time(self) -> float:
-        return self.start_time + self.duration
-        
-    def contains_time(self, time: float) -> bool:
-        return self.start_time <= time <= self.end_time()
-
-class AutomationTrack:
-    """Represents an automation track for parameters like volume, opacity, etc."""
-    def __init__(self, parent_track_id: int, parameter_name: str):
-        self.parent_track_id = parent_track_id
-        self.parameter_name = parameter_name  # "volume", "opacity", "pan", etc.
-        self.keyframes = {}  # time -> value mapping
-        self.enabled = False
-        self.height = 40
-        self.min_value = 0.0
-        self.max_value = 1.0
-        
-    def add_keyframe(self, time: float, value: float):
-        self.keyframes[time] = max(self.min_value, min(self.max_value, value))
-        
-    def remove_keyframe(self, time: float):
-        if time in self.keyframes:
-            del self.keyframes[time]
-            
-    def get_value_at_time(self, time: float) -> float:
-        if not self.keyframes:
-            return (self.min_value + self.max_value) / 2  # Default middle value
-            
-        # Find surrounding keyframes and interpolate
-        times = sorted(self.keyframes.keys())
-        
-        if time <= times[0]:
-            return self.keyframes[times[0]]
-        if time >= times[-1]:
-            return self.keyframes[times[-1]]
-            
-        # Linear interpolation between keyframes
-        for i in range(len(times) - 1):
-            if times[i] <= time <= times[i + 1]:
-                t1, t2 = times[i], times[i + 1]
-                v1, v2 = self.keyframes[t1], self.keyframes[t2]
-                factor = (time - t1) / (t2 - t1)
-                return v1 + (v2 - v1) * factor
-                
-        return (self.min_value + self.max_value) / 2
-
-class TimelineTrack:
-    """Represents a single track on the timeline"""
-    def __init__(self, track_id: int, name: str, track_type: str = "video"):
-        self.track_id = track_id
-        self.name = name
-        self.track_type = track_type  # "video", "audio", or "automation"
-        self.clips: List[TimelineClip] = []
-        self.muted = False
-        self.locked = False
-        self.solo = False
-        self.height = 60 if track_type == "video" else 40 if track_type == "audio" else 40
-        self.automation_tracks: List[AutomationTrack] = []
-        self.show_automation = False
-        
-        # Create default automation tracks for audio
-        if track_type == "audio":
-            self.automation_tracks.append(AutomationTrack(track_id, "volume"))
-            self.automation_tracks.append(AutomationTrack(track_id, "pan"))
-        elif track_type == "video":
-            self.automation_tracks.append(AutomationTrack(track_id, "opacity"))
-            
-    def add_automation_track(self, parameter_name: str):
-        """Add a new automation track for a parameter"""
-        automation = AutomationTrack(self.track_id, parameter_name)
-        self.automation_tracks.append(automation)
-        return automation
-        
-    def get_automation_track(self, parameter_name: str) -> Optional[AutomationTrack]:
-        """Get automation track by parameter name"""
-        for automation in self.automation_tracks:
-            if automation.parameter_name == parameter_name:
-                return automation
-        return None
-        
-    def toggle_automation_visibility(self):
-        """Toggle visibility of automation tracks"""
-        self.show_automation = not self.show_automation
-        
-    def add_clip(self, clip: TimelineClip):
-        self.clips.append(clip)
-        self.clips.sort(key=lambda c: c.start_time)
-
-    def move_clip(self, clip_id: str, new_start_time: float) -> bool:
-        clip = self.get_clip_by_id(clip_id)
-        if clip and not self.locked:
-            clip.start_time = new_start_time
-            self.clips.sort(key=lambda c: c.start_time)
-            return True
-        return False
-
-    def get_clip_by_id(self, clip_id: str) -> Optional[TimelineClip]:
-        for clip in self.clips:
-            if clip.clip_id == clip_id:
-                return clip
-        return None
-
-    def split_clip(self, clip_id: str, split_time: float) -> Optional[Tuple[TimelineClip, TimelineClip]]:
-        """Split a clip at the specified time, returns (left_clip, right_clip) or None"""
-        clip = self.get_clip_by_id(clip_id)
-        if clip and clip.start_time < split_time < clip.end_time():
-            # Calculate durations
-            left_duration = split_time - clip.start_time
-            right_duration = clip.end_time() - split_time
-            
-            # Create right clip
-            right_clip = TimelineClip(
-                f"{clip_id}_split",
-                f"{clip.name} (2)",
-                split_time,
-                right_duration,
-                clip.track
-            )
-            right_clip.color = clip.color
-            
-            # Update original clip (becomes left clip)
-            clip.duration = left_duration
-            clip.name = f"{clip.name} (1)" if not clip.name.endswith(" (1)") else clip.name
-            
-            # Add right clip to track
-            self.add_clip(right_clip)
-            
-            return (clip, right_clip)
-        return None
-    def remove_clip(self, clip_id: str):
-        self.clips = [clip for clip in self.clips if clip.clip_id != clip_id]
-        
-    def get_clip_at_time(self, time: float) -> Optional[TimelineClip]:
-        for clip in self.clips:
-            if clip.contains_time(time):
-                return clip
-        return None
-
-class TimelineRuler(QWidget):
-    """Timeline ruler showing time markers"""
-    
-    def __init__(self, timeline_widget):
-        super().__init__()
-        self.timeline_widget = timeline_widget
-        self.setFixedHeight(20)  # Thinner ruler height
-        self.setMouseTracking(True)
-        
-    def paintEvent(self, event):
-        painter = QPainter(self)
-        painter.fillRect(self.rect(), QColor(45, 45, 45))
-        
-        # Get timeline parameters
-        pixels_per_second = self.timeline_widget.pixels_per_second
-        start_time = self.timeline_widget.scroll_offset / pixels_per_second
-        width = self.width()
-        
-        # Draw time markers
-        painter.setPen(QPen(QColor(200, 200, 200), 1))
-        painter.setFont(QFont("Arial", 7))  # Smaller font for more compact look
-        
-        # Calculate marker interval based on zoom level
-        if pixels_per_second > 100:
-            interval = 0.5  # 0.5 second intervals
-        elif pixels_per_second > 50:
-            interval = 1.0  # 1 second intervals
-        elif pixels_per_second > 20:
-            interval = 5.0  # 5 second intervals
-        else:
-            interval = 10.0  # 10 second intervals
-            
-        # Draw markers
-        start_marker = int(start_time / interval) * interval
-        for i in range(int(width / (interval * pixels_per_second)) + 2):
-            time = start_marker + i * interval
-            x = int(time * pixels_per_second - self.timeline_widget.scroll_offset)
-            
-            if 0 <= x <= width:
-                painter.drawLine(x, 20, x, 30)
-                
-                # Draw time text
-                time_text = self.format_time(time)
-                painter.drawText(x + 2, 15, time_text)
-                
-    def format_time(self, seconds: float) -> str:
-        """Format time as MM:SS.ff"""
-        minutes = int(seconds // 60)
-        secs = int(seconds % 60)
-        frames = int((seconds % 1) * 30)  # Assuming 30fps
-        return f"{minutes:02d}:{secs:02d}.{frames:02d}"
-
-class TimelineTrackWidget(QWidget):
-    """Widget representing a single track"""
-    
-    clip_selected = pyqtSignal(str)  # clip_id
-    clip_moved = pyqtSignal(str, float, int)  # clip_id, new_time, new_track
-    
-    def __init__(self, track: TimelineTrack, timeline_widget):
-        super().__init__()
-        self.track = track
-        self.timeline_widget = timeline_widget
-        self.setFixedHeight(track.height)
-        self.setAcceptDrops(True)
-        self.setMouseTracking(True)
-        
-        self.dragging_clip = None
-        self.drag_start_pos = None
-        self.drag_offset = 0
-        
-    def paintEvent(self, event):
-        painter = QPainter(self)
-        
-        # Track background
-        bg_color = QColor(60, 60, 60) if self.track.track_type == "video" else QColor(50, 70, 50)
-        painter.fillRect(self.rect(), bg_color)
-        
-        # Draw clips
-        pixels_per_second = self.timeline_widget.pixels_per_second
-        scroll_offset = self.timeline_widget.scroll_offset
-        
-        for clip in self.track.clips:
-            clip_x = int(clip.start_time * pixels_per_second - scroll_offset)
-            clip_width = int(clip.duration * pixels_per_second)
-            clip_rect = QRect(clip_x, 5, clip_width, self.height() - 10)
-            
-            # Only draw if visible
-            if clip_rect.right() >= 0 and clip_rect.left() <= self.width():
-                self.draw_clip(painter, clip, clip_rect)
-                
-    def draw_clip(self, painter: QPainter, clip: TimelineClip, rect: QRect):
-        """Draw a single clip with waveform for audio clips"""
-        # Clip background
-        color = clip.color
-        if clip.selected:
-            color = color.lighter(150)
-            
-        painter.fillRect(rect, color)
-        
-        # Draw waveform for audio clips or clips with audio
-        if (clip.clip_type == "audio" or clip.has_audio) and clip.waveform_data:
-            self.draw_waveform(painter, clip, rect)
-        
-        # Draw video thumbnail strip for video clips
-        if clip.clip_type == "video" and self.track.track_type == "video":
-            self.draw_video_thumbnails(painter, clip, rect)
-        
-        # Clip border
-        border_color = QColor(255, 255, 255) if clip.selected else QColor(30, 30, 30)
-        painter.setPen(QPen(border_color, 2 if clip.selected else 1))
-        painter.drawRect(rect)
-        
-        # Clip name
-        painter.setPen(QPen(QColor(255, 255, 255), 1))
-        painter.setFont(QFont("Arial", 8))  # Smaller font for clips
-        
-        # Truncate name if too long
-        font_metrics = painter.fontMetrics()
-        text = clip.name
-        if font_metrics.horizontalAdvance(text) > rect.width() - 10:
-            text = font_metrics.elidedText(text, Qt.TextElideMode.ElideRight, rect.width() - 10)
-            
-        painter.drawText(rect.x() + 5, rect.y() + 15, text)
-        
-        # Duration text
-        duration_text = self.format_duration(clip.duration)
-        painter.setFont(QFont("Arial", 6))  # Smaller duration text
-        painter.drawText(rect.x() + 5, rect.bottom() - 3, duration_text)  # Closer to bottom
-        
-    def draw_waveform(self, painter: QPainter, clip: TimelineClip, rect: QRect):
-        """Draw audio waveform inside the clip"""
-        if not clip.waveform_data:
-            return
-            
-        painter.setPen(QPen(QColor(255, 255, 255, 100), 1))
-        
-        # Calculate waveform display parameters
-        waveform_height = rect.height() - 20  # Leave space for text
-        center_y = rect.y() + rect.height() // 2
-        
-        # Sample waveform data to fit the clip width
-        samples_per_pixel = max(1, len(clip.waveform_data) // rect.width())
-        
-        for x in range(rect.width()):
-            sample_index = x * samples_per_pixel
-            if sample_index < len(clip.waveform_data):
-                # Get max amplitude for this pixel
-                max_amp = 0
-                for i in range(samples_per_pixel):
-                    if sample_index + i < len(clip.waveform_data):
-                        max_amp = max(max_amp, abs(clip.waveform_data[sample_index + i]))
-                
-                # Draw waveform line
-                wave_height = int(max_amp * waveform_height / 2)
-                painter.drawLine(
-                    rect.x() + x, center_y - wave_height,
-                    rect.x() + x, center_y + wave_height
-                )
-                
-    def draw_video_thumbnails(self, painter: QPainter, clip: TimelineClip, rect: QRect):
-        """Draw video thumbnail strip inside the clip"""
-        if not clip.thumbnail:
-            # Draw placeholder for video
-            painter.setPen(QPen(QColor(200, 200, 200, 50), 1))
-            painter.drawText(rect.center(), "Video")
-            return
-            
-        # TODO: Implement thumbnail strip drawing
-        # This would require extracting thumbnails from video at regular intervals
-        pass
-        
-    def format_duration(self, seconds: float) -> str:
-        """Format duration as MM:SS"""
-        minutes = int(seconds // 60)
-        secs = int(seconds % 60)
-        return f"{minutes:02d}:{secs:02d}"
-        
-    def mousePressEvent(self, event: QMouseEvent):
-        if event.button() == Qt.MouseButton.LeftButton:
-            clip = self.get_clip_at_position(event.position().toPoint())
-            current_tool = self.timeline_widget.current_tool
-            
-            if current_tool == TimelineTool.RAZOR and clip:
-                # Split clip at current position
-                time = (event.position().x() + self.timeline_widget.scroll_offset) / self.timeline_widget.pixels_per_second
-                self.track.split_clip(clip.clip_id, time)
-                self.update()
-                
-            elif current_tool == TimelineTool.SELECT and clip:
-                # Select clip
-                self.select_clip(clip)
-                self.clip_selected.emit(clip.clip_id)
-                
-                # Start drag
-                self.dragging_clip = clip
-                self.drag_start_pos = event.position().toPoint()
-                self.drag_offset = event.position().x() - (clip.start_time * self.timeline_widget.pixels_per_second - self.timeline_widget.scroll_offset)
-                
-    def mouseMoveEvent(self, event: QMouseEvent):
-        if (self.dragging_clip and event.buttons() & Qt.MouseButton.LeftButton and 
-            self.timeline_widget.current_tool == TimelineTool.SELECT):
-            # Calculate new time position
-            new_x = event.position().x() - self.drag_offset
-            new_time = (new_x + self.timeline_widget.scroll_offset) / self.timeline_widget.pixels_per_second
-            new_time = max(0, new_time)  # Don't allow negative time
-            
-            # Enhanced snapping if enabled
-            if self.timeline_widget.snap_enabled:
-                new_time = self.timeline_widget.snap_time(new_time, self.dragging_clip)
-            
-            # Calculate new track ID
-            new_y = event.position().y()
-            track_index = self.indexForTrack(self.dragging_clip.track)  # Get current index
-            new_track_index = track_index
-            for i, track in enumerate(self.timeline_widget.tracks):
-                # Check if position is over a new track
-                if new_y >= i * track.height and new_y < (i + 1) * track.height:
-                    new_track_index = i
-                    break
-
-            # Move clip to new track if needed
-            if new_track_index != track_index:
-                self.timeline_widget.move_clip_to_track(self.dragging_clip, new_track_index)
-
-            self.dragging_clip.start_time = new_time
-            self.update()
-    
-    def mouseReleaseEvent(self, event: QMouseEvent):
-        """Handle mouse release event to complete drag operation"""
-        if event.button() == Qt.MouseButton.LeftButton and self.dragging_clip:
-            # Emit clip moved signal
-            self.clip_moved.emit(
-                self.dragging_clip.clip_id, 
-                self.dragging_clip.start_time, 
-                self.dragging_clip.track
-            )
-            
-            # Clear drag state
-            self.dragging_clip = None
-            self.drag_start_pos = None
-            self.drag_offset = 0
-            
-            # Final update
-            self.update()
-    
-    def get_clip_at_position(self, pos: QPoint) -> Optional[TimelineClip]:
-        """Get clip at mouse position"""
-        time = (pos.x() + self.timeline_widget.scroll_offset) / self.timeline_widget.pixels_per_second
-        return self.track.get_clip_at_time(time)
-        
-    def select_clip(self, clip: TimelineClip):
-        """Select a clip and deselect others"""
-        for c in self.track.clips:
-            c.selected = (c == clip)
-        self.update()
-    
-    def indexForTrack(self, track_id: int) -> int:
-        """Get the index of a track by its ID"""
-        for i, track in enumerate(self.timeline_widget.tracks):
-            if track.track_id == track_id:
-                return i
-        return 0  # Default to first track if not found
-    
-    def dragEnterEvent(self, event):
-        """Handle drag enter event for movable components"""
-        if event.mimeData().hasUrls() or event.mimeData().hasText():
-            event.acceptProposedAction()
-        else:
-            event.ignore()
-    
-    def dragMoveEvent(self, event):
-        """Handle drag move event"""
-        if event.mimeData().hasUrls() or event.mimeData().hasText():
-            event.acceptProposedAction()
-        else:
-            event.ignore()
-    
-    def dropEvent(self, event):
-        """Handle drop event"""
-        # Get file paths from drop
-        file_paths = []
-        if event.mimeData().hasUrls():
-            for url in event.mimeData().urls():
-                if url.isLocalFile():
-                    file_paths.append(url.toLocalFile())
-        elif event.mimeData().hasText():
-            file_paths = event.mimeData().text().split('\n')
-        
-        # Add files to timeline (let timeline widget handle track assignment)
-        for file_path in file_paths:
-            if file_path.strip():
-                self.timeline_widget.add_media_file(file_path)
-        
-        event.acceptProposedAction()
-
-class TimelineWidget(QWidget):
-    """Main timeline widget"""
-    
-    time_changed = pyqtSignal(float)  # Current playhead time
-    clip_selected = pyqtSignal(str)   # Selected clip ID
-    media_dropped = pyqtSignal(str, str)  # clip_id, file_path
-    
-    def __init__(self):
-        super().__init__()
-        self.tracks: List[TimelineTrack] = []
-        self.pixels_per_second = 50  # Zoom level
-        self.scroll_offset = 0
-        self.playhead_time = 0.0
-        self.snap_enabled = True
-        self.duration = 60.0  # Total timeline duration
-        
-        self.setup_ui()
-        self.create_default_tracks()
-        self.current_tool = TimelineTool.SELECT
-        self.clipboard = []
-        
-    def setup_ui(self):
-        # Main horizontal layout: tools on left, timeline on right
-        main_layout = QHBoxLayout(self)
-        main_layout.setContentsMargins(0, 0, 0, 0)
-        main_layout.setSpacing(2)
-        
-        # Left side: Vertical tool panel
-        tools_panel = self.create_tools_panel()
-        main_layout.addWidget(tools_panel)
-        
-        # Right side: Timeline area
-        timeline_area = self.create_timeline_area()
-        main_layout.addWidget(timeline_area, 1)  # Take most of the space
-        
-    def create_tools_panel(self):
-        """Create vertical tools panel on the left"""
-        tools_panel = QWidget()
-        tools_panel.setFixedWidth(80)  # Fixed width for tool panel
-        tools_panel.setStyleSheet("""
-            QWidget {
-                background-color: #2d2d30;
-                border-right: 1px solid #464647;
-            }
-        """)
-        
-        tools_layout = QVBoxLayout(tools_panel)
-        tools_layout.setContentsMargins(5, 5, 5, 5)
-        tools_layout.setSpacing(3)
-        
-        # Tool buttons group
-        self.tool_group = QButtonGroup()
-        
-        # Style for tool buttons
-        tool_button_style = """
-            QPushButton {
-                background-color: #3c3c3c;
-                color: #cccccc;
-                border: 1px solid #555555;
-                border-radius: 4px;
-                padding: 6px;
-                font-size: 10px;
-                text-align: center;
-                min-height: 20px;
-            }
-            QPushButton:checked {
-                background-color: #007acc;
-                color: white;
-                border-color: #007acc;
-            }
-            QPushButton:hover {
-                background-color: #4a4a4a;
-                border-color: #007acc;
-            }
-        """
-        
-        # Create tool buttons vertically
-        self.select_tool_btn = QPushButton("Select\n(V)")
-        self.select_tool_btn.setCheckable(True)
-        self.select_tool_btn.setChecked(True)
-        self.select_tool_btn.clicked.connect(lambda: self.set_tool(TimelineTool.SELECT))
-        self.select_tool_btn.setStyleSheet(tool_button_style)
-        self.tool_group.addButton(self.select_tool_btn)
-        tools_layout.addWidget(self.select_tool_btn)
-        
-        self.razor_tool_btn = QPushButton("Razor\n(C)")
-        self.razor_tool_btn.setCheckable(True)
-        self.razor_tool_btn.clicked.connect(lambda: self.set_tool(TimelineTool.RAZOR))
-        self.razor_tool_btn.setStyleSheet(tool_button_style)
-        self.tool_group.addButton(self.razor_tool_btn)
-        tools_layout.addWidget(self.razor_tool_btn)
-        
-        self.hand_tool_btn = QPushButton("Hand\n(H)")
-        self.hand_tool_btn.setCheckable(True)
-        self.hand_tool_btn.clicked.connect(lambda: self.set_tool(TimelineTool.HAND))
-        self.hand_tool_btn.setStyleSheet(tool_button_style)
-        self.tool_group.addButton(self.hand_tool_btn)
-        tools_layout.addWidget(self.hand_tool_btn)
-        
-        self.ripple_tool_btn = QPushButton("Ripple\n(R)")
-        self.ripple_tool_btn.setCheckable(True)
-        self.ripple_tool_btn.clicked.connect(lambda: self.set_tool(TimelineTool.RIPPLE))
-        self.ripple_tool_btn.setStyleSheet(tool_button_style)
-        self.tool_group.addButton(self.ripple_tool_btn)
-        tools_layout.addWidget(self.ripple_tool_btn)
-        
-        self.slip_tool_btn = QPushButton("Slip\n(Y)")
-        self.slip_tool_btn.setCheckable(True)
-        self.slip_tool_btn.clicked.connect(lambda: self.set_tool(TimelineTool.SLIP))
-        self.slip_tool_btn.setStyleSheet(tool_button_style)
-        self.tool_group.addButton(self.slip_tool_btn)
-        tools_layout.addWidget(self.slip_tool_btn)
-        
-        tools_layout.addStretch()  # Push buttons to top
-        
-        return tools_panel
-        
-    def create_timeline_area(self):
-        """Create the main timeline area"""
-        timeline_widget = QWidget()
-        layout = QVBoxLayout(timeline_widget)
-        layout.setContentsMargins(0, 0, 0, 0)
-        layout.setSpacing(0)
-        
-        # Timeline controls
-        controls_layout = QHBoxLayout()
-        
-        # Zoom controls
-        zoom_label = QLabel("Zoom:")
-        controls_layout.addWidget(zoom_label)
-        
-        self.zoom_slider = QSlider(Qt.Orientation.Horizontal)
-        self.zoom_slider.setRange(10, 200)
-        self.zoom_slider.setValue(self.pixels_per_second)
-        self.zoom_slider.valueChanged.connect(self.set_zoom)
-        self.zoom_slider.setFixedWidth(100)
-        controls_layout.addWidget(self.zoom_slider)
-        
-        # Snap toggle
-        self.snap_button = QPushButton("Snap")
-        self.snap_button.setCheckable(True)
-        self.snap_button.setChecked(self.snap_enabled)
-        self.snap_button.clicked.connect(self.toggle_snap)
-        self.snap_button.setFixedWidth(50)  # Reduced width
-        controls_layout.addWidget(self.snap_button)
-        
-        # Automation toggle
-        self.automation_button = QPushButton("Auto")
-        self.automation_button.setCheckable(True)
-        self.automation_button.setChecked(False)
-        self.automation_button.clicked.connect(self.toggle_automation_tracks)
-        self.automation_button.setFixedWidth(50)
-        self.automation_button.setToolTip("Toggle automation tracks visibility")
-        controls_layout.addWidget(self.automation_button)
-        
-        controls_layout.addStretch()
-        
-        controls_widget = QWidget()
-        controls_widget.setLayout(controls_layout)
-        controls_widget.setFixedHeight(25)  # Better height for controls
-        controls_widget.setStyleSheet("""
-            QWidget {
-                background-color: #2d2d30;
-                border-bottom: 1px solid #464647;
-            }
-            QLabel {
-                color: #cccccc;
-                font-size: 11px;
-                padding: 0 5px;
-            }
-            QPushButton {
-                background-color: #0e639c;
-                color: white;
-                border: 1px solid #464647;
-                border-radius: 3px;
-                padding: 2px 8px;
-                font-size: 10px;
-                min-height: 18px;
-            }
-            QPushButton:checked {
-                background-color: #1177bb;
-                border-color: #007acc;
-            }
-            QPushButton:hover {
-                background-color: #1177bb;
-            }
-        """)
-        layout.addWidget(controls_widget)
-        
-        # Timeline ruler
-        self.ruler = TimelineRuler(self)
-        layout.addWidget(self.ruler)
-        
-        # Scrollable timeline area
-        self.scroll_area = QScrollArea()
-        self.scroll_area.setHorizontalScrollBarPolicy(Qt.ScrollBarPolicy.ScrollBarAlwaysOn)
-        self.scroll_area.setVerticalScrollBarPolicy(Qt.ScrollBarPolicy.ScrollBarAsNeeded)
-        self.scroll_area.horizontalScrollBar().valueChanged.connect(self.on_scroll)
-        
-        # Timeline content widget
-        self.timeline_content = QWidget()
-        self.timeline_layout = QVBoxLayout(self.timeline_content)
-        self.timeline_layout.setContentsMargins(0, 0, 0, 0)
-        self.timeline_layout.setSpacing(1)
-        
-        self.scroll_area.setWidget(self.timeline_content)
-        layout.addWidget(self.scroll_area)
-        
-        # Update timeline size
-        self.update_timeline_size()
-        
-        # Keyboard shortcuts
-        self.setup_shortcuts()
-        
-        return timeline_widget
-        
-    def create_default_tracks(self):
-        """Create default video and audio tracks with proper separation"""
-        # Video tracks
-        for i in range(3):
-            track = TimelineTrack(i, f"Video {i+1}", "video")
-            self.add_track(track)
-            
-        # Audio tracks (separate from video)
-        for i in range(4):
-            track = TimelineTrack(i+10, f"Audio {i+1}", "audio")  # Use different ID range
-            self.add_track(track)
-            
-    def add_track(self, track: TimelineTrack):
-        """Add a track to the timeline"""
-        self.tracks.append(track)
-        
-        # Create track widget
-        track_widget = TimelineTrackWidget(track, self)
-        track_widget.clip_selected.connect(self.clip_selected.emit)
-        track_widget.clip_moved.connect(self.on_clip_moved)
-        
-        self.timeline_layout.addWidget(track_widget)
-        self.update_timeline_size()
-        
-    def add_clip_to_track(self, track_id: int, clip_name: str, start_time: float, duration: float) -> str:
-        """Add a clip to a specific track and make it movable"""
-        if track_id < len(self.tracks):
-            clip_id = f"clip_{len(self.get_all_clips())}"
-            clip = TimelineClip(clip_id, clip_name, start_time, duration, track_id)
-            
-            # Set color based on track type
-            if self.tracks[track_id].track_type == "audio":
-                clip.color = QColor(50, 150, 50)  # Green for audio
-            
-            self.tracks[track_id].add_clip(clip)
-            self.update_tracks()
-            return clip_id
-        return ""
-        
-    def remove_clip(self, clip_id: str):
-        """Remove a clip from timeline"""
-        for track in self.tracks:
-            track.remove_clip(clip_id)
-        self.update_tracks()
-        
-    def get_all_clips(self) -> List[TimelineClip]:
-        """Get all clips from all tracks"""
-        clips = []
-        for track in self.tracks:
-            clips.extend(track.clips)
-        return clips
-        
-    def set_zoom(self, zoom_level: int):
-        """Set timeline zoom level"""
-        self.pixels_per_second = zoom_level
-        self.update_timeline_size()
-        self.update_tracks()
-        self.ruler.update()
-        
-    def toggle_snap(self, enabled: bool):
-        """Toggle snap to grid"""
-        self.snap_enabled = enabled
-        
-    def snap_time(self, time: float, dragging_clip: Optional[TimelineClip] = None) -> float:
-        """Snap time to various targets: grid, clips, playhead"""
-        if not self.snap_enabled:
-            return time
-            
-        snap_threshold = 0.5 / self.pixels_per_second * 10  # 10 pixels threshold
-        candidates = []
-        
-        # Snap to grid (1 second intervals)
-        grid_interval = 1.0
-        grid_time = round(time / grid_interval) * grid_interval
-        if abs(time - grid_time) < snap_threshold:
-            candidates.append(grid_time)
-            
-        # Snap to playhead
-        if abs(time - self.playhead_time) < snap_threshold:
-            candidates.append(self.playhead_time)
-            
-        # Snap to other clips
-        for track in self.tracks:
-            for clip in track.clips:
-                if dragging_clip and clip.clip_id == dragging_clip.clip_id:
-                    continue  # Skip the clip being dragged
-                    
-                # Snap to clip start
-                if abs(time - clip.start_time) < snap_threshold:
-                    candidates.append(clip.start_time)
-                    
-                # Snap to clip end
-                clip_end = clip.end_time()
-                if abs(time - clip_end) < snap_threshold:
-                    candidates.append(clip_end)
-                    
-        # Return the closest snap candidate or original time
-        if candidates:
-            return min(candidates, key=lambda t: abs(t - time))
-        return time
-        
-    def on_scroll(self, value: int):
-        """Handle horizontal scrolling"""
-        self.scroll_offset = value
-        self.update_tracks()
-        self.ruler.update()
-        
-    def on_clip_moved(self, clip_id: str, new_time: float, track_id: int):
-        """Handle clip movement"""
-        # Update clip position and emit signal
-        self.update_tracks()
-        
-    def set_playhead_time(self, time: float):
-        """Set playhead position"""
-        self.playhead_time = time
-        self.time_changed.emit(time)
-        self.update_tracks()
-        
-    def update_timeline_size(self):
-        """Update timeline content size based on duration and zoom"""
-        width = int(self.duration * self.pixels_per_second)
-        height = sum(track.height + 1 for track in self.tracks)
-        self.timeline_content.setFixedSize(width, height)
-        
-    def update_tracks(self):
-        """Update all track widgets"""
-        for i in range(self.timeline_layout.count()):
-            widget = self.timeline_layout.itemAt(i).widget()
-            if isinstance(widget, TimelineTrackWidget):
-                widget.update()
-                
-    def paintEvent(self, event):
-        """Draw playhead"""
-        super().paintEvent(event)
-        
-        if hasattr(self, 'scroll_area'):
-            painter = QPainter(self)
-            
-            # Calculate playhead position
-            playhead_x = int(self.playhead_time * self.pixels_per_second - self.scroll_offset)
-            
-            # Draw playhead line
-            if 0 <= playhead_x <= self.width():
-                painter.setPen(QPen(QColor(255, 0, 0), 2))
-                y_start = self.ruler.height() + 30  # After controls and ruler
-                y_end = self.height()
-                painter.drawLine(playhead_x, y_start, playhead_x, y_end)
-                
-    def setup_shortcuts(self):
-        """Setup keyboard shortcuts for timeline tools"""
-        # Tool shortcuts
-        select_shortcut = QShortcut("V", self)
-        select_shortcut.activated.connect(lambda: self.set_tool(TimelineTool.SELECT))
-        
-        razor_shortcut = QShortcut("C", self)
-        razor_shortcut.activated.connect(lambda: self.set_tool(TimelineTool.RAZOR))
-        
-        hand_shortcut = QShortcut("H", self)
-        hand_shortcut.activated.connect(lambda: self.set_tool(TimelineTool.HAND))
-        
-        ripple_shortcut = QShortcut("R", self)
-        ripple_shortcut.activated.connect(lambda: self.set_tool(TimelineTool.RIPPLE))
-        
-        slip_shortcut = QShortcut("Y", self)
-        slip_shortcut.activated.connect(lambda: self.set_tool(TimelineTool.SLIP))
-        
-        # Edit shortcuts
-        delete_shortcut = QShortcut("Delete", self)
-        delete_shortcut.activated.connect(self.delete_selected_clips)
-        
-        copy_shortcut = QShortcut("Ctrl+C", self)
-        copy_shortcut.activated.connect(self.copy_selected_clips)
-        
-        paste_shortcut = QShortcut("Ctrl+V", self)
-        paste_shortcut.activated.connect(self.paste_clips)
-        
-        split_shortcut = QShortcut("S", self)
-        split_shortcut.activated.connect(self.split_at_playhead)
-        
-    def set_tool(self, tool: TimelineTool):
-        """Set the current editing tool"""
-        self.current_tool = tool
-        
-        # Update button states
-        self.select_tool_btn.setChecked(tool == TimelineTool.SELECT)
-        self.razor_tool_btn.setChecked(tool == TimelineTool.RAZOR)
-        self.hand_tool_btn.setChecked(tool == TimelineTool.HAND)
-        self.ripple_tool_btn.setChecked(tool == TimelineTool.RIPPLE)
-        self.slip_tool_btn.setChecked(tool == TimelineTool.SLIP)
-        
-        # Update cursor based on tool
-        if tool == TimelineTool.RAZOR:
-            self.setCursor(Qt.CursorShape.CrossCursor)
-        elif tool == TimelineTool.HAND:
-            self.setCursor(Qt.CursorShape.OpenHandCursor)
-        elif tool == TimelineTool.RIPPLE:
-            self.setCursor(Qt.CursorShape.SizeHorCursor)
-        elif tool == TimelineTool.SLIP:
-            self.setCursor(Qt.CursorShape.SizeAllCursor)
-        else:
-            self.setCursor(Qt.CursorShape.ArrowCursor)
-            
-    def get_selected_clips(self) -> List[TimelineClip]:
-        """Get all currently selected clips"""
-        selected = []
-        for track in self.tracks:
-            for clip in track.clips:
-                if clip.selected:
-                    selected.append(clip)
-        return selected
-        
-    def delete_selected_clips(self):
-        """Delete all selected clips"""
-        selected_clips = self.get_selected_clips()
-        for clip in selected_clips:
-            self.remove_clip(clip.clip_id)
-            
-    def copy_selected_clips(self):
-        """Copy selected clips to clipboard"""
-        selected_clips = self.get_selected_clips()
-        self.clipboard = [copy.deepcopy(clip) for clip in selected_clips]
-        
-    def paste_clips(self):
-        """Paste clips from clipboard at playhead"""
-        if not self.clipboard:
-            return
-            
-        for clip_data in self.clipboard:
-            # Create new clip at playhead position
-            new_clip = copy.deepcopy(clip_data)
-            new_clip.clip_id = f"clip_{len(self.get_all_clips())}"
-            new_clip.start_time = self.playhead_time
-            
-            # Add to appropriate track
-            if new_clip.track < len(self.tracks):
-                self.tracks[new_clip.track].add_clip(new_clip)
-                
-        self.update_tracks()
-        
-    def split_at_playhead(self):
-        """Split clips at playhead position"""
-        for track in self.tracks:
-            clip = track.get_clip_at_time(self.playhead_time)
-            if clip:
-                track.split_clip(clip.clip_id, self.playhead_time)
-        self.update_tracks()
-    
-    def add_media_to_track(self, track_id: int, file_path: str, start_time: float):
-        """Add media file to specific track at specific time"""
-        try:
-            import os
-            from moviepy import VideoFileClip, AudioFileClip, ImageClip
-            
-            # Get file extension to determine type
-            file_ext = os.path.splitext(file_path)[1].lower()
-            
-            # Define supported file types
-            video_extensions = ['.mp4', '.avi', '.mov', '.mkv', '.wmv', '.flv', '.webm', '.m4v']
-            image_extensions = ['.png', '.jpg', '.jpeg', '.bmp', '.gif', '.tiff', '.tga']
-            audio_extensions = ['.mp3', '.wav', '.aac', '.flac', '.ogg', '.m4a']
-            
-            duration = 5.0  # Default duration
-            clip = None
-            
-            if file_ext in video_extensions:
-                # Handle video files
-                clip = VideoFileClip(file_path)
-                duration = clip.duration
-                clip.close()
-                
-            elif file_ext in image_extensions:
-                # Handle image files - create a 5 second clip
-                duration = 5.0
-                
-            elif file_ext in audio_extensions:
-                # Handle audio files
-                clip = AudioFileClip(file_path)
-                duration = clip.duration
-                clip.close()
-                
-                # For audio files, use audio track if available
-                if track_id < 2:  # If trying to add to video track
-                    # Find first available audio track
-                    for i, track in enumerate(self.tracks):
-                        if track.track_type == "audio":
-                            track_id = i
-                            break
-            else:
-                print(f"Unsupported file type: {file_ext}")
-                return None
-            
-            # Add clip to track
-            clip_id = self.add_clip_to_track(
-                track_id=track_id,
-                clip_name=os.path.basename(file_path),
-                start_time=start_time,
-                duration=duration
-            )
-            
-            # Emit signal for main window to handle
-            self.media_dropped.emit(clip_id, file_path)
-            
-            return clip_id
-            
-        except Exception as e:
-            print(f"Error adding media to track: {e}")
-            return None
-    
-    def add_media_file(self, file_path: str):
-        """Add media file to timeline, automatically managing tracks and positioning"""
-        try:
-            import os
-            from moviepy import VideoFileClip, AudioFileClip, ImageClip
-            
-            # Get file extension to determine type
-            file_ext = os.path.splitext(file_path)[1].lower()
-            
-            # Define supported file types
-            video_extensions = ['.mp4', '.avi', '.mov', '.mkv', '.wmv', '.flv', '.webm', '.m4v']
-            image_extensions = ['.png', '.jpg', '.jpeg', '.bmp', '.gif', '.tiff', '.tga']
-            audio_extensions = ['.mp3', '.wav', '.aac', '.flac', '.ogg', '.m4a']
-            
-            duration = 5.0  # Default duration
-            clip = None
-            track_type = "video"  # Default track type
-            
-            if file_ext in video_extensions:
-                # Handle video files
-                clip = VideoFileClip(file_path)
-                duration = clip.duration
-                clip.close()
-                track_type = "video"
-                
-            elif file_ext in image_extensions:
-                # Handle image files - create a 5 second clip
-                duration = 5.0
-                track_type = "video"
-                
-            elif file_ext in audio_extensions:
-                # Handle audio files
-                clip = AudioFileClip(file_path)
-                duration = clip.duration
-                clip.close()
-                track_type = "audio"
-            else:
-                print(f"Unsupported file type: {file_ext}")
-                return None
-            
-            # Find or create an appropriate track
-            target_track = self.find_or_create_track(track_type)
-            
-            # Calculate start time (end of timeline)
-            start_time = self.get_timeline_end_time()
-            
-            # Add clip to track
-            clip_id = self.add_clip_to_track(
-                track_id=target_track.track_id,
-                clip_name=os.path.basename(file_path),
-                start_time=start_time,
-                duration=duration
-            )
-            
-            # Update timeline duration if necessary
-            new_end_time = start_time + duration
-            if new_end_time > self.duration:
-                self.duration = new_end_time + 10  # Add 10 seconds buffer
-                self.update_timeline_size()
-            
-            # Emit signal for main window to handle
-            self.media_dropped.emit(clip_id, file_path)
-            
-            return clip_id
-            
-        except Exception as e:
-            print(f"Error adding media file: {e}")
-            return None
-    
-    def find_or_create_track(self, track_type: str) -> TimelineTrack:
-        """Find an available track or create a new one"""
-        # Look for existing tracks of the same type
-        tracks_of_type = [track for track in self.tracks if track.track_type == track_type]
-        
-        # For now, always create a new track for each file to avoid overlaps
-        # This ensures each file gets its own "line" as requested
-        track_count = len(tracks_of_type)
-        track_id = len(self.tracks)  # Use total track count as ID
-        track_name = f"{track_type.capitalize()} {track_count + 1}"
-        
-        new_track = TimelineTrack(track_id, track_name, track_type)
-        self.add_track(new_track)
-        
-        return new_track
-    
-    def get_timeline_end_time(self) -> float:
-        """Get the end time of all clips on the timeline"""
-        max_end_time = 0.0
-        
-        for track in self.tracks:
-            for clip in track.clips:
-                clip_end = clip.end_time()
-                if clip_end > max_end_time:
-                    max_end_time = clip_end
-        
-        return max_end_time
-    
-    def move_clip_to_track(self, clip: TimelineClip, new_track_id: int):
-        """Move a clip from one track to another"""
-        if new_track_id >= len(self.tracks):
-            return False
-            
-        # Find current track containing the clip
-        current_track = None
-        for track in self.tracks:
-            if clip in track.clips:
-                current_track = track
-                break
-        
-        if not current_track:
-            return False
-            
-        # Remove from current track
-        current_track.remove_clip(clip.clip_id)
-        
-        # Add to new track
-        target_track = self.tracks[new_track_id]
-        clip.track = new_track_id  # Update clip's track reference
-        target_track.add_clip(clip)
-        
-        # Update display
-        self.update_tracks()
-        return True
-        
-    def toggle_automation_tracks(self):
-        """Toggle automation tracks visibility for all tracks"""
-        for track in self.tracks:
-            if track.track_type in ["audio", "video"]:
-                track.toggle_automation_visibility()
-        self.update_timeline_display()
-        
-    def update_timeline_display(self):
-        """Update the timeline display including automation tracks"""
-        # Clear existing widgets
-        for i in reversed(range(self.timeline_layout.count())):
-            item = self.timeline_layout.itemAt(i)
-            if item:
-                widget = item.widget()
-                if widget:
-                    widget.setParent(None)
-        
-        # Add main tracks
-        for track in self.tracks:
-            track_widget = TimelineTrackWidget(track, self)
-            track_widget.clip_selected.connect(self.clip_selected.emit)
-            track_widget.clip_moved.connect(self.on_clip_moved)
-            self.timeline_layout.addWidget(track_widget)
-            
-            # Add automation tracks if visible
-            if track.show_automation:
-                for automation in track.automation_tracks:
-                    automation_widget = self.create_automation_widget(automation)
-                    self.timeline_layout.addWidget(automation_widget)
-        
-        self.update_timeline_size()
-        
-    def create_automation_widget(self, automation: AutomationTrack) -> QWidget:
-        """Create a widget for displaying automation tracks"""
-        automation_widget = QWidget()
-        automation_widget.setFixedHeight(automation.height)
-        automation_widget.setStyleSheet("background-color: #2a2a2a; border: 1px solid #444444;")
-        
-        layout = QHBoxLayout(automation_widget)
-        layout.setContentsMargins(5, 0, 5, 0)
-        
-        # Automation parameter label
-        label = QLabel(f"{automation.parameter_name.title()}")
-        label.setFixedWidth(80)
-        label.setStyleSheet("font-size: 10px; color: #cccccc;")
-        layout.addWidget(label)
-        
-        # TODO: Add automation curve drawing here
-        curve_area = QWidget()
-        curve_area.setStyleSheet("background-color: #333333;")
-        layout.addWidget(curve_area)
-        
-        return automation_widget
-        
-    def generate_waveform_data(self, file_path: str, clip: TimelineClip):
-        """Generate waveform data for audio clips"""
-        try:
-            from moviepy import VideoFileClip, AudioFileClip
-            import numpy as np
-            
-            # Try to load as video first (might have audio)
-            try:
-                video_clip = VideoFileClip(file_path)
-                if video_clip.audio:
-                    audio_array = video_clip.audio.to_soundarray()
-                    video_clip.close()
-                else:
-                    return None
-            except:
-                # Try as audio file
-                try:
-                    audio_clip = AudioFileClip(file_path)
-                    audio_array = audio_clip.to_soundarray()
-                    audio_clip.close()
-                except:
-                    return None
-            
-            # Convert stereo to mono by averaging channels
-            if len(audio_array.shape) > 1:
-                audio_array = np.mean(audio_array, axis=1)
-            
-            # Downsample for waveform display (every 100th sample)
-            sample_rate = 100
-            downsampled = audio_array[::len(audio_array)//sample_rate] if len(audio_array) > sample_rate else audio_array
-            
-            # Normalize to [-1, 1] range
-            if np.max(np.abs(downsampled)) > 0:
-                downsampled = downsampled / np.max(np.abs(downsampled))
-            
-            clip.waveform_data = downsampled.tolist()
-            clip.has_audio = True
-            
-        except Exception as e:
-            print(f"Error generating waveform data: {e}")
-            clip.waveform_data = None
+"""
+Professional Timeline Widget for PyVideoEditor
+Adobe Premiere-style timeline with multi-track support, drag-and-drop, and scrubbing
+"""
+
+import sys
+import os
+from PyQt6.QtWidgets import (
+    QWidget, QVBoxLayout, QHBoxLayout, QLabel, QPushButton, QSlider,
+    QScrollArea, QFrame, QSizePolicy, QSpinBox, QComboBox, QToolBar,
+    QButtonGroup
+)
+from PyQt6.QtCore import (Qt, QRect, QPoint, QLine, QTimer, pyqtSignal, QMimeData,
+                          QRunnable, QThreadPool)
+from PyQt6.QtGui import (
+    QPainter, QColor, QPen, QBrush, QFont, QFontMetrics, QPixmap, QPalette,
+    QMouseEvent, QDragEnterEvent, QDropEvent, QDrag, QShortcut, QKeySequence
+)
+from typing import List, Dict, Optional, Tuple
+from pathlib import Path
+import bisect
+import math
+import hashlib
+import subprocess
+from enum import Enum
+from functools import lru_cache, partial
+import numpy as np
+
+try:
+    from numba import njit
+    NUMBA_AVAILABLE = True
+except ImportError:
+    NUMBA_AVAILABLE = False
+
+_moviepy_classes = None
+
+def _moviepy():
+    """Resolve moviepy clip classes once, on first media use
+
+    Importing at module top would push moviepy's heavy package walk into
+    application startup; per-call `from moviepy import ...` repeats the
+    sys.modules machinery on every drop. A cached tuple does neither.
+    """
+    global _moviepy_classes
+    if _moviepy_classes is None:
+        from moviepy import VideoFileClip, AudioFileClip, ImageClip
+        _moviepy_classes = (VideoFileClip, AudioFileClip, ImageClip)
+    return _moviepy_classes
+
+if NUMBA_AVAILABLE:
+    @njit(cache=True)
+    def _sample_automation(times, values, queries, out):
+        """Lerp sorted keyframes at sorted query times, one pointer pass"""
+        n = len(times)
+        j = 0
+        for i in range(len(queries)):
+            q = queries[i]
+            if q <= times[0]:
+                out[i] = values[0]
+                continue
+            if q >= times[n - 1]:
+                out[i] = values[n - 1]
+                continue
+            while times[j + 1] < q:
+                j += 1
+            t1 = times[j]
+            t2 = times[j + 1]
+            out[i] = values[j] + (values[j + 1] - values[j]) * (q - t1) / (t2 - t1)
+
+def _build_peak_pyramid(wave) -> list:
+    """Progressively halved |peak| arrays: level k covers 2**k samples.
+
+    Built once per clip in O(n) total, so zoom changes reduce from the
+    nearest precomputed level instead of from the raw samples each time.
+    """
+    level = np.abs(np.asarray(wave, dtype=np.float32))
+    pyramid = [level]
+    while len(level) > 2:
+        if len(level) % 2:
+            level = np.append(level, level[-1])
+        level = np.maximum(level[::2], level[1::2])
+        pyramid.append(level)
+    return pyramid
+
+@lru_cache(maxsize=4096)
+def _fmt_time_frames(frame_index: int) -> str:
+    """MM:SS.ff for a 30fps frame index; repaints reuse the same ticks"""
+    total_secs, frames = divmod(frame_index, 30)
+    minutes, secs = divmod(total_secs, 60)
+    return f"{minutes:02d}:{secs:02d}.{frames:02d}"
+
+@lru_cache(maxsize=4096)
+def _fmt_duration(whole_secs: int) -> str:
+    """MM:SS for a whole number of seconds"""
+    minutes, secs = divmod(whole_secs, 60)
+    return f"{minutes:02d}:{secs:02d}"
+
+# On-disk waveform peak cache (re-adding a file becomes a ~1 ms load
+# instead of a full audio decode)
+WAVEFORM_CACHE_DIR = Path.home() / ".pyvideo_cache" / "waveforms"
+WAVEFORM_CACHE_MAX_BYTES = 256 * 1024 * 1024
+
+class TimelineTool(Enum):
+    """Timeline editing tools"""
+    SELECT = "select"
+    RAZOR = "razor"
+    ZOOM = "zoom"
+    HAND = "hand"          # Pan tool
+    SLIP = "slip"          # Slip edit
+    SLIDE = "slide"        # Slide edit
+    RIPPLE = "ripple"      # Ripple edit
+    ROLLING = "rolling"    # Rolling edit
+
+class TimelineClip:
+    """Represents a clip on the timeline"""
+
+    # Timelines hold many of these and the paint loop reads them hard;
+    # slots drop the per-instance dict and make attribute loads fixed-offset
+    __slots__ = ('clip_id', 'name', '_start_time', '_duration', 'end_time_f',
+                 'track', 'clip_type', 'color', 'selected', 'thumbnail',
+                 'waveform_data', '_peak_cache', '_peak_pyramid',
+                 '_body_cache', 'has_audio', 'has_video')
+
+    def __init__(self, clip_id: str, name: str, start_time: float, duration: float, track: int, clip_type: str = "video"):
+        self.clip_id = clip_id
+        self.name = name
+        self._start_time = start_time
+        self._duration = duration
+        self.end_time_f = start_time + duration
+        self.track = track
+        self.clip_type = clip_type  # "video", "audio", or "both"
+        self.color = QColor(70, 130, 180) if clip_type == "video" else QColor(50, 150, 50)
+        self.selected = False
+        self.thumbnail = None
+        self.waveform_data = None  # Audio waveform peaks (float32 ndarray)
+        self._peak_cache = {}  # pixel width -> per-pixel peak array
+        self._peak_pyramid = None  # halved |peak| levels, built on first draw
+        self._body_cache = {}  # (w, h, selected, rgb, name) -> rendered QPixmap
+        self.has_audio = False
+        self.has_video = True if clip_type != "audio" else False
+        
+    # start_time and duration go through setters so the end time is
+    # precomputed once per write; contains_time runs per clip per mouse
+    # move and is now two comparisons with no call or addition
+    @property
+    def start_time(self) -> float:
+        return self._start_time
+
+    @start_time.setter
+    def start_time(self, value: float):
+        self._start_time = value
+        self.end_time_f = value + self._duration
+
+    @property
+    def duration(self) -> float:
+        return self._duration
+
+    @duration.setter
+    def duration(self, value: float):
+        self._duration = value
+        self.end_time_f = self._start_time + value
+
+    def end_time(self) -> float:
+        return self.end_time_f
+
+    def contains_time(self, time: float) -> bool:
+        return self._start_time <= time <= self.end_time_f
+
+    def clone(self) -> 'TimelineClip':
+        """Copy for the clipboard, sharing the read-only display data
+
+        deepcopy would reflectively duplicate QColor, waveform arrays
+        and render caches; the waveform is never mutated in place and
+        cache entries are keyed by appearance, so sharing them is safe.
+        """
+        c = TimelineClip.__new__(TimelineClip)
+        for name in TimelineClip.__slots__:
+            setattr(c, name, getattr(self, name))
+        c.color = QColor(self.color)  # callers tint colors per clip
+        return c
+
+class AutomationTrack:
+    """Represents an automation track for parameters like volume, opacity, etc."""
+
+    __slots__ = ('parent_track_id', 'parameter_name', 'keyframes', 'enabled',
+                 'height', 'min_value', 'max_value', '_times_arr',
+                 '_values_arr', '_last_idx')
+
+    def __init__(self, parent_track_id: int, parameter_name: str):
+        self.parent_track_id = parent_track_id
+        self.parameter_name = parameter_name  # "volume", "opacity", "pan", etc.
+        self.keyframes = {}  # time -> value mapping
+        self.enabled = False
+        self.height = 40
+        self.min_value = 0.0
+        self.max_value = 1.0
+        # Sorted time/value arrays for lookups; rebuilt lazily after edits
+        self._times_arr = None
+        self._values_arr = None
+        # Bracket index served on the previous call: playback queries
+        # arrive in increasing time order, so the next answer is almost
+        # always the same bracket or the one right after it
+        self._last_idx = 0
+
+    def add_keyframe(self, time: float, value: float):
+        self.keyframes[time] = max(self.min_value, min(self.max_value, value))
+        self._times_arr = None
+        self._last_idx = 0
+
+    def remove_keyframe(self, time: float):
+        if time in self.keyframes:
+            del self.keyframes[time]
+            self._times_arr = None
+            self._last_idx = 0
+
+    def _rebuild_arrays(self):
+        """Sort the keyframes once so per-tick lookups stay O(log n)"""
+        times = sorted(self.keyframes)
+        self._times_arr = np.fromiter(times, dtype=np.float64, count=len(times))
+        self._values_arr = np.fromiter(
+            (self.keyframes[t] for t in times), dtype=np.float64, count=len(times))
+
+    def sample_range(self, t0: float, t1: float, n: int) -> np.ndarray:
+        """Sample the curve at n evenly spaced times in [t0, t1].
+
+        This is the bulk path for drawing an automation lane: one value
+        per pixel column, computed in a single compiled pass instead of
+        n Python-level get_value_at_time calls.
+        """
+        queries = np.linspace(t0, t1, n)
+        if not self.keyframes:
+            return np.full(n, (self.min_value + self.max_value) / 2)
+        if self._times_arr is None:
+            self._rebuild_arrays()
+        if NUMBA_AVAILABLE:
+            out = np.empty(n, dtype=np.float64)
+            _sample_automation(self._times_arr, self._values_arr, queries, out)
+            return out
+        # np.interp is the same clamp-and-lerp, vectorized in C
+        return np.interp(queries, self._times_arr, self._values_arr)
+
+    def get_value_at_time(self, time: float) -> float:
+        if not self.keyframes:
+            return (self.min_value + self.max_value) / 2  # Default middle value
+
+        # get_value_at_time runs on every playhead tick, so the sort
+        # happens once per edit rather than once per call, and the
+        # bracketing pair comes from a binary search instead of a scan
+        if self._times_arr is None:
+            self._rebuild_arrays()
+        times = self._times_arr
+        values = self._values_arr
+
+        if time <= times[0]:
+            return float(values[0])
+        if time >= times[-1]:
+            return float(values[-1])
+
+        # Try the bracket from the previous call first, then probe a few
+        # steps forward (covers playback advancing past a keyframe, with
+        # or without dropped frames) before paying for a binary search
+        n = len(times)
+        i = 0
+        last = self._last_idx
+        for probe in range(last, min(last + 4, n)):
+            if probe >= 1 and times[probe - 1] <= time < times[probe]:
+                i = probe
+                break
+        if i == 0:
+            i = int(np.searchsorted(times, time, side='right'))
+        self._last_idx = i
+
+        # Linear interpolation between the bracketing keyframes
+        t1, t2 = times[i - 1], times[i]
+        factor = (time - t1) / (t2 - t1)
+        return float(values[i - 1] + (values[i] - values[i - 1]) * factor)
+
+class TimelineTrack:
+    """Represents a single track on the timeline"""
+
+    __slots__ = ('track_id', 'name', 'track_type', 'clips', 'muted',
+                 'locked', 'solo', 'height', 'automation_tracks',
+                 'show_automation', '_starts', '_id_to_clip', '_max_duration')
+
+    def __init__(self, track_id: int, name: str, track_type: str = "video"):
+        self.track_id = track_id
+        self.name = name
+        self.track_type = track_type  # "video", "audio", or "automation"
+        self.clips: List[TimelineClip] = []
+        self.muted = False
+        self.locked = False
+        self.solo = False
+        self.height = 60 if track_type == "video" else 40 if track_type == "audio" else 40
+        self.automation_tracks: List[AutomationTrack] = []
+        self.show_automation = False
+        # Sorted start times and id lookup kept alongside clips so the
+        # per-mouse-move and per-id queries don't scan the whole track
+        self._starts: List[float] = []
+        self._id_to_clip: Dict[str, TimelineClip] = {}
+        self._max_duration = 0.0
+        
+        # Create default automation tracks for audio
+        if track_type == "audio":
+            self.automation_tracks.append(AutomationTrack(track_id, "volume"))
+            self.automation_tracks.append(AutomationTrack(track_id, "pan"))
+        elif track_type == "video":
+            self.automation_tracks.append(AutomationTrack(track_id, "opacity"))
+            
+    def add_automation_track(self, parameter_name: str):
+        """Add a new automation track for a parameter"""
+        automation = AutomationTrack(self.track_id, parameter_name)
+        self.automation_tracks.append(automation)
+        return automation
+        
+    def get_automation_track(self, parameter_name: str) -> Optional[AutomationTrack]:
+        """Get automation track by parameter name"""
+        for automation in self.automation_tracks:
+            if automation.parameter_name == parameter_name:
+                return automation
+        return None
+        
+    def toggle_automation_visibility(self):
+        """Toggle visibility of automation tracks"""
+        self.show_automation = not self.show_automation
+        
+    def _reindex(self):
+        """Re-sort clips and rebuild the start-time/id indexes"""
+        self.clips.sort(key=lambda c: c.start_time)
+        self._starts = [c.start_time for c in self.clips]
+        self._id_to_clip = {c.clip_id: c for c in self.clips}
+        self._max_duration = max((c.duration for c in self.clips), default=0.0)
+
+    def _index_of(self, clip: TimelineClip) -> int:
+        """Position of a clip in the sorted list, -1 if the index is stale"""
+        i = bisect.bisect_left(self._starts, clip.start_time)
+        while i < len(self.clips) and self.clips[i] is not clip:
+            i += 1
+        return i if i < len(self.clips) else -1
+
+    def add_clip(self, clip: TimelineClip):
+        # Insert at the sorted position instead of re-sorting the whole
+        # track per insert; keeps timeline building linear per clip
+        i = bisect.bisect_right(self._starts, clip.start_time)
+        self.clips.insert(i, clip)
+        self._starts.insert(i, clip.start_time)
+        self._id_to_clip[clip.clip_id] = clip
+        if clip.duration > self._max_duration:
+            self._max_duration = clip.duration
+
+    def move_clip(self, clip_id: str, new_start_time: float) -> bool:
+        clip = self.get_clip_by_id(clip_id)
+        if clip and not self.locked:
+            i = self._index_of(clip)
+            if i < 0:
+                # Index went stale (start_time mutated directly); rebuild
+                clip.start_time = new_start_time
+                self._reindex()
+                return True
+            self.clips.pop(i)
+            self._starts.pop(i)
+            clip.start_time = new_start_time
+            j = bisect.bisect_right(self._starts, new_start_time)
+            self.clips.insert(j, clip)
+            self._starts.insert(j, new_start_time)
+            return True
+        return False
+
+    def get_clip_by_id(self, clip_id: str) -> Optional[TimelineClip]:
+        return self._id_to_clip.get(clip_id)
+
+    def split_clip(self, clip_id: str, split_time: float) -> Optional[Tuple[TimelineClip, TimelineClip]]:
+        """Split a clip at the specified time, returns (left_clip, right_clip) or None"""
+        clip = self.get_clip_by_id(clip_id)
+        if clip and clip.start_time < split_time < clip.end_time():
+            # Calculate durations
+            left_duration = split_time - clip.start_time
+            right_duration = clip.end_time() - split_time
+            
+            # Create right clip
+            right_clip = TimelineClip(
+                f"{clip_id}_split",
+                f"{clip.name} (2)",
+                split_time,
+                right_duration,
+                clip.track
+            )
+            right_clip.color = clip.color
+            
+            # Update original clip (becomes left clip)
+            clip.duration = left_duration
+            clip.name = f"{clip.name} (1)" if not clip.name.endswith(" (1)") else clip.name
+            
+            # Add right clip to track
+            self.add_clip(right_clip)
+            
+            return (clip, right_clip)
+        return None
+    def remove_clip(self, clip_id: str):
+        clip = self._id_to_clip.pop(clip_id, None)
+        if clip is None:
+            return
+        i = self._index_of(clip)
+        if i < 0:
+            self.clips = [c for c in self.clips if c.clip_id != clip_id]
+            self._reindex()
+            return
+        self.clips.pop(i)
+        self._starts.pop(i)
+        if clip.duration >= self._max_duration:
+            self._max_duration = max((c.duration for c in self.clips), default=0.0)
+
+    def get_clip_at_time(self, time: float) -> Optional[TimelineClip]:
+        # Clips are sorted by start time, so only clips starting at or
+        # before `time` can contain it; bisect lands on the nearest
+        # candidate and the walk back only matters for overlapping clips
+        i = bisect.bisect_right(self._starts, time) - 1
+        for j in range(i, -1, -1):
+            if self.clips[j].contains_time(time):
+                return self.clips[j]
+            # No clip starting this far back can reach `time`
+            if time - self._starts[j] > self._max_duration:
+                break
+        return None
+
+class TimelineRuler(QWidget):
+    """Timeline ruler showing time markers"""
+    
+    def __init__(self, timeline_widget):
+        super().__init__()
+        self.timeline_widget = timeline_widget
+        self.setFixedHeight(20)  # Thinner ruler height
+        self.setMouseTracking(True)
+        
+    def paintEvent(self, event):
+        painter = QPainter(self)
+        painter.fillRect(self.rect(), QColor(45, 45, 45))
+        
+        # Get timeline parameters
+        pixels_per_second = self.timeline_widget.pixels_per_second
+        start_time = self.timeline_widget.scroll_offset / pixels_per_second
+        width = self.width()
+        
+        # Draw time markers
+        painter.setPen(QPen(QColor(200, 200, 200), 1))
+        painter.setFont(QFont("Arial", 7))  # Smaller font for more compact look
+        
+        # Calculate marker interval based on zoom level
+        if pixels_per_second > 100:
+            interval = 0.5  # 0.5 second intervals
+        elif pixels_per_second > 50:
+            interval = 1.0  # 1 second intervals
+        elif pixels_per_second > 20:
+            interval = 5.0  # 5 second intervals
+        else:
+            interval = 10.0  # 10 second intervals
+            
+        # Draw markers: all positions come out of one vectorized pass and
+        # the ticks go to the painter as a single batch; only the labels
+        # (and only the visible ones) still loop
+        start_marker = int(start_time / interval) * interval
+        n = int(width / (interval * pixels_per_second)) + 2
+        times = np.arange(n, dtype=np.float64) * interval + start_marker
+        xs = (times * pixels_per_second - self.timeline_widget.scroll_offset).astype(np.int32)
+        in_range = (xs >= 0) & (xs <= width)
+        xs_visible = xs[in_range].tolist()
+
+        painter.drawLines([QLine(x, 20, x, 30) for x in xs_visible])
+        for x, time in zip(xs_visible, times[in_range].tolist()):
+            painter.drawText(x + 2, 15, self.format_time(time))
+                
+    def format_time(self, seconds: float) -> str:
+        """Format time as MM:SS.ff (assuming 30fps)"""
+        return _fmt_time_frames(int(seconds * 30))
+
+class TimelineTrackWidget(QWidget):
+    """Widget representing a single track"""
+    
+    clip_selected = pyqtSignal(str)  # clip_id
+    clip_moved = pyqtSignal(str, float, int)  # clip_id, new_time, new_track
+
+    # Shared fonts and metrics for clip bodies, created on first render
+    # (fonts need the QApplication) instead of twice per rendered clip
+    _name_font = None
+    _duration_font = None
+    _name_metrics = None
+
+    def __init__(self, track: TimelineTrack, timeline_widget):
+        super().__init__()
+        self.track = track
+        self.timeline_widget = timeline_widget
+        self.setFixedHeight(track.height)
+        self.setAcceptDrops(True)
+        self.setMouseTracking(True)
+        
+        self.dragging_clip = None
+        self.drag_start_pos = None
+        self.drag_offset = 0
+
+        # Keep the layout slot when hidden so vertical-viewport culling
+        # can toggle visibility without reflowing the other tracks
+        size_policy = self.sizePolicy()
+        size_policy.setRetainSizeWhenHidden(True)
+        self.setSizePolicy(size_policy)
+
+        # High-rate mice deliver far more move events than the display
+        # can show; coalesce repaints to at most one per ~frame
+        self._drag_dirty = QRect()
+        self._drag_update_timer = QTimer(self)
+        self._drag_update_timer.setSingleShot(True)
+        self._drag_update_timer.setInterval(16)
+        self._drag_update_timer.timeout.connect(self._flush_drag_update)
+
+        # Off-screen strip of rendered track contents; scrolling within
+        # its coverage blits from it instead of redrawing clips
+        self._strip_pixmap: Optional[QPixmap] = None
+        self._strip_key = None  # (pps, clip epoch, height) when rendered
+        self._strip_x0 = 0  # timeline x (px) of the strip's left edge
+
+    def _flush_drag_update(self):
+        """Repaint the region accumulated since the last drag repaint"""
+        if not self._drag_dirty.isNull():
+            self.update(self._drag_dirty)
+            self._drag_dirty = QRect()
+
+    def paintEvent(self, event):
+        painter = QPainter(self)
+
+        # Honor the dirty region: a playhead tick or small drag only
+        # invalidates a band, so don't refill/redraw the whole track
+        dirty = event.rect()
+
+        scroll_offset = self.timeline_widget.scroll_offset
+
+        # While dragging, clip positions change between content epochs,
+        # so paint the small dirty band directly instead of rebuilding
+        # the cached strip every move
+        if self.dragging_clip is not None:
+            self._strip_key = None
+            self._paint_contents(painter, dirty, scroll_offset, self.width())
+            return
+
+        # Blit from an off-screen strip covering the viewport plus one
+        # viewport width of overscan each side; scrolling inside that
+        # range is a single pixmap copy with no clip drawing at all
+        view_w = max(1, self.timeline_widget.scroll_area.viewport().width())
+        key = (self.timeline_widget.pixels_per_second,
+               self.timeline_widget._clip_epoch, self.height())
+        strip = self._strip_pixmap
+        if (strip is None or key != self._strip_key
+                or scroll_offset < self._strip_x0
+                or scroll_offset + view_w > self._strip_x0 + strip.width()):
+            x0 = max(0, scroll_offset - view_w)
+            strip = QPixmap(view_w * 3, self.height())
+            strip_painter = QPainter(strip)
+            self._paint_contents(strip_painter,
+                                 QRect(0, 0, strip.width(), self.height()),
+                                 x0, strip.width())
+            strip_painter.end()
+            self._strip_pixmap = strip
+            self._strip_key = key
+            self._strip_x0 = x0
+        src = dirty.translated(scroll_offset - self._strip_x0, 0)
+        if src.left() < 0 or src.right() >= strip.width():
+            # Dirty region extends past the strip (e.g. a full-widget
+            # grab); paint it directly rather than blitting blanks
+            self._paint_contents(painter, dirty, scroll_offset, self.width())
+        else:
+            painter.drawPixmap(dirty, strip, src)
+
+    def _paint_contents(self, painter: QPainter, dirty: QRect,
+                        scroll_offset: int, view_width: int):
+        """Paint background and clips with the given horizontal offset"""
+        # Track background
+        bg_color = QColor(60, 60, 60) if self.track.track_type == "video" else QColor(50, 70, 50)
+        painter.fillRect(dirty, bg_color)
+
+        # Draw clips
+        pixels_per_second = self.timeline_widget.pixels_per_second
+
+        # Cull to the visible window up front: clips are sorted by start
+        # time, so bisect finds the slice that can intersect the view
+        # (padded back by the longest clip) instead of testing every clip
+        starts = self.track._starts
+        visible_start = scroll_offset / pixels_per_second
+        visible_end = (scroll_offset + view_width) / pixels_per_second
+        lo = bisect.bisect_left(starts, visible_start - self.track._max_duration)
+        hi = bisect.bisect_right(starts, visible_end)
+
+        visible = self.track.clips[lo:hi]
+        if visible:
+            # Compute all clip geometry in one vectorized pass so the
+            # draw loop iterates plain ints with no per-clip arithmetic
+            n = len(visible)
+            geom = np.empty((n, 2), dtype=np.float64)
+            for i, clip in enumerate(visible):
+                geom[i, 0] = clip._start_time
+                geom[i, 1] = clip._duration
+            xs = (geom[:, 0] * pixels_per_second - scroll_offset).astype(np.int32)
+            ws = (geom[:, 1] * pixels_per_second).astype(np.int32)
+
+            body_h = self.height() - 10
+            for i, clip in enumerate(visible):
+                clip_rect = QRect(int(xs[i]), 5, int(ws[i]), body_h)
+
+                # Only draw if visible and touching the dirty region
+                if clip_rect.right() >= 0 and clip_rect.left() <= view_width \
+                        and clip_rect.intersects(dirty):
+                    self.draw_clip(painter, clip, clip_rect)
+
+    def draw_clip(self, painter: QPainter, clip: TimelineClip, rect: QRect):
+        """Draw a single clip, blitting its cached body when unchanged"""
+        width, height = rect.width(), rect.height()
+        if width <= 0 or height <= 0:
+            return
+
+        # The body only changes with size, selection, color or name;
+        # scrolling just moves it, so repaint becomes one pixmap blit
+        key = (width, height, clip.selected, clip.color.rgb(), clip.name)
+        pixmap = clip._body_cache.get(key)
+        if pixmap is None:
+            pixmap = self._render_clip_body(clip, width, height)
+            if len(clip._body_cache) >= 4:  # sizes churn while zooming
+                clip._body_cache.clear()
+            clip._body_cache[key] = pixmap
+        painter.drawPixmap(rect.topLeft(), pixmap)
+
+    def _render_clip_body(self, clip: TimelineClip, width: int, height: int) -> QPixmap:
+        """Render a clip's full body (fill, waveform, text) to a pixmap"""
+        pixmap = QPixmap(width, height)
+        rect = QRect(0, 0, width, height)
+        painter = QPainter(pixmap)
+
+        # Clip background
+        color = clip.color
+        if clip.selected:
+            color = color.lighter(150)
+
+        painter.fillRect(rect, color)
+
+        # Draw waveform for audio clips or clips with audio
+        if (clip.clip_type == "audio" or clip.has_audio) and clip.waveform_data is not None:
+            self.draw_waveform(painter, clip, rect)
+
+        # Draw video thumbnail strip for video clips
+        if clip.clip_type == "video" and self.track.track_type == "video":
+            self.draw_video_thumbnails(painter, clip, rect)
+
+        # Clip border
+        border_color = QColor(255, 255, 255) if clip.selected else QColor(30, 30, 30)
+        painter.setPen(QPen(border_color, 2 if clip.selected else 1))
+        painter.drawRect(0, 0, width - 1, height - 1)
+
+        cls = TimelineTrackWidget
+        if cls._name_font is None:
+            cls._name_font = QFont("Arial", 8)  # Smaller font for clips
+            cls._duration_font = QFont("Arial", 6)  # Smaller duration text
+            cls._name_metrics = QFontMetrics(cls._name_font)
+
+        # Clip name
+        painter.setPen(QPen(QColor(255, 255, 255), 1))
+        painter.setFont(cls._name_font)
+
+        # Truncate name if too long; the length estimate skips the
+        # metrics queries entirely for names that obviously fit
+        font_metrics = cls._name_metrics
+        text = clip.name
+        if (len(text) * 6 > width - 10
+                and font_metrics.horizontalAdvance(text) > width - 10):
+            text = font_metrics.elidedText(text, Qt.TextElideMode.ElideRight, width - 10)
+
+        painter.drawText(5, 15, text)
+
+        # Duration text
+        duration_text = self.format_duration(clip.duration)
+        painter.setFont(cls._duration_font)
+        painter.drawText(5, height - 3, duration_text)  # Closer to bottom
+
+        painter.end()
+        return pixmap
+        
+    def draw_waveform(self, painter: QPainter, clip: TimelineClip, rect: QRect):
+        """Draw audio waveform inside the clip"""
+        wave = clip.waveform_data
+        width = rect.width()
+        if wave is None or not len(wave) or width <= 0:
+            return
+
+        # Per-pixel peaks are reduced once per width in a vectorized pass
+        # and cached; scrolling repaints then just draw the cached array
+        peaks = clip._peak_cache.get(width)
+        if peaks is None:
+            # Reduce from the pyramid level nearest the needed rate so a
+            # zoom change touches ~2*width samples, not the raw buffer
+            if clip._peak_pyramid is None:
+                clip._peak_pyramid = _build_peak_pyramid(wave)
+            pyramid = clip._peak_pyramid
+            samples_per_pixel = max(1, len(pyramid[0]) // width)
+            level = min(samples_per_pixel.bit_length() - 1, len(pyramid) - 1)
+            arr = pyramid[level]
+            step = max(1, len(arr) // width)
+            usable = step * width
+            if usable <= len(arr):
+                peaks = arr[:usable].reshape(width, step).max(axis=1)
+            else:
+                peaks = arr
+            if len(clip._peak_cache) >= 8:  # widths come and go with zoom
+                clip._peak_cache.clear()
+            clip._peak_cache[width] = peaks
+
+        painter.setPen(QPen(QColor(255, 255, 255, 100), 1))
+
+        # Calculate waveform display parameters
+        waveform_height = rect.height() - 20  # Leave space for text
+        center_y = rect.y() + rect.height() // 2
+
+        heights = (peaks * (waveform_height / 2)).astype(np.int32)
+        x0 = rect.x()
+        lines = [QLine(x0 + x, center_y - h, x0 + x, center_y + h)
+                 for x, h in enumerate(heights.tolist())]
+        painter.drawLines(lines)
+                
+    def draw_video_thumbnails(self, painter: QPainter, clip: TimelineClip, rect: QRect):
+        """Draw video thumbnail strip inside the clip"""
+        if not clip.thumbnail:
+            # Draw placeholder for video
+            painter.setPen(QPen(QColor(200, 200, 200, 50), 1))
+            painter.drawText(rect.center(), "Video")
+            return
+            
+        # TODO: Implement thumbnail strip drawing
+        # This would require extracting thumbnails from video at regular intervals
+        pass
+        
+    def format_duration(self, seconds: float) -> str:
+        """Format duration as MM:SS"""
+        return _fmt_duration(int(seconds))
+        
+    def mousePressEvent(self, event: QMouseEvent):
+        if event.button() == Qt.MouseButton.LeftButton:
+            clip = self.get_clip_at_position(event.position().toPoint())
+            current_tool = self.timeline_widget.current_tool
+            
+            if current_tool == TimelineTool.RAZOR and clip:
+                # Split clip at current position
+                time = (event.position().x() + self.timeline_widget.scroll_offset) / self.timeline_widget.pixels_per_second
+                if self.track.split_clip(clip.clip_id, time):
+                    # Bump the epoch so the cached strip, clip aggregates
+                    # and snap boundaries pick up the new clip
+                    self.timeline_widget._invalidate_snap_index()
+                    self.timeline_widget._schedule_update()
+                self.update()
+                
+            elif current_tool == TimelineTool.SELECT and clip:
+                # Select clip
+                self.select_clip(clip)
+                self.clip_selected.emit(clip.clip_id)
+                
+                # Start drag
+                self.dragging_clip = clip
+                self.drag_start_pos = event.position().toPoint()
+                self.drag_offset = event.position().x() - (clip.start_time * self.timeline_widget.pixels_per_second - self.timeline_widget.scroll_offset)
+                
+    def mouseMoveEvent(self, event: QMouseEvent):
+        if (self.dragging_clip and event.buttons() & Qt.MouseButton.LeftButton and 
+            self.timeline_widget.current_tool == TimelineTool.SELECT):
+            # Calculate new time position
+            new_x = event.position().x() - self.drag_offset
+            new_time = (new_x + self.timeline_widget.scroll_offset) / self.timeline_widget.pixels_per_second
+            new_time = max(0, new_time)  # Don't allow negative time
+            
+            # Enhanced snapping if enabled
+            if self.timeline_widget.snap_enabled:
+                new_time = self.timeline_widget.snap_time(new_time, self.dragging_clip)
+            
+            # Calculate new track ID: cumulative heights + bisect give the
+            # band under the cursor (and handle mixed track heights, which
+            # the old uniform-stride scan got wrong)
+            new_y = event.position().y()
+            track_index = self.indexForTrack(self.dragging_clip.track)  # Get current index
+            hit = self.timeline_widget.track_index_at_y(new_y)
+            new_track_index = hit if hit is not None else track_index
+
+            # Move clip to new track if needed
+            if new_track_index != track_index:
+                self.timeline_widget.move_clip_to_track(self.dragging_clip, new_track_index)
+
+            # Invalidate only the band the clip vacated plus where it
+            # landed (padded for the border stroke) instead of the whole
+            # track width
+            pps = self.timeline_widget.pixels_per_second
+            scroll = self.timeline_widget.scroll_offset
+            old_x = int(self.dragging_clip.start_time * pps - scroll)
+            self.dragging_clip.start_time = new_time
+            new_clip_x = int(new_time * pps - scroll)
+            clip_w = int(self.dragging_clip.duration * pps)
+            left = min(old_x, new_clip_x) - 2
+            right = max(old_x, new_clip_x) + clip_w + 2
+            self._drag_dirty = self._drag_dirty.united(QRect(left, 0, right - left, self.height()))
+            if not self._drag_update_timer.isActive():
+                self._drag_update_timer.start()
+    
+    def mouseReleaseEvent(self, event: QMouseEvent):
+        """Handle mouse release event to complete drag operation"""
+        if event.button() == Qt.MouseButton.LeftButton and self.dragging_clip:
+            # Paint the final drop position immediately rather than waiting
+            # out the throttle interval
+            self._drag_update_timer.stop()
+            self._flush_drag_update()
+
+            # The drag mutated start_time directly; restore sorted order
+            # and the lookup indexes on whichever track holds the clip now
+            # (a cross-track drag moved it off this widget's track)
+            tracks = self.timeline_widget.tracks
+            track_id = self.dragging_clip.track
+            if 0 <= track_id < len(tracks):
+                tracks[track_id]._reindex()
+            else:
+                self.track._reindex()
+
+            # Emit clip moved signal
+            self.clip_moved.emit(
+                self.dragging_clip.clip_id, 
+                self.dragging_clip.start_time, 
+                self.dragging_clip.track
+            )
+            
+            # Clear drag state
+            self.dragging_clip = None
+            self.drag_start_pos = None
+            self.drag_offset = 0
+            
+            # Final update
+            self.update()
+    
+    def get_clip_at_position(self, pos: QPoint) -> Optional[TimelineClip]:
+        """Get clip at mouse position"""
+        time = (pos.x() + self.timeline_widget.scroll_offset) / self.timeline_widget.pixels_per_second
+        return self.track.get_clip_at_time(time)
+        
+    def select_clip(self, clip: TimelineClip):
+        """Select a clip and deselect others"""
+        # Invalidate only the clips whose selection actually flipped
+        # instead of repainting the whole track
+        pps = self.timeline_widget.pixels_per_second
+        scroll = self.timeline_widget.scroll_offset
+        dirty = QRect()
+        for c in self.track.clips:
+            now = (c == clip)
+            if c.selected != now:
+                c.selected = now
+                x = int(c.start_time * pps - scroll) - 2
+                w = int(c.duration * pps) + 4
+                dirty = dirty.united(QRect(x, 0, w, self.height()))
+        if not dirty.isNull():
+            self.timeline_widget._clip_epoch += 1
+            self.update(dirty)
+    
+    def indexForTrack(self, track_id: int) -> int:
+        """Get the index of a track by its ID"""
+        # Default to first track if not found
+        return self.timeline_widget._track_id_to_index.get(track_id, 0)
+    
+    def dragEnterEvent(self, event):
+        """Handle drag enter event for movable components"""
+        if event.mimeData().hasUrls() or event.mimeData().hasText():
+            event.acceptProposedAction()
+        else:
+            event.ignore()
+    
+    def dragMoveEvent(self, event):
+        """Handle drag move event"""
+        if event.mimeData().hasUrls() or event.mimeData().hasText():
+            event.acceptProposedAction()
+        else:
+            event.ignore()
+    
+    def dropEvent(self, event):
+        """Handle drop event"""
+        # Get file paths from drop
+        file_paths = []
+        if event.mimeData().hasUrls():
+            for url in event.mimeData().urls():
+                if url.isLocalFile():
+                    file_paths.append(url.toLocalFile())
+        elif event.mimeData().hasText():
+            file_paths = event.mimeData().text().split('\n')
+        
+        # Add files to timeline (let timeline widget handle track assignment)
+        for file_path in file_paths:
+            if file_path.strip():
+                self.timeline_widget.add_media_file(file_path)
+        
+        event.acceptProposedAction()
+
+class PlayheadOverlay(QWidget):
+    """Transparent overlay that draws only the playhead line
+
+    Moving the playhead repaints this thin widget instead of every
+    track widget underneath it.
+    """
+
+    def __init__(self, timeline_widget):
+        super().__init__(timeline_widget)
+        self.timeline_widget = timeline_widget
+        self.setAttribute(Qt.WidgetAttribute.WA_TransparentForMouseEvents)
+        self.setAttribute(Qt.WidgetAttribute.WA_TranslucentBackground)
+
+    def paintEvent(self, event):
+        tlw = self.timeline_widget
+        x = int(tlw.playhead_time * tlw.pixels_per_second - tlw.scroll_offset)
+        if 0 <= x <= self.width():
+            painter = QPainter(self)
+            painter.setPen(QPen(QColor(255, 0, 0), 2))
+            painter.drawLine(x, 0, x, self.height())
+
+class WaveformJob(QRunnable):
+    """Decodes audio and reduces waveform peaks off the GUI thread"""
+
+    def __init__(self, file_path: str, clip_id: str, n_pixels: int,
+                 compute_func, done_signal):
+        super().__init__()
+        self.file_path = file_path
+        self.clip_id = clip_id
+        self.n_pixels = n_pixels
+        self.compute_func = compute_func
+        self.done_signal = done_signal
+
+    def run(self):
+        try:
+            peaks = self.compute_func(self.file_path, self.n_pixels)
+        except Exception as e:
+            print(f"Error generating waveform data: {e}")
+            peaks = None
+        self.done_signal.emit(self.clip_id, self.file_path, self.n_pixels, peaks)
+
+class TimelineWidget(QWidget):
+    """Main timeline widget"""
+    
+    time_changed = pyqtSignal(float)  # Current playhead time
+    clip_selected = pyqtSignal(str)   # Selected clip ID
+    media_dropped = pyqtSignal(str, str)  # clip_id, file_path
+    waveform_ready = pyqtSignal(str, str, int, object)  # clip_id, file_path, n_pixels, peaks
+    
+    def __init__(self):
+        super().__init__()
+        self.tracks: List[TimelineTrack] = []
+        self._track_id_to_index: Dict[int, int] = {}
+        self._track_y_cumsum: List[int] = []
+        self._total_track_height = 0
+        self._track_widgets: List['TimelineTrackWidget'] = []
+        self._next_clip_seq = 0  # monotonic clip-id allocator
+        self._snap_boundaries: Optional[np.ndarray] = None  # sorted clip edges
+        self._snap_excl_id: Optional[str] = None  # clip excluded when built
+        self._snap_dirty = True
+        self._update_pending = False  # coalesces track repaint requests
+        self._ruler_pending = False
+        self._hidden = True  # widgets start hidden; showEvent clears this
+        self._clip_epoch = 0  # bumped on any clip/selection change
+        self._clip_cache: Dict[str, object] = {}  # epoch-tagged aggregates
+        self._waveform_jobs: set = set()  # clip ids with a decode in flight
+        self.waveform_ready.connect(self._on_waveform_ready)
+        self._duration_cache: Dict[Tuple[str, Optional[int]], float] = {}
+        self.pixels_per_second = 50  # Zoom level
+        self.scroll_offset = 0
+        self.playhead_time = 0.0
+        self.snap_enabled = True
+        self.duration = 60.0  # Total timeline duration
+        
+        self.setup_ui()
+        self.create_default_tracks()
+        self.current_tool = TimelineTool.SELECT
+        self.clipboard = []
+
+        self.playhead_overlay = PlayheadOverlay(self)
+        self._position_playhead_overlay()
+        
+    def setup_ui(self):
+        # Main horizontal layout: tools on left, timeline on right
+        main_layout = QHBoxLayout(self)
+        main_layout.setContentsMargins(0, 0, 0, 0)
+        main_layout.setSpacing(2)
+        
+        # Left side: Vertical tool panel
+        tools_panel = self.create_tools_panel()
+        main_layout.addWidget(tools_panel)
+        
+        # Right side: Timeline area
+        timeline_area = self.create_timeline_area()
+        main_layout.addWidget(timeline_area, 1)  # Take most of the space
+        
+    def create_tools_panel(self):
+        """Create vertical tools panel on the left"""
+        tools_panel = QWidget()
+        tools_panel.setFixedWidth(80)  # Fixed width for tool panel
+        tools_panel.setStyleSheet("""
+            QWidget {
+                background-color: #2d2d30;
+                border-right: 1px solid #464647;
+            }
+        """)
+        
+        tools_layout = QVBoxLayout(tools_panel)
+        tools_layout.setContentsMargins(5, 5, 5, 5)
+        tools_layout.setSpacing(3)
+        
+        # Tool buttons group
+        self.tool_group = QButtonGroup()
+        
+        # Style for tool buttons
+        tool_button_style = """
+            QPushButton {
+                background-color: #3c3c3c;
+                color: #cccccc;
+                border: 1px solid #555555;
+                border-radius: 4px;
+                padding: 6px;
+                font-size: 10px;
+                text-align: center;
+                min-height: 20px;
+            }
+            QPushButton:checked {
+                background-color: #007acc;
+                color: white;
+                border-color: #007acc;
+            }
+            QPushButton:hover {
+                background-color: #4a4a4a;
+                border-color: #007acc;
+            }
+        """
+        
+        # Create tool buttons vertically
+        self.select_tool_btn = QPushButton("Select\n(V)")
+        self.select_tool_btn.setCheckable(True)
+        self.select_tool_btn.setChecked(True)
+        self.select_tool_btn.clicked.connect(lambda: self.set_tool(TimelineTool.SELECT))
+        self.select_tool_btn.setStyleSheet(tool_button_style)
+        self.tool_group.addButton(self.select_tool_btn)
+        tools_layout.addWidget(self.select_tool_btn)
+        
+        self.razor_tool_btn = QPushButton("Razor\n(C)")
+        self.razor_tool_btn.setCheckable(True)
+        self.razor_tool_btn.clicked.connect(lambda: self.set_tool(TimelineTool.RAZOR))
+        self.razor_tool_btn.setStyleSheet(tool_button_style)
+        self.tool_group.addButton(self.razor_tool_btn)
+        tools_layout.addWidget(self.razor_tool_btn)
+        
+        self.hand_tool_btn = QPushButton("Hand\n(H)")
+        self.hand_tool_btn.setCheckable(True)
+        self.hand_tool_btn.clicked.connect(lambda: self.set_tool(TimelineTool.HAND))
+        self.hand_tool_btn.setStyleSheet(tool_button_style)
+        self.tool_group.addButton(self.hand_tool_btn)
+        tools_layout.addWidget(self.hand_tool_btn)
+        
+        self.ripple_tool_btn = QPushButton("Ripple\n(R)")
+        self.ripple_tool_btn.setCheckable(True)
+        self.ripple_tool_btn.clicked.connect(lambda: self.set_tool(TimelineTool.RIPPLE))
+        self.ripple_tool_btn.setStyleSheet(tool_button_style)
+        self.tool_group.addButton(self.ripple_tool_btn)
+        tools_layout.addWidget(self.ripple_tool_btn)
+        
+        self.slip_tool_btn = QPushButton("Slip\n(Y)")
+        self.slip_tool_btn.setCheckable(True)
+        self.slip_tool_btn.clicked.connect(lambda: self.set_tool(TimelineTool.SLIP))
+        self.slip_tool_btn.setStyleSheet(tool_button_style)
+        self.tool_group.addButton(self.slip_tool_btn)
+        tools_layout.addWidget(self.slip_tool_btn)
+        
+        tools_layout.addStretch()  # Push buttons to top
+        
+        return tools_panel
+        
+    def create_timeline_area(self):
+        """Create the main timeline area"""
+        timeline_widget = QWidget()
+        layout = QVBoxLayout(timeline_widget)
+        layout.setContentsMargins(0, 0, 0, 0)
+        layout.setSpacing(0)
+        
+        # Timeline controls
+        controls_layout = QHBoxLayout()
+        
+        # Zoom controls
+        zoom_label = QLabel("Zoom:")
+        controls_layout.addWidget(zoom_label)
+        
+        self.zoom_slider = QSlider(Qt.Orientation.Horizontal)
+        self.zoom_slider.setRange(10, 200)
+        self.zoom_slider.setValue(self.pixels_per_second)
+        self.zoom_slider.valueChanged.connect(self.set_zoom)
+        self.zoom_slider.setFixedWidth(100)
+        controls_layout.addWidget(self.zoom_slider)
+        
+        # Snap toggle
+        self.snap_button = QPushButton("Snap")
+        self.snap_button.setCheckable(True)
+        self.snap_button.setChecked(self.snap_enabled)
+        self.snap_button.clicked.connect(self.toggle_snap)
+        self.snap_button.setFixedWidth(50)  # Reduced width
+        controls_layout.addWidget(self.snap_button)
+        
+        # Automation toggle
+        self.automation_button = QPushButton("Auto")
+        self.automation_button.setCheckable(True)
+        self.automation_button.setChecked(False)
+        self.automation_button.clicked.connect(self.toggle_automation_tracks)
+        self.automation_button.setFixedWidth(50)
+        self.automation_button.setToolTip("Toggle automation tracks visibility")
+        controls_layout.addWidget(self.automation_button)
+        
+        controls_layout.addStretch()
+        
+        controls_widget = QWidget()
+        controls_widget.setLayout(controls_layout)
+        controls_widget.setFixedHeight(25)  # Better height for controls
+        controls_widget.setStyleSheet("""
+            QWidget {
+                background-color: #2d2d30;
+                border-bottom: 1px solid #464647;
+            }
+            QLabel {
+                color: #cccccc;
+                font-size: 11px;
+                padding: 0 5px;
+            }
+            QPushButton {
+                background-color: #0e639c;
+                color: white;
+                border: 1px solid #464647;
+                border-radius: 3px;
+                padding: 2px 8px;
+                font-size: 10px;
+                min-height: 18px;
+            }
+            QPushButton:checked {
+                background-color: #1177bb;
+                border-color: #007acc;
+            }
+            QPushButton:hover {
+                background-color: #1177bb;
+            }
+        """)
+        layout.addWidget(controls_widget)
+        
+        # Timeline ruler
+        self.ruler = TimelineRuler(self)
+        layout.addWidget(self.ruler)
+        
+        # Scrollable timeline area
+        self.scroll_area = QScrollArea()
+        self.scroll_area.setHorizontalScrollBarPolicy(Qt.ScrollBarPolicy.ScrollBarAlwaysOn)
+        self.scroll_area.setVerticalScrollBarPolicy(Qt.ScrollBarPolicy.ScrollBarAsNeeded)
+        self.scroll_area.horizontalScrollBar().valueChanged.connect(self.on_scroll)
+        self.scroll_area.verticalScrollBar().valueChanged.connect(
+            self._update_track_visibility)
+        
+        # Timeline content widget
+        self.timeline_content = QWidget()
+        self.timeline_layout = QVBoxLayout(self.timeline_content)
+        self.timeline_layout.setContentsMargins(0, 0, 0, 0)
+        self.timeline_layout.setSpacing(1)
+        
+        self.scroll_area.setWidget(self.timeline_content)
+        layout.addWidget(self.scroll_area)
+        
+        # Update timeline size
+        self.update_timeline_size()
+        
+        # Keyboard shortcuts
+        self.setup_shortcuts()
+        
+        return timeline_widget
+        
+    def create_default_tracks(self):
+        """Create default video and audio tracks with proper separation"""
+        # Video tracks
+        for i in range(3):
+            track = TimelineTrack(i, f"Video {i+1}", "video")
+            self.add_track(track)
+            
+        # Audio tracks (separate from video)
+        for i in range(4):
+            track = TimelineTrack(i+10, f"Audio {i+1}", "audio")  # Use different ID range
+            self.add_track(track)
+            
+    def _rebuild_track_index(self):
+        """Rebuild the id->index map and cumulative-height table"""
+        self._track_id_to_index = {t.track_id: i for i, t in enumerate(self.tracks)}
+        self._track_y_cumsum = []
+        y = 0
+        for track in self.tracks:
+            y += track.height
+            self._track_y_cumsum.append(y)
+        # Content height only changes with the track list, not per zoom
+        # or paste, so update_timeline_size can reuse it
+        self._total_track_height = sum(track.height + 1 for track in self.tracks)
+
+    def track_index_at_y(self, y: float) -> Optional[int]:
+        """Track index under a y position, honoring per-track heights"""
+        if y < 0:
+            return None
+        i = bisect.bisect_right(self._track_y_cumsum, y)
+        return i if i < len(self.tracks) else None
+
+    def add_track(self, track: TimelineTrack):
+        """Add a track to the timeline"""
+        self.tracks.append(track)
+        self._rebuild_track_index()
+        self._clip_epoch += 1
+
+        # Create track widget
+        track_widget = TimelineTrackWidget(track, self)
+        track_widget.clip_selected.connect(self.clip_selected.emit)
+        track_widget.clip_moved.connect(self.on_clip_moved)
+
+        self.timeline_layout.addWidget(track_widget)
+        self._track_widgets.append(track_widget)
+        self.update_timeline_size()
+        
+    def add_clip_to_track(self, track_id: int, clip_name: str, start_time: float, duration: float) -> str:
+        """Add a clip to a specific track and make it movable"""
+        if track_id < len(self.tracks):
+            # A counter keeps id allocation O(1) (and collision-free after
+            # deletions, which the old all-clips count was not)
+            clip_id = f"clip_{self._next_clip_seq}"
+            self._next_clip_seq += 1
+            clip = TimelineClip(clip_id, clip_name, start_time, duration, track_id)
+            
+            # Set color based on track type
+            if self.tracks[track_id].track_type == "audio":
+                clip.color = QColor(50, 150, 50)  # Green for audio
+            
+            self.tracks[track_id].add_clip(clip)
+            self._invalidate_snap_index()
+            self._schedule_update()
+            return clip_id
+        return ""
+
+    def remove_clip(self, clip_id: str):
+        """Remove a clip from timeline"""
+        for track in self.tracks:
+            track.remove_clip(clip_id)
+        self._invalidate_snap_index()
+        self._schedule_update()
+        
+    def get_all_clips(self) -> List[TimelineClip]:
+        """Get all clips from all tracks"""
+        cache = self._clip_cache
+        if cache.get('all_epoch') == self._clip_epoch:
+            return cache['all']
+        clips = []
+        for track in self.tracks:
+            clips.extend(track.clips)
+        cache['all'] = clips
+        cache['all_epoch'] = self._clip_epoch
+        return clips
+        
+    def set_zoom(self, zoom_level: int):
+        """Set timeline zoom level"""
+        self.pixels_per_second = zoom_level
+        self.update_timeline_size()
+        self._schedule_update(ruler=True)
+        
+    def toggle_snap(self, enabled: bool):
+        """Toggle snap to grid"""
+        self.snap_enabled = enabled
+        
+    def snap_time(self, time: float, dragging_clip: Optional[TimelineClip] = None) -> float:
+        """Snap time to various targets: grid, clips, playhead"""
+        if not self.snap_enabled:
+            return time
+            
+        snap_threshold = 0.5 / self.pixels_per_second * 10  # 10 pixels threshold
+        candidates = []
+        
+        # Snap to grid (1 second intervals)
+        grid = self._snap_to_grid(time, 1.0, snap_threshold)
+        if grid is not None:
+            candidates.append(grid)
+            
+        # Snap to playhead
+        if abs(time - self.playhead_time) < snap_threshold:
+            candidates.append(self.playhead_time)
+            
+        # Snap to other clips: binary-search a sorted boundary array
+        # instead of scanning every clip on every drag pixel
+        excl_id = dragging_clip.clip_id if dragging_clip else None
+        if self._snap_dirty or excl_id != self._snap_excl_id:
+            self._rebuild_snap_index(excl_id)
+        boundaries = self._snap_boundaries
+        if len(boundaries):
+            idx = int(np.searchsorted(boundaries, time))
+            for j in (idx - 1, idx):
+                if 0 <= j < len(boundaries) and abs(time - boundaries[j]) < snap_threshold:
+                    candidates.append(float(boundaries[j]))
+
+        # Return the closest snap candidate or original time
+        if candidates:
+            return min(candidates, key=lambda t: abs(t - time))
+        return time
+
+    @staticmethod
+    def _snap_to_grid(t: float, grid: float, threshold: float) -> Optional[float]:
+        """Nearest grid line if within threshold, else None
+
+        Remainder arithmetic rather than round(), so non-unit intervals
+        (frame or beat grids) cost the same single comparison.
+        """
+        rem = t - math.floor(t / grid) * grid
+        if rem > grid * 0.5:
+            if grid - rem < threshold:
+                return t + (grid - rem)
+        elif rem < threshold:
+            return t - rem
+        return None
+
+    def _rebuild_snap_index(self, excl_id: Optional[str]):
+        """Collect every clip start/end into a sorted array for snapping"""
+        edges = []
+        for track in self.tracks:
+            for clip in track.clips:
+                if clip.clip_id == excl_id:
+                    continue
+                edges.append(clip._start_time)
+                edges.append(clip.end_time_f)
+        self._snap_boundaries = np.sort(np.asarray(edges, dtype=np.float64))
+        self._snap_excl_id = excl_id
+        self._snap_dirty = False
+
+    def _invalidate_snap_index(self):
+        """Mark the snap boundaries and clip aggregates stale"""
+        self._snap_dirty = True
+        self._clip_epoch += 1
+
+    def on_scroll(self, value: int):
+        """Handle horizontal scrolling"""
+        self.scroll_offset = value
+        self._schedule_update(ruler=True)
+        
+    def on_clip_moved(self, clip_id: str, new_time: float, track_id: int):
+        """Handle clip movement"""
+        # Update clip position and emit signal
+        self._invalidate_snap_index()
+        self._schedule_update()
+        
+    def set_playhead_time(self, time: float):
+        """Set playhead position"""
+        # Paused or sub-microsecond ticks change nothing worth emitting
+        if abs(time - self.playhead_time) < 1e-6:
+            return
+        old_px = int(self.playhead_time * self.pixels_per_second - self.scroll_offset)
+        self.playhead_time = time
+        self.time_changed.emit(time)
+        # Repaint only the overlay, and only when it moves a whole pixel
+        new_px = int(time * self.pixels_per_second - self.scroll_offset)
+        if new_px != old_px:
+            self.playhead_overlay.update()
+        
+    def update_timeline_size(self):
+        """Update timeline content size based on duration and zoom"""
+        width = int(self.duration * self.pixels_per_second)
+        self.timeline_content.setFixedSize(width, self._total_track_height)
+        
+    def _schedule_update(self, ruler: bool = False):
+        """Coalesce repaint requests to one per event loop turn
+
+        Scrubbing and dragging ask for dozens of redraws per frame;
+        only the last state before the event loop paints matters.
+        """
+        if ruler:
+            self._ruler_pending = True
+        if self._hidden:
+            return  # showEvent flushes once when we come back
+        if not self._update_pending:
+            self._update_pending = True
+            QTimer.singleShot(0, self._flush_update)
+
+    def _flush_update(self):
+        """Run the deferred track (and ruler) repaint"""
+        self._update_pending = False
+        self.update_tracks()
+        self.playhead_overlay.update()  # its x depends on scroll/zoom
+        if self._ruler_pending:
+            self._ruler_pending = False
+            self.ruler.update()
+
+    def update_tracks(self):
+        """Update all track widgets"""
+        # A plain list walk; the layout-index/isinstance traversal is
+        # too heavy for something that runs per playback frame
+        for widget in self._track_widgets:
+            widget.update()
+                
+    def _position_playhead_overlay(self):
+        """Keep the playhead overlay covering the track scroll area"""
+        if hasattr(self, 'playhead_overlay') and hasattr(self, 'scroll_area'):
+            top_left = self.scroll_area.mapTo(self, QPoint(0, 0))
+            self.playhead_overlay.setGeometry(QRect(top_left, self.scroll_area.size()))
+            self.playhead_overlay.raise_()
+
+    def resizeEvent(self, event):
+        super().resizeEvent(event)
+        # The layout positions children after this event, so measure the
+        # scroll area once that has happened
+        QTimer.singleShot(0, self._position_playhead_overlay)
+        QTimer.singleShot(0, self._update_track_visibility)
+
+    def _update_track_visibility(self):
+        """Hide track widgets scrolled out of the vertical viewport
+
+        Qt still paints widgets that are merely scrolled off-screen;
+        actually hiding them removes that per-frame work. Their layout
+        slots are retained, so showing them back costs no reflow.
+        """
+        viewport_rect = QRect(
+            QPoint(0, self.scroll_area.verticalScrollBar().value()),
+            self.scroll_area.viewport().size())
+        for i in range(self.timeline_layout.count()):
+            widget = self.timeline_layout.itemAt(i).widget()
+            if widget is not None:
+                widget.setVisible(widget.geometry().intersects(viewport_rect))
+
+    def hideEvent(self, event):
+        """Stop scheduling repaints while the timeline is hidden"""
+        super().hideEvent(event)
+        self._hidden = True
+
+    def showEvent(self, event):
+        """Catch up on anything that changed while hidden"""
+        super().showEvent(event)
+        self._hidden = False
+        self._schedule_update(ruler=True)
+        self._update_track_visibility()
+
+
+    def setup_shortcuts(self):
+        """Setup keyboard shortcuts for timeline tools"""
+        # Tool shortcuts
+        bindings = [
+            ("V", partial(self.set_tool, TimelineTool.SELECT)),
+            ("C", partial(self.set_tool, TimelineTool.RAZOR)),
+            ("H", partial(self.set_tool, TimelineTool.HAND)),
+            ("R", partial(self.set_tool, TimelineTool.RIPPLE)),
+            ("Y", partial(self.set_tool, TimelineTool.SLIP)),
+            # Edit shortcuts
+            ("Delete", self.delete_selected_clips),
+            ("Ctrl+C", self.copy_selected_clips),
+            ("Ctrl+V", self.paste_clips),
+            ("S", self.split_at_playhead),
+        ]
+        self._shortcuts = []
+        for key, slot in bindings:
+            shortcut = QShortcut(QKeySequence(key), self)
+            # Only consult these when the timeline has focus, instead of
+            # on every keystroke anywhere in the application
+            shortcut.setContext(Qt.ShortcutContext.WidgetWithChildrenShortcut)
+            shortcut.activated.connect(slot)
+            self._shortcuts.append(shortcut)
+        
+    def set_tool(self, tool: TimelineTool):
+        """Set the current editing tool"""
+        self.current_tool = tool
+        
+        # Update button states
+        self.select_tool_btn.setChecked(tool == TimelineTool.SELECT)
+        self.razor_tool_btn.setChecked(tool == TimelineTool.RAZOR)
+        self.hand_tool_btn.setChecked(tool == TimelineTool.HAND)
+        self.ripple_tool_btn.setChecked(tool == TimelineTool.RIPPLE)
+        self.slip_tool_btn.setChecked(tool == TimelineTool.SLIP)
+        
+        # Update cursor based on tool
+        if tool == TimelineTool.RAZOR:
+            self.setCursor(Qt.CursorShape.CrossCursor)
+        elif tool == TimelineTool.HAND:
+            self.setCursor(Qt.CursorShape.OpenHandCursor)
+        elif tool == TimelineTool.RIPPLE:
+            self.setCursor(Qt.CursorShape.SizeHorCursor)
+        elif tool == TimelineTool.SLIP:
+            self.setCursor(Qt.CursorShape.SizeAllCursor)
+        else:
+            self.setCursor(Qt.CursorShape.ArrowCursor)
+            
+    def get_selected_clips(self) -> List[TimelineClip]:
+        """Get all currently selected clips"""
+        cache = self._clip_cache
+        if cache.get('selected_epoch') == self._clip_epoch:
+            return cache['selected']
+        selected = [clip for clip in self.get_all_clips() if clip.selected]
+        cache['selected'] = selected
+        cache['selected_epoch'] = self._clip_epoch
+        return selected
+        
+    def delete_selected_clips(self):
+        """Delete all selected clips"""
+        selected_clips = self.get_selected_clips()
+        for clip in selected_clips:
+            self.remove_clip(clip.clip_id)
+            
+    def copy_selected_clips(self):
+        """Copy selected clips to clipboard"""
+        selected_clips = self.get_selected_clips()
+        self.clipboard = [clip.clone() for clip in selected_clips]
+        
+    def paste_clips(self):
+        """Paste clips from clipboard at playhead"""
+        if not self.clipboard:
+            return
+            
+        for clip_data in self.clipboard:
+            # Create new clip at playhead position
+            new_clip = clip_data.clone()
+            new_clip.clip_id = f"clip_{self._next_clip_seq}"
+            self._next_clip_seq += 1
+            new_clip.start_time = self.playhead_time
+            
+            # Add to appropriate track
+            if new_clip.track < len(self.tracks):
+                self.tracks[new_clip.track].add_clip(new_clip)
+
+        self._invalidate_snap_index()
+        self._schedule_update()
+
+    def split_at_playhead(self):
+        """Split clips at playhead position"""
+        for track in self.tracks:
+            clip = track.get_clip_at_time(self.playhead_time)
+            if clip:
+                track.split_clip(clip.clip_id, self.playhead_time)
+        self._invalidate_snap_index()
+        self._schedule_update()
+    
+    def _probe_duration(self, file_path: str) -> Optional[float]:
+        """Read media duration via ffprobe without building a decoder
+
+        MoviePy spawns ffmpeg and allocates full decoder state just to
+        expose .duration; a header probe is far cheaper. Results are
+        memoized per (path, mtime). Returns None if ffprobe is missing
+        or the file can't be probed, so callers can fall back.
+        """
+        try:
+            key = (file_path, os.stat(file_path).st_mtime_ns)
+        except OSError:
+            key = (file_path, None)
+        cached = self._duration_cache.get(key)
+        if cached is not None:
+            return cached
+        try:
+            out = subprocess.check_output(
+                ["ffprobe", "-v", "error", "-show_entries", "format=duration",
+                 "-of", "default=nokey=1:noprint_wrappers=1", file_path],
+                stderr=subprocess.DEVNULL, timeout=10)
+            duration = float(out)
+        except Exception:
+            return None
+        self._duration_cache[key] = duration
+        return duration
+
+    def add_media_to_track(self, track_id: int, file_path: str, start_time: float):
+        """Add media file to specific track at specific time"""
+        try:
+            # Get file extension to determine type
+            file_ext = os.path.splitext(file_path)[1].lower()
+            
+            # Define supported file types
+            video_extensions = ['.mp4', '.avi', '.mov', '.mkv', '.wmv', '.flv', '.webm', '.m4v']
+            image_extensions = ['.png', '.jpg', '.jpeg', '.bmp', '.gif', '.tiff', '.tga']
+            audio_extensions = ['.mp3', '.wav', '.aac', '.flac', '.ogg', '.m4a']
+            
+            duration = 5.0  # Default duration
+
+            if file_ext in video_extensions:
+                # Handle video files: a header probe beats building a decoder
+                duration = self._probe_duration(file_path)
+                if duration is None:
+                    clip = _moviepy()[0](file_path)
+                    duration = clip.duration
+                    clip.close()
+
+            elif file_ext in image_extensions:
+                # Handle image files - create a 5 second clip
+                duration = 5.0
+
+            elif file_ext in audio_extensions:
+                # Handle audio files
+                duration = self._probe_duration(file_path)
+                if duration is None:
+                    clip = _moviepy()[1](file_path)
+                    duration = clip.duration
+                    clip.close()
+
+                # For audio files, use audio track if available
+                if track_id < 2:  # If trying to add to video track
+                    # Find first available audio track
+                    for i, track in enumerate(self.tracks):
+                        if track.track_type == "audio":
+                            track_id = i
+                            break
+            else:
+                print(f"Unsupported file type: {file_ext}")
+                return None
+            
+            # Add clip to track
+            clip_id = self.add_clip_to_track(
+                track_id=track_id,
+                clip_name=os.path.basename(file_path),
+                start_time=start_time,
+                duration=duration
+            )
+            
+            # Emit signal for main window to handle
+            self.media_dropped.emit(clip_id, file_path)
+            
+            return clip_id
+            
+        except Exception as e:
+            print(f"Error adding media to track: {e}")
+            return None
+    
+    def add_media_file(self, file_path: str):
+        """Add media file to timeline, automatically managing tracks and positioning"""
+        try:
+            # Get file extension to determine type
+            file_ext = os.path.splitext(file_path)[1].lower()
+            
+            # Define supported file types
+            video_extensions = ['.mp4', '.avi', '.mov', '.mkv', '.wmv', '.flv', '.webm', '.m4v']
+            image_extensions = ['.png', '.jpg', '.jpeg', '.bmp', '.gif', '.tiff', '.tga']
+            audio_extensions = ['.mp3', '.wav', '.aac', '.flac', '.ogg', '.m4a']
+            
+            duration = 5.0  # Default duration
+            track_type = "video"  # Default track type
+
+            if file_ext in video_extensions:
+                # Handle video files: a header probe beats building a decoder
+                duration = self._probe_duration(file_path)
+                if duration is None:
+                    clip = _moviepy()[0](file_path)
+                    duration = clip.duration
+                    clip.close()
+                track_type = "video"
+
+            elif file_ext in image_extensions:
+                # Handle image files - create a 5 second clip
+                duration = 5.0
+                track_type = "video"
+
+            elif file_ext in audio_extensions:
+                # Handle audio files
+                duration = self._probe_duration(file_path)
+                if duration is None:
+                    clip = _moviepy()[1](file_path)
+                    duration = clip.duration
+                    clip.close()
+                track_type = "audio"
+            else:
+                print(f"Unsupported file type: {file_ext}")
+                return None
+            
+            # Find or create an appropriate track
+            target_track = self.find_or_create_track(track_type)
+            
+            # Calculate start time (end of timeline)
+            start_time = self.get_timeline_end_time()
+            
+            # Add clip to track
+            clip_id = self.add_clip_to_track(
+                track_id=target_track.track_id,
+                clip_name=os.path.basename(file_path),
+                start_time=start_time,
+                duration=duration
+            )
+            
+            # Update timeline duration if necessary
+            new_end_time = start_time + duration
+            if new_end_time > self.duration:
+                self.duration = new_end_time + 10  # Add 10 seconds buffer
+                self.update_timeline_size()
+            
+            # Emit signal for main window to handle
+            self.media_dropped.emit(clip_id, file_path)
+            
+            return clip_id
+            
+        except Exception as e:
+            print(f"Error adding media file: {e}")
+            return None
+    
+    def find_or_create_track(self, track_type: str) -> TimelineTrack:
+        """Find an available track or create a new one"""
+        # Look for existing tracks of the same type
+        tracks_of_type = [track for track in self.tracks if track.track_type == track_type]
+        
+        # For now, always create a new track for each file to avoid overlaps
+        # This ensures each file gets its own "line" as requested
+        track_count = len(tracks_of_type)
+        track_id = len(self.tracks)  # Use total track count as ID
+        track_name = f"{track_type.capitalize()} {track_count + 1}"
+        
+        new_track = TimelineTrack(track_id, track_name, track_type)
+        self.add_track(new_track)
+        
+        return new_track
+    
+    def get_timeline_end_time(self) -> float:
+        """Get the end time of all clips on the timeline"""
+        cache = self._clip_cache
+        if cache.get('end_epoch') == self._clip_epoch:
+            return cache['end']
+        max_end_time = 0.0
+        for clip in self.get_all_clips():
+            clip_end = clip.end_time_f
+            if clip_end > max_end_time:
+                max_end_time = clip_end
+        cache['end'] = max_end_time
+        cache['end_epoch'] = self._clip_epoch
+        return max_end_time
+    
+    def move_clip_to_track(self, clip: TimelineClip, new_track_id: int):
+        """Move a clip from one track to another"""
+        if new_track_id >= len(self.tracks):
+            return False
+            
+        # Find current track containing the clip
+        current_track = None
+        for track in self.tracks:
+            if clip in track.clips:
+                current_track = track
+                break
+        
+        if not current_track:
+            return False
+            
+        # Remove from current track
+        current_track.remove_clip(clip.clip_id)
+        
+        # Add to new track
+        target_track = self.tracks[new_track_id]
+        clip.track = new_track_id  # Update clip's track reference
+        target_track.add_clip(clip)
+
+        # Update display
+        self._invalidate_snap_index()
+        self._schedule_update()
+        return True
+        
+    def toggle_automation_tracks(self):
+        """Toggle automation tracks visibility for all tracks"""
+        for track in self.tracks:
+            if track.track_type in ["audio", "video"]:
+                track.toggle_automation_visibility()
+        self.update_timeline_display()
+        
+    def update_timeline_display(self):
+        """Update the timeline display including automation tracks"""
+        # Clear existing widgets
+        for i in reversed(range(self.timeline_layout.count())):
+            item = self.timeline_layout.itemAt(i)
+            if item:
+                widget = item.widget()
+                if widget:
+                    widget.setParent(None)
+        self._track_widgets.clear()
+
+        # Add main tracks
+        for track in self.tracks:
+            track_widget = TimelineTrackWidget(track, self)
+            track_widget.clip_selected.connect(self.clip_selected.emit)
+            track_widget.clip_moved.connect(self.on_clip_moved)
+            self.timeline_layout.addWidget(track_widget)
+            self._track_widgets.append(track_widget)
+            
+            # Add automation tracks if visible
+            if track.show_automation:
+                for automation in track.automation_tracks:
+                    automation_widget = self.create_automation_widget(automation)
+                    self.timeline_layout.addWidget(automation_widget)
+        
+        self.update_timeline_size()
+        
+    def create_automation_widget(self, automation: AutomationTrack) -> QWidget:
+        """Create a widget for displaying automation tracks"""
+        automation_widget = QWidget()
+        automation_widget.setFixedHeight(automation.height)
+        automation_widget.setStyleSheet("background-color: #2a2a2a; border: 1px solid #444444;")
+        
+        layout = QHBoxLayout(automation_widget)
+        layout.setContentsMargins(5, 0, 5, 0)
+        
+        # Automation parameter label
+        label = QLabel(f"{automation.parameter_name.title()}")
+        label.setFixedWidth(80)
+        label.setStyleSheet("font-size: 10px; color: #cccccc;")
+        layout.addWidget(label)
+        
+        # TODO: Add automation curve drawing here
+        curve_area = QWidget()
+        curve_area.setStyleSheet("background-color: #333333;")
+        layout.addWidget(curve_area)
+        
+        return automation_widget
+        
+    def _waveform_cache_path(self, file_path: str, n_pixels: int) -> Path:
+        """Cache file location keyed by (path, mtime, n_pixels)"""
+        stat = os.stat(file_path)
+        key = hashlib.sha1(file_path.encode('utf-8')).hexdigest()
+        return WAVEFORM_CACHE_DIR / f"{key}_{stat.st_mtime_ns}_{n_pixels}.npy"
+
+    def _waveform_cache_get(self, file_path: str, n_pixels: int):
+        """Return cached waveform peaks (memory-mapped) or None on miss"""
+        try:
+            import numpy as np
+            cache_file = self._waveform_cache_path(file_path, n_pixels)
+            if cache_file.exists():
+                return np.load(cache_file, mmap_mode='r')
+        except Exception as e:
+            print(f"Error reading waveform cache: {e}")
+        return None
+
+    def _waveform_cache_put(self, file_path: str, n_pixels: int, peaks):
+        """Persist waveform peaks to the on-disk cache"""
+        try:
+            import numpy as np
+            WAVEFORM_CACHE_DIR.mkdir(parents=True, exist_ok=True)
+            np.save(self._waveform_cache_path(file_path, n_pixels), peaks)
+            self._waveform_cache_evict()
+        except Exception as e:
+            print(f"Error writing waveform cache: {e}")
+
+    def _waveform_cache_evict(self):
+        """Keep the on-disk cache under its size cap, dropping oldest first"""
+        try:
+            entries = sorted(WAVEFORM_CACHE_DIR.glob("*.npy"), key=lambda p: p.stat().st_mtime)
+            total = sum(p.stat().st_size for p in entries)
+            while entries and total > WAVEFORM_CACHE_MAX_BYTES:
+                oldest = entries.pop(0)
+                total -= oldest.stat().st_size
+                oldest.unlink()
+        except Exception:
+            pass
+
+    def load_audio_samples(self, file_path: str):
+        """Decode audio samples from a media file as a float array"""
+        # Prefer soundfile: it decodes straight into a float32 array without
+        # streaming chunks through moviepy's Python-level reader
+        try:
+            import soundfile as sf
+            samples, _ = sf.read(file_path, dtype='float32')
+            return samples
+        except Exception:
+            pass
+
+        VideoFileClip, AudioFileClip, _ = _moviepy()
+
+        # Try to load as video first (might have audio)
+        try:
+            video_clip = VideoFileClip(file_path)
+            if video_clip.audio:
+                audio_array = video_clip.audio.to_soundarray()
+                video_clip.close()
+                return audio_array
+            video_clip.close()
+            return None
+        except:
+            # Try as audio file
+            try:
+                audio_clip = AudioFileClip(file_path)
+                audio_array = audio_clip.to_soundarray()
+                audio_clip.close()
+                return audio_array
+            except:
+                return None
+
+    def generate_waveform_data(self, file_path: str, clip: TimelineClip, n_pixels: int = 1000):
+        """Generate waveform peak data for audio clips
+
+        Decoding a large file takes seconds, so cache misses run on the
+        global thread pool and deliver peaks back via waveform_ready.
+        """
+        try:
+            # Waveform data is deterministic per (file, mtime, n_pixels) —
+            # reuse the persisted peaks when we have them
+            cached_peaks = self._waveform_cache_get(file_path, n_pixels)
+            if cached_peaks is not None:
+                self._apply_waveform(clip, np.asarray(cached_peaks, dtype=np.float32))
+                return
+
+            if clip.clip_id in self._waveform_jobs:
+                return  # decode already in flight for this clip
+            self._waveform_jobs.add(clip.clip_id)
+            job = WaveformJob(file_path, clip.clip_id, n_pixels,
+                              self._compute_waveform_peaks, self.waveform_ready)
+            QThreadPool.globalInstance().start(job)
+
+        except Exception as e:
+            print(f"Error generating waveform data: {e}")
+            clip.waveform_data = None
+
+    def _compute_waveform_peaks(self, file_path: str, n_pixels: int):
+        """Decode audio and reduce it to per-pixel peaks (worker thread)"""
+        audio_array = self.load_audio_samples(file_path)
+        if audio_array is None:
+            return None
+
+        # Convert stereo to mono by averaging channels
+        if len(audio_array.shape) > 1:
+            audio_array = np.mean(audio_array, axis=1)
+
+        # Per-bucket peak reduction in a single vectorized C pass
+        # instead of looping over samples in the interpreter
+        if len(audio_array) > n_pixels:
+            bucket_starts = np.linspace(0, len(audio_array), n_pixels + 1, dtype=np.int64)[:-1]
+            peaks_max = np.maximum.reduceat(audio_array, bucket_starts)
+            peaks_min = np.minimum.reduceat(audio_array, bucket_starts)
+            peaks = np.maximum(np.abs(peaks_max), np.abs(peaks_min))
+        else:
+            peaks = np.abs(audio_array)
+
+        # Normalize to [0, 1] range
+        if len(peaks) and np.max(peaks) > 0:
+            peaks = peaks / np.max(peaks)
+        return peaks
+
+    def _on_waveform_ready(self, clip_id: str, file_path: str, n_pixels: int, peaks):
+        """Store decoded peaks on the clip back on the GUI thread"""
+        self._waveform_jobs.discard(clip_id)
+        if peaks is None:
+            return
+        self._waveform_cache_put(file_path, n_pixels, peaks)
+        for track in self.tracks:
+            clip = track.get_clip_by_id(clip_id)
+            if clip:
+                self._apply_waveform(clip, np.asarray(peaks, dtype=np.float32))
+                break
+
+    def _apply_waveform(self, clip: TimelineClip, peaks):
+        """Attach peaks to a clip and invalidate its render caches"""
+        clip.waveform_data = peaks
+        clip._peak_cache = {}
+        clip._peak_pyramid = None
+        clip._body_cache = {}
+        clip.has_audio = True
+        self._clip_epoch += 1  # appearance changed; redraw strips
+        self._schedule_update()